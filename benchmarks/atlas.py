@@ -0,0 +1,43 @@
+"""Compare drawing 2000 sprites from 200 standalone textures against drawing them from a TextureAtlas."""
+import random
+import timeit
+
+import sdl2hl
+from sdl2hl.atlas import SpriteBatch, TextureAtlas
+
+
+IMAGES = 200
+SPRITES = 2000
+FRAMES = 20
+
+
+# The software renderer has no texture binds to save, so this mostly measures per-call overhead; a hardware renderer
+# additionally avoids a texture switch per copy.
+target = sdl2hl.Surface(1024, 768, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+
+surfaces = [sdl2hl.Surface(random.randint(8, 32), random.randint(8, 32), 32, sdl2hl.PixelFormat.argb8888)
+            for _ in range(IMAGES)]
+textures = [sdl2hl.Texture.from_surface(renderer, surface) for surface in surfaces]
+atlas = TextureAtlas(renderer)
+sprites = [atlas.add(surface) for surface in surfaces]
+
+draws = [(random.randrange(IMAGES), random.randrange(992), random.randrange(736)) for _ in range(SPRITES)]
+dest_rects = [sdl2hl.Rect(x, y, surfaces[i].w, surfaces[i].h) for i, x, y in draws]
+
+
+def standalone():
+    for (i, _, _), dest_rect in zip(draws, dest_rects):
+        renderer.copy(textures[i], dest_rect=dest_rect)
+
+def atlas_batch():
+    batch = SpriteBatch(renderer)
+    for i, x, y in draws:
+        batch.add(sprites[i], x, y)
+    batch.draw()
+
+
+print('atlas pages: %d' % len(atlas.pages))
+for name, fn in [('standalone', standalone), ('atlas batch', atlas_batch)]:
+    seconds = min(timeit.repeat(fn, number=FRAMES, repeat=3)) / FRAMES
+    print('%-12s %8.2f ms/frame  %8.0f sprites/s' % (name, seconds * 1000, SPRITES / seconds))
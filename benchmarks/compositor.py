@@ -0,0 +1,64 @@
+"""Compare repainting a mostly static 1920x1080 software rendered UI every frame with redrawing only what changed
+through a Compositor. The UI is a background image and a grid of 48 panels, two of which change every frame."""
+import os
+import timeit
+
+import sdl2hl
+from sdl2hl.compositor import Compositor
+
+
+W = 1920
+H = 1080
+FRAMES = 30
+
+
+target = sdl2hl.Surface(W, H, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+background = sdl2hl.Texture(renderer, sdl2hl.PixelFormat.argb8888, sdl2hl.TextureAccess.static, W, H)
+background.update(os.urandom(W * H * 4))
+compositor = Compositor(renderer, background=None)
+
+
+def draw_background(renderer, rect):
+    renderer.copy(background, rect, rect)
+
+def panel_drawer(panel):
+    def draw(renderer, rect):
+        renderer.draw_color = (40, 40, 60 + panel.value % 128, 255)
+        renderer.fill_rect(panel.layer.rect)
+        renderer.draw_color = (200, 200, 200, 255)
+        renderer.draw_rect(panel.layer.rect)
+    return draw
+
+
+class Panel(object):
+
+    def __init__(self, rect):
+        self.value = 0
+        self.layer = compositor.add_layer(panel_drawer(self), rect)
+
+
+compositor.add_layer(draw_background)
+panels = [Panel(sdl2hl.Rect(40 + column * 230, 40 + row * 170, 200, 140)) for row in range(6) for column in range(8)]
+compositor.compose()
+
+
+def change():
+    for panel in panels[:2]:
+        panel.value += 1
+        panel.layer.invalidate()
+
+def full():
+    change()
+    compositor.invalidate()
+    compositor.compose()
+
+def dirty():
+    change()
+    compositor.compose()
+
+
+print('%-8s %10s %16s' % ('redraw', 'frame (ms)', 'pixels / frame'))
+for name, fn in [('full', full), ('dirty', dirty)]:
+    seconds = min(timeit.repeat(fn, number=FRAMES, repeat=3)) / FRAMES
+    print('%-8s %10.2f %16d' % (name, seconds * 1000, compositor.pixels_touched))
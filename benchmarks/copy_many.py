@@ -0,0 +1,40 @@
+"""Compare Renderer.copy_many against a loop over Renderer.copy, using the software renderer."""
+import array
+import random
+import timeit
+
+import sdl2hl
+
+
+SPRITES = 5000
+FRAMES = 20
+
+
+target = sdl2hl.Surface(1024, 768, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+texture = sdl2hl.Texture.from_surface(renderer, sdl2hl.Surface(16, 16, 32, sdl2hl.PixelFormat.argb8888))
+
+positions = [(random.randrange(1008), random.randrange(752)) for _ in range(SPRITES)]
+source_rect = sdl2hl.Rect(0, 0, 16, 16)
+dest_rects = [sdl2hl.Rect(x, y, 16, 16) for x, y in positions]
+
+packed_source_rects = array.array('i', [0, 0, 16, 16] * SPRITES)
+packed_dest_rects = array.array('i')
+for x, y in positions:
+    packed_dest_rects.extend((x, y, 16, 16))
+
+
+def copy_loop():
+    for dest_rect in dest_rects:
+        renderer.copy(texture, source_rect, dest_rect)
+
+def copy_many_rects():
+    renderer.copy_many(texture, [source_rect] * SPRITES, dest_rects)
+
+def copy_many_packed():
+    renderer.copy_many(texture, packed_source_rects, packed_dest_rects)
+
+
+for name, fn in [('copy loop', copy_loop), ('copy_many (Rect)', copy_many_rects), ('copy_many (packed)', copy_many_packed)]:
+    seconds = min(timeit.repeat(fn, number=FRAMES, repeat=3)) / FRAMES
+    print('%-20s %8.2f ms/frame  %8.0f sprites/s' % (name, seconds * 1000, SPRITES / seconds))
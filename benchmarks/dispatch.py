@@ -0,0 +1,73 @@
+"""Time handling 100k queued events with an if/elif chain over poll() against a Dispatcher."""
+import timeit
+
+from sdl2._sdl2 import ffi, lib
+
+import sdl2hl
+
+
+EVENTS = 100000
+KEYS = [sdl2hl.KeyCode.left, sdl2hl.KeyCode.right, sdl2hl.KeyCode.up, sdl2hl.KeyCode.down]
+
+sdl2hl.init(sdl2hl.InitFlag.video)
+position = [0, 0]
+
+
+def push_events():
+    event = ffi.new('SDL_Event *')
+    for i in range(EVENTS):
+        if i % 5 == 4:
+            event.type = lib.SDL_MOUSEMOTION
+        else:
+            event.type = lib.SDL_KEYDOWN
+            event.key.keysym.sym = KEYS[i % len(KEYS)]
+        # The queue holds a limited number of events, so drain in between when it fills.
+        if lib.SDL_PushEvent(event) != 1:
+            return i
+    return EVENTS
+
+def chain():
+    for event in sdl2hl.events.poll():
+        if event.type == sdl2hl.EventType.keydown and event.keycode == sdl2hl.KeyCode.left:
+            position[0] -= 1
+        elif event.type == sdl2hl.EventType.keydown and event.keycode == sdl2hl.KeyCode.right:
+            position[0] += 1
+        elif event.type == sdl2hl.EventType.keydown and event.keycode == sdl2hl.KeyCode.up:
+            position[1] -= 1
+        elif event.type == sdl2hl.EventType.keydown and event.keycode == sdl2hl.KeyCode.down:
+            position[1] += 1
+
+dispatcher = sdl2hl.events.Dispatcher()
+
+@dispatcher.handler(sdl2hl.EventType.keydown, sdl2hl.KeyCode.left)
+def left(event):
+    position[0] -= 1
+
+@dispatcher.handler(sdl2hl.EventType.keydown, sdl2hl.KeyCode.right)
+def right(event):
+    position[0] += 1
+
+@dispatcher.handler(sdl2hl.EventType.keydown, sdl2hl.KeyCode.up)
+def up(event):
+    position[1] -= 1
+
+@dispatcher.handler(sdl2hl.EventType.keydown, sdl2hl.KeyCode.down)
+def down(event):
+    position[1] += 1
+
+
+def measure(handle):
+    handled = 0
+    elapsed = 0.0
+    while handled < EVENTS:
+        handled += push_events()
+        elapsed += timeit.timeit(handle, number=1)
+    return elapsed
+
+
+print('%-12s %10s' % ('method', 'time (s)'))
+print('%-12s %10.3f' % ('if/elif', measure(chain)))
+print('%-12s %10.3f' % ('dispatcher', measure(dispatcher.drain)))
+for handler, (calls, seconds) in sorted(dispatcher.stats.items(), key=lambda item: item[0].__name__):
+    print('  %-10s %8d calls %8.3f s' % (handler.__name__, calls, seconds))
+sdl2hl.quit()
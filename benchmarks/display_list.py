@@ -0,0 +1,64 @@
+"""Compare drawing a static HUD of 40 widgets (a panel, border, two bars and two icons from alternating textures each)
+by issuing every call from Python each frame, and by replaying a DisplayList with and without texture sorting."""
+import timeit
+
+import sdl2hl
+from sdl2hl.displaylist import DisplayList
+
+
+FRAMES = 100
+
+
+target = sdl2hl.Surface(1280, 720, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+icons = [sdl2hl.Texture(renderer, sdl2hl.PixelFormat.argb8888, sdl2hl.TextureAccess.static, 16, 16) for _ in range(2)]
+widgets = [sdl2hl.Rect(10 + i % 8 * 150, 10 + i // 8 * 100, 140, 90) for i in range(40)]
+
+
+def draw_hud(target):
+    for i, widget in enumerate(widgets):
+        target.draw_color = (30, 30, 40, 255)
+        target.fill_rect(widget)
+        target.draw_color = (200, 200, 200, 255)
+        target.draw_rect(widget)
+        target.draw_color = (200, 40, 40, 255)
+        target.fill_rect(sdl2hl.Rect(widget.x + 30, widget.y + 10, 100, 8))
+        target.draw_color = (40, 40, 200, 255)
+        target.fill_rect(sdl2hl.Rect(widget.x + 30, widget.y + 24, 100, 8))
+        target.copy(icons[i % 2], None, sdl2hl.Rect(widget.x + 6, widget.y + 6, 16, 16))
+        target.copy(icons[(i + 1) % 2], None, sdl2hl.Rect(widget.x + 6, widget.y + 24, 16, 16))
+
+
+# The widgets do not overlap, so the panels, bars and icons can each be drawn together without changing the result,
+# and the icon copies form one run which can be sorted by texture.
+def record(display_list):
+    panels = DisplayList()
+    for widget in widgets:
+        panels.draw_color = (30, 30, 40, 255)
+        panels.fill_rect(widget)
+        panels.draw_color = (200, 200, 200, 255)
+        panels.draw_rect(widget)
+    bars = DisplayList()
+    for widget in widgets:
+        bars.draw_color = (200, 40, 40, 255)
+        bars.fill_rect(sdl2hl.Rect(widget.x + 30, widget.y + 10, 100, 8))
+    for widget in widgets:
+        bars.draw_color = (40, 40, 200, 255)
+        bars.fill_rect(sdl2hl.Rect(widget.x + 30, widget.y + 24, 100, 8))
+    display_list.call(panels)
+    display_list.call(bars)
+    for i, widget in enumerate(widgets):
+        display_list.copy(icons[i % 2], None, sdl2hl.Rect(widget.x + 6, widget.y + 6, 16, 16))
+        display_list.copy(icons[(i + 1) % 2], None, sdl2hl.Rect(widget.x + 6, widget.y + 24, 16, 16))
+    return display_list
+
+display_list = record(DisplayList())
+sorted_list = record(DisplayList(sort_textures=True))
+
+
+print('%-14s %10s' % ('method', 'frame (ms)'))
+for name, fn in [('immediate', lambda: draw_hud(renderer)), ('display list', lambda: display_list.draw(renderer)),
+                 ('sorted list', lambda: sorted_list.draw(renderer))]:
+    fn()
+    seconds = min(timeit.repeat(fn, number=FRAMES, repeat=3)) / FRAMES
+    print('%-14s %10.3f' % (name, seconds * 1000))
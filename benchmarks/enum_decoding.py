@@ -0,0 +1,66 @@
+"""Time 1M reads of enum-valued event properties, decoding by enum construction, by lookup table, and as raw ints."""
+import timeit
+
+from sdl2._sdl2 import ffi, lib
+
+import sdl2hl
+from sdl2hl.events import Event
+
+
+READS = 1000000
+
+
+def make_event(fill):
+    ptr = ffi.new('SDL_Event *')
+    fill(ptr)
+    return Event._from_ptr(ptr)
+
+def fill_key(ptr):
+    ptr.type = lib.SDL_KEYDOWN
+    ptr.key.state = lib.SDL_PRESSED
+    ptr.key.keysym.scancode = sdl2hl.ScanCode.left
+    ptr.key.keysym.sym = sdl2hl.KeyCode.left
+    ptr.key.keysym.mod = sdl2hl.KeyMod.lshift | sdl2hl.KeyMod.lctrl
+
+def fill_axis(ptr):
+    ptr.type = lib.SDL_CONTROLLERAXISMOTION
+    ptr.caxis.axis = sdl2hl.ControllerAxis.leftx
+
+
+key = make_event(fill_key)
+axis = make_event(fill_axis)
+
+# The enum construction and mask scan each property performed before decoding tables were added.
+def uncached_items(enum, mask):
+    return {item for item in enum if item & mask}
+
+constructed = [
+    ('type', lambda: sdl2hl.EventType(key._ptr.common.type)),
+    ('scancode', lambda: sdl2hl.ScanCode(key._ptr.key.keysym.scancode)),
+    ('keycode', lambda: sdl2hl.KeyCode(key._ptr.key.keysym.sym)),
+    ('state', lambda: sdl2hl.KeyState(key._ptr.key.state)),
+    ('mod', lambda: uncached_items(sdl2hl.KeyMod, key._ptr.key.keysym.mod)),
+    ('axis', lambda: sdl2hl.ControllerAxis(axis._ptr.caxis.axis)),
+]
+table = [
+    ('type', lambda: key.type),
+    ('scancode', lambda: key.scancode),
+    ('keycode', lambda: key.keycode),
+    ('state', lambda: key.state),
+    ('mod', lambda: key.mod),
+    ('axis', lambda: axis.axis),
+]
+raw = [
+    ('type', lambda: key.raw_type),
+    ('scancode', lambda: key.raw_scancode),
+    ('keycode', lambda: key.raw_keycode),
+    ('state', lambda: key.raw_state),
+    ('mod', lambda: key.raw_mod),
+    ('axis', lambda: axis.raw_axis),
+]
+
+print('%-10s %14s %14s %14s' % ('property', 'construct (s)', 'table (s)', 'raw (s)'))
+for (name, before), (_, after), (_, plain) in zip(constructed, table, raw):
+    number = READS if name != 'mod' else READS // 10
+    times = [timeit.timeit(fn, number=number) * READS / number for fn in (before, after, plain)]
+    print('%-10s %14.2f %14.2f %14.2f' % ((name,) + tuple(times)))
@@ -0,0 +1,58 @@
+"""Compare memory and read throughput of 100k event views against 100k materialized event records."""
+import sys
+import timeit
+
+from sdl2._sdl2 import ffi, lib
+
+import sdl2hl
+from sdl2hl.events import Event
+
+
+EVENTS = 100000
+
+
+buffer = ffi.new('SDL_Event[]', EVENTS)
+for i in range(EVENTS):
+    if i % 2:
+        buffer[i].type = lib.SDL_MOUSEMOTION
+        buffer[i].motion.x = i % 640
+        buffer[i].motion.y = i % 480
+    else:
+        buffer[i].type = lib.SDL_KEYDOWN
+        buffer[i].key.keysym.scancode = sdl2hl.ScanCode.a
+        buffer[i].key.keysym.sym = sdl2hl.KeyCode.a
+
+
+def views():
+    return [Event._from_ptr(buffer + i, buffer) for i in range(EVENTS)]
+
+def records():
+    return [Event._from_ptr(buffer + i, materialize=True) for i in range(EVENTS)]
+
+def size(events):
+    # Views share the event buffer but each holds a cdata pointer; records hold their field values.
+    total = 0
+    for event in events:
+        total += sys.getsizeof(event)
+        if hasattr(event, '_ptr'):
+            total += sys.getsizeof(event._ptr)
+    return total
+
+def read(events):
+    total = 0
+    for event in events:
+        if event.raw_type == lib.SDL_MOUSEMOTION:
+            total += event.x + event.y
+        else:
+            total += event.raw_keycode
+    return total
+
+
+event_views = views()
+event_records = records()
+
+print('%-8s %12s %12s %12s' % ('kind', 'create (s)', 'read (s)', 'bytes'))
+for name, create, events in (('views', views, event_views), ('records', records, event_records)):
+    print('%-8s %12.3f %12.3f %12d' % (name, timeit.timeit(create, number=1),
+                                       timeit.timeit(lambda: read(events), number=1), size(events)))
+print('view buffer: %d bytes shared' % ffi.sizeof(buffer))
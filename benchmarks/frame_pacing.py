@@ -0,0 +1,40 @@
+"""Compare frame time jitter over 300 frames at 60 fps between plain delay and Clock's sleep-then-spin pacing."""
+import sdl2hl
+from sdl2hl.timer import Clock, delay, get_performance_counter, get_performance_frequency
+
+
+FRAMES = 300
+FRAME_RATE = 60
+
+
+def summarize(times):
+    times = sorted(times)
+    mean = sum(times) / len(times)
+    return mean, times[int(0.95 * len(times))], times[int(0.99 * len(times))]
+
+def delay_loop():
+    frequency = float(get_performance_frequency())
+    times = []
+    last = get_performance_counter()
+    for _ in range(FRAMES):
+        delay(1000 // FRAME_RATE)
+        now = get_performance_counter()
+        times.append((now - last) / frequency)
+        last = now
+    return summarize(times)
+
+def clock_loop():
+    clock = Clock(frame_rate=FRAME_RATE, window=FRAMES)
+    clock.tick()
+    for _ in range(FRAMES):
+        clock.tick()
+    stats = clock.stats()
+    return stats.mean, stats.p95, stats.p99
+
+
+sdl2hl.init(sdl2hl.InitFlag.timer)
+print('target frame time: %.3f ms' % (1000.0 / FRAME_RATE))
+print('%-8s %10s %10s %10s' % ('pacing', 'mean (ms)', 'p95 (ms)', 'p99 (ms)'))
+for name, loop in (('delay', delay_loop), ('clock', clock_loop)):
+    print('%-8s %10.3f %10.3f %10.3f' % ((name,) + tuple(t * 1000 for t in loop())))
+sdl2hl.quit()
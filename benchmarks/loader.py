@@ -0,0 +1,52 @@
+"""Compare the longest frame while streaming in 40 1024x1024 BMP textures synchronously and with an AssetLoader."""
+import os
+import tempfile
+import timeit
+
+import sdl2hl
+from sdl2hl.loader import AssetLoader
+
+
+IMAGES = 40
+
+
+directory = tempfile.mkdtemp()
+paths = [os.path.join(directory, '%d.bmp' % i) for i in range(IMAGES)]
+for path in paths:
+    sdl2hl.Surface(1024, 1024, 32, sdl2hl.PixelFormat.argb8888).save_bmp(path)
+
+target = sdl2hl.Surface(640, 480, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+
+
+def synchronous():
+    # Loads one image per frame, as a level streamer without a loader would.
+    frames = []
+    for path in paths:
+        start = timeit.default_timer()
+        sdl2hl.Texture.from_surface(renderer, sdl2hl.Surface.load_bmp(path))
+        renderer.clear()
+        frames.append(timeit.default_timer() - start)
+    return frames
+
+def asynchronous():
+    loader = AssetLoader(workers=4)
+    futures = [loader.load_texture(renderer, path) for path in paths]
+    frames = []
+    while not all(future.done() for future in futures):
+        start = timeit.default_timer()
+        loader.upload(budget_ms=2)
+        renderer.clear()
+        frames.append(timeit.default_timer() - start)
+    loader.shutdown()
+    return frames
+
+
+print('%-12s %8s %14s %14s' % ('method', 'frames', 'total (ms)', 'worst (ms)'))
+for name, fn in [('synchronous', synchronous), ('loader', asynchronous)]:
+    frames = fn()
+    print('%-12s %8d %14.1f %14.2f' % (name, len(frames), sum(frames) * 1000, max(frames) * 1000))
+
+for path in paths:
+    os.remove(path)
+os.rmdir(directory)
@@ -0,0 +1,49 @@
+"""Compare loading 2000 small images as loose BMP files against loading them from a pack, as BMPs or decoded pixels."""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import sdl2hl
+from sdl2hl.pack import Pack
+
+
+IMAGES = 2000
+
+
+directory = tempfile.mkdtemp()
+assets = os.path.join(directory, 'assets')
+os.mkdir(assets)
+paths = [os.path.join(assets, '%04d.bmp' % i) for i in range(IMAGES)]
+for path in paths:
+    sdl2hl.Surface(32, 32, 32, sdl2hl.PixelFormat.argb8888).save_bmp(path)
+
+makepack = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bin', 'makepack.py')
+bmp_pack = os.path.join(directory, 'bmp.pack')
+pixel_pack = os.path.join(directory, 'pixels.pack')
+subprocess.check_call([sys.executable, makepack, bmp_pack, assets, '--root', assets])
+subprocess.check_call([sys.executable, makepack, pixel_pack, assets, '--root', assets, '--decode'])
+names = [os.path.basename(path) for path in paths]
+
+target = sdl2hl.Surface(64, 64, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+
+
+def loose():
+    return [sdl2hl.Texture.from_surface(renderer, sdl2hl.Surface.load_bmp(path)) for path in paths]
+
+def packed(path):
+    def load():
+        pack = Pack(path)
+        return [pack.load_texture(renderer, name) for name in names]
+    return load
+
+
+print('%-16s %12s' % ('source', 'startup (ms)'))
+for name, fn in [('loose files', loose), ('pack (bmp)', packed(bmp_pack)), ('pack (pixels)', packed(pixel_pack))]:
+    seconds = min(timeit.repeat(fn, number=1, repeat=3))
+    print('%-16s %12.1f' % (name, seconds * 1000))
+
+shutil.rmtree(directory)
@@ -0,0 +1,45 @@
+"""Compare loading a 2048x2048 PNG of noise into a texture by decoding it, on a cold PixelCache, and on a warm one."""
+import os
+import shutil
+import tempfile
+import timeit
+
+from sdl2._sdl2 import ffi
+
+import sdl2hl
+from sdl2hl import image
+from sdl2hl.pixelcache import PixelCache
+
+
+SIZE = 2048
+
+
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, 'noise.png')
+noise = sdl2hl.Surface(SIZE, SIZE, 32, sdl2hl.PixelFormat.argb8888)
+ffi.buffer(noise._ptr.pixels, SIZE * noise._ptr.pitch)[:] = os.urandom(SIZE * noise._ptr.pitch)
+image.save(noise, path)
+
+target = sdl2hl.Surface(64, 64, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+cache = PixelCache(os.path.join(directory, 'cache'))
+
+
+def decode():
+    sdl2hl.Texture.from_surface(renderer, image.load(path))
+
+def cold():
+    cache.clear()
+    cache.load_texture(renderer, path)
+
+def warm():
+    cache.load_texture(renderer, path)
+
+
+print('%-8s %10s' % ('load', 'time (ms)'))
+for name, fn in [('decode', decode), ('cold', cold), ('warm', warm)]:
+    seconds = min(timeit.repeat(fn, number=1, repeat=3))
+    print('%-8s %10.1f' % (name, seconds * 1000))
+print('hits: %d  misses: %d' % (cache.hits, cache.misses))
+
+shutil.rmtree(directory)
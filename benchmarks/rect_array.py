@@ -0,0 +1,45 @@
+"""Compare the batched RectArray geometry methods against calling the Rect methods on each item.
+
+The batched methods use NumPy when it is installed; pass --no-numpy to time the pure Python fallback instead.
+"""
+import random
+import sys
+import timeit
+
+import sdl2hl
+import sdl2hl.rect
+
+
+COUNT = 100000
+
+if '--no-numpy' in sys.argv:
+    sdl2hl.rect._numpy_module[:] = [None]
+
+
+def make_rects(count):
+    return sdl2hl.RectArray([(random.randrange(-500, 500), random.randrange(-500, 500),
+                              random.randrange(-4, 64), random.randrange(-4, 64)) for _ in range(count)])
+
+
+def per_item_translate(rects):
+    for r in rects:
+        r.x += 1
+        r.y += 1
+
+
+random.seed(COUNT)
+rects = make_rects(COUNT)
+others = make_rects(COUNT)
+items = list(rects)
+other_items = list(others)
+# Import NumPy, if it is used, before timing.
+rects[:1].has_intersection(others[:1])
+
+print('%-18s %12s %12s' % ('operation', 'per item ms', 'batched ms'))
+for name in ('has_intersection', 'intersect', 'union'):
+    per_item = timeit.timeit(lambda: [getattr(a, name)(b) for a, b in zip(items, other_items)], number=1)
+    batched = timeit.timeit(lambda: getattr(rects, name)(others), number=1)
+    print('%-18s %12.1f %12.1f' % (name, per_item * 1000, batched * 1000))
+per_item = timeit.timeit(lambda: per_item_translate(items), number=1)
+batched = timeit.timeit(lambda: rects.translate(1, 1), number=1)
+print('%-18s %12.1f %12.1f' % ('translate', per_item * 1000, batched * 1000))
@@ -0,0 +1,31 @@
+"""Compare drawing 2000 small rects per frame, setting the draw color and blend mode before each one as immediate mode
+UI code tends to, with and without Renderer.cache_state. Most of the colors repeat, so most of the calls are elided."""
+import timeit
+
+import sdl2hl
+
+
+FRAMES = 20
+
+
+target = sdl2hl.Surface(640, 480, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+colors = [(255, 0, 0, 255)] * 15 + [(0, 255, 0, 255)]
+rects = [sdl2hl.Rect(i % 40 * 16, i // 40 * 9, 4, 4) for i in range(2000)]
+
+
+def frame():
+    for i, rect in enumerate(rects):
+        renderer.draw_color = colors[i % len(colors)]
+        renderer.blend_mode = sdl2hl.BlendMode.none
+        if renderer.draw_color[3] == 255:
+            renderer.fill_rect(rect)
+
+
+print('%-10s %10s %14s' % ('cache', 'frame (ms)', 'elided calls'))
+for cache_state in (False, True):
+    renderer.cache_state = cache_state
+    frame()
+    elided_calls = renderer.elided_calls
+    seconds = min(timeit.repeat(frame, number=FRAMES, repeat=3)) / FRAMES
+    print('%-10s %10.2f %14d' % (cache_state, seconds * 1000, (renderer.elided_calls - elided_calls) // (3 * FRAMES)))
@@ -0,0 +1,73 @@
+"""Compare the spatial indexes in sdl2hl.spatial against a naive Rect.has_intersection loop.
+
+The naive all-pairs loop would take hours at the larger sizes, so its time is estimated from a sample of rows.
+"""
+import random
+import timeit
+
+import sdl2hl
+from sdl2hl.spatial import SpatialHash, AABBTree
+
+
+SIZES = [1000, 10000, 100000]
+QUERIES = 1000
+NAIVE_SAMPLE_ROWS = 100
+
+
+def make_rects(count):
+    # Keep the density constant, so the number of overlapping pairs grows linearly with count.
+    world = int((count * 1600) ** 0.5)
+    return sdl2hl.RectArray([(random.randrange(world), random.randrange(world),
+                              random.randrange(4, 32), random.randrange(4, 32)) for _ in range(count)])
+
+
+def naive_pairs_time(rects):
+    rows = min(len(rects), NAIVE_SAMPLE_ROWS)
+    items = list(rects)
+
+    def sample():
+        for a in items[:rows]:
+            for b in items:
+                a.has_intersection(b)
+
+    seconds = timeit.timeit(sample, number=1)
+    # Each row of the sample tests against every rect, and a full run tests each pair once.
+    return seconds * (len(items) / 2.0) / rows
+
+
+def time_index(cls, rects, queries):
+    start = timeit.default_timer()
+    index = cls.from_rect_array(rects)
+    build = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    pair_count = len(index.pairs())
+    pairs = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    for query in queries:
+        index.query(query)
+    query = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    for key in range(0, len(rects), 10):
+        x, y, w, h = index.bounds(key)
+        index.move(key, (x + 5, y + 5, w, h))
+    move = timeit.default_timer() - start
+
+    return build, pairs, query, move, pair_count
+
+
+print('%8s %-12s %10s %10s %10s %10s %8s' % ('rects', 'method', 'build ms', 'pairs ms', 'query ms', 'move ms', 'pairs'))
+for size in SIZES:
+    random.seed(size)
+    rects = make_rects(size)
+    queries = [sdl2hl.Rect(q.x, q.y, 64, 64) for q in rects[:QUERIES]]
+
+    naive = naive_pairs_time(rects)
+    print('%8d %-12s %10s %10.1f %10s %10s %8s' % (size, 'naive (est.)', '-', naive * 1000, '-', '-', '-'))
+
+    for cls in (SpatialHash, AABBTree):
+        build, pairs, query, move, pair_count = time_index(cls, rects, queries)
+        print('%8d %-12s %10.1f %10.1f %10.1f %10.1f %8d' % (size, cls.__name__, build * 1000, pairs * 1000,
+                                                         query * 1000, move * 1000, pair_count))
@@ -0,0 +1,30 @@
+"""Compare inverting the colour channels of a 512x512 surface pixel by pixel through Surface.pixels, and vectorized
+through Surface.as_array. NumPy must be installed."""
+import timeit
+
+import sdl2hl
+
+
+SIZE = 512
+
+
+surface = sdl2hl.Surface(SIZE, SIZE, 32, sdl2hl.PixelFormat.argb8888)
+
+
+def per_pixel():
+    pixels = surface.pixels
+    data = bytearray(pixels)
+    for i in range(len(data)):
+        # The alpha channel of argb8888 is the last byte of each pixel in little endian memory order.
+        if i % 4 != 3:
+            data[i] = 255 - data[i]
+    pixels[:] = bytes(data)
+
+def vectorized():
+    colors = surface.as_array()[:, :, :3]
+    colors ^= 0xFF
+
+
+print('%-12s %10s' % ('method', 'time (ms)'))
+for name, fn in [('per pixel', per_pixel), ('vectorized', vectorized)]:
+    print('%-12s %10.2f' % (name, min(timeit.repeat(fn, number=1, repeat=3)) * 1000))
@@ -0,0 +1,37 @@
+"""Compare drawing a changing HUD line by rendering a new surface and texture each frame against a GlyphCache.
+
+Usage: python text.py path/to/font.ttf
+"""
+import sys
+import timeit
+
+import sdl2hl
+from sdl2hl import ttf
+from sdl2hl.text import GlyphCache
+
+
+FRAMES = 500
+
+
+ttf.init()
+font = ttf.Font.from_path(sys.argv[1], 18)
+target = sdl2hl.Surface(800, 600, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+cache = GlyphCache(renderer)
+lines = ['Score: %06d  Lives: %d  Time: %05.1f' % (i * 10, 3, i / 60.0) for i in range(FRAMES)]
+
+
+def render_surfaces():
+    for line in lines:
+        surface = font.render_blended(line, (255, 255, 255, 255))
+        texture = sdl2hl.Texture.from_surface(renderer, surface)
+        renderer.copy(texture, dest_rect=sdl2hl.Rect(10, 10, surface.w, surface.h))
+
+def glyph_cache():
+    for line in lines:
+        cache.draw_text(font, line, 10, 10)
+
+
+for name, fn in [('render + texture', render_surfaces), ('glyph cache', glyph_cache)]:
+    seconds = min(timeit.repeat(fn, number=1, repeat=3)) / FRAMES
+    print('%-18s %8.3f ms/frame' % (name, seconds * 1000))
@@ -0,0 +1,41 @@
+"""Compare drawing 20 recurring menu labels by rendering a texture each time against a TextTextureCache.
+
+Usage: python text_textures.py path/to/font.ttf
+"""
+import random
+import sys
+import timeit
+
+import sdl2hl
+from sdl2hl import ttf
+from sdl2hl.text import TextTextureCache
+
+
+DRAWS = 5000
+WHITE = (255, 255, 255, 255)
+
+
+ttf.init()
+font = ttf.Font.from_path(sys.argv[1], 18)
+target = sdl2hl.Surface(800, 600, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+cache = TextTextureCache(renderer)
+labels = ['Menu item %d' % i for i in range(20)]
+draws = [random.choice(labels) for _ in range(DRAWS)]
+
+
+def render_each_time():
+    for label in draws:
+        surface = font.render_blended(label, WHITE)
+        texture = sdl2hl.Texture.from_surface(renderer, surface)
+        renderer.copy(texture, dest_rect=sdl2hl.Rect(10, 10, surface.w, surface.h))
+
+def texture_cache():
+    for label in draws:
+        cache.draw(font, label, 10, 10, WHITE)
+
+
+for name, fn in [('render each time', render_each_time), ('texture cache', texture_cache)]:
+    seconds = min(timeit.repeat(fn, number=1, repeat=3)) / DRAWS
+    print('%-18s %8.1f us/label' % (name, seconds * 1000000))
+print('hits: %d  misses: %d  evictions: %d  bytes: %d' % (cache.hits, cache.misses, cache.evictions, cache.size))
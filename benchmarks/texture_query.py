@@ -0,0 +1,20 @@
+"""Time reading the attributes of a renderer and a texture, as sprite layout and atlas code does every frame."""
+import timeit
+
+import sdl2hl
+
+
+N = 100000
+
+
+target = sdl2hl.Surface(64, 64, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+texture = sdl2hl.Texture(renderer, sdl2hl.PixelFormat.argb8888, sdl2hl.TextureAccess.static, 32, 32)
+
+
+print('%-26s %10s' % ('read', 'time (us)'))
+for name, fn in [('texture.w, texture.h', lambda: (texture.w, texture.h)),
+                 ('texture.query()', texture.query),
+                 ('renderer.max_texture_width', lambda: renderer.max_texture_width),
+                 ('renderer.texture_formats', lambda: renderer.texture_formats)]:
+    print('%-26s %10.3f' % (name, min(timeit.repeat(fn, number=N, repeat=3)) / N * 1e6))
@@ -0,0 +1,40 @@
+"""Compare ways of getting a new 1920x1080 frame of pixels onto the screen every frame: creating a texture from a
+surface, updating a streaming texture from bytes, and writing into a locked streaming texture."""
+import os
+import timeit
+
+from sdl2._sdl2 import ffi
+
+import sdl2hl
+
+
+W = 1920
+H = 1080
+FRAMES = 30
+
+
+frame = os.urandom(W * H * 4)
+target = sdl2hl.Surface(W, H, 32, sdl2hl.PixelFormat.argb8888)
+renderer = sdl2hl.Renderer.create_software_renderer(target)
+streaming = sdl2hl.Texture(renderer, sdl2hl.PixelFormat.argb8888, sdl2hl.TextureAccess.streaming, W, H)
+surface = sdl2hl.Surface(W, H, 32, sdl2hl.PixelFormat.argb8888)
+
+
+def from_surface():
+    ffi.buffer(surface._ptr.pixels, H * surface._ptr.pitch)[:] = frame
+    renderer.copy(sdl2hl.Texture.from_surface(renderer, surface))
+
+def update():
+    streaming.update(frame)
+    renderer.copy(streaming)
+
+def lock():
+    with streaming.lock() as (pixels, pitch):
+        pixels[:] = frame
+    renderer.copy(streaming)
+
+
+print('%-12s %10s' % ('path', 'frame (ms)'))
+for name, fn in [('from_surface', from_surface), ('update', update), ('lock', lock)]:
+    fn()
+    print('%-12s %10.2f' % (name, min(timeit.repeat(fn, number=FRAMES, repeat=3)) / FRAMES * 1000))
@@ -0,0 +1,35 @@
+"""Compare rendering a 256x256 map of 8x8 tiles onto a surface with one Surface.blit per tile, with
+Surface.blit_tiles, and with Surface.blit_tiles through a 640x360 view of the map."""
+import random
+import timeit
+
+import sdl2hl
+
+
+MAP_SIZE = 256
+TILE = 8
+
+
+tileset = sdl2hl.Surface(16 * TILE, 16 * TILE, 32, sdl2hl.PixelFormat.argb8888)
+random.seed(0)
+tiles = [[random.randrange(256) for column in range(MAP_SIZE)] for row in range(MAP_SIZE)]
+target = sdl2hl.Surface(MAP_SIZE * TILE, MAP_SIZE * TILE, 32, sdl2hl.PixelFormat.argb8888)
+view = sdl2hl.Surface(640, 360, 32, sdl2hl.PixelFormat.argb8888)
+
+
+def blit():
+    for row, tile_row in enumerate(tiles):
+        for column, index in enumerate(tile_row):
+            tileset.blit(sdl2hl.Rect(index % 16 * TILE, index // 16 * TILE, TILE, TILE), target,
+                         sdl2hl.Rect(column * TILE, row * TILE, TILE, TILE))
+
+def blit_tiles():
+    target.blit_tiles(tileset, tiles, TILE, TILE)
+
+def blit_tiles_view():
+    view.blit_tiles(tileset, tiles, TILE, TILE, -1000, -700)
+
+
+print('%-16s %10s' % ('method', 'time (ms)'))
+for name, fn in [('blit', blit), ('blit_tiles', blit_tiles), ('blit_tiles view', blit_tiles_view)]:
+    print('%-16s %10.2f' % (name, min(timeit.repeat(fn, number=1, repeat=3)) * 1000))
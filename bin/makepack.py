@@ -0,0 +1,47 @@
+#!/bin/env python
+
+import argparse
+import os
+
+import sdl2hl
+from sdl2hl import image, pack
+
+
+KINDS = {
+    '.bmp': pack.BMP,
+    '.png': pack.IMAGE, '.jpg': pack.IMAGE, '.jpeg': pack.IMAGE, '.gif': pack.IMAGE, '.tga': pack.IMAGE,
+    '.tif': pack.IMAGE, '.tiff': pack.IMAGE, '.webp': pack.IMAGE,
+    '.wav': pack.AUDIO, '.ogg': pack.AUDIO, '.mp3': pack.AUDIO, '.flac': pack.AUDIO, '.mod': pack.AUDIO,
+    '.ttf': pack.FONT, '.otf': pack.FONT, '.fon': pack.FONT,
+}
+
+
+def make_pack(output, paths, root='.', decode=False, fmt=sdl2hl.PixelFormat.argb8888):
+    """Write the files at paths into a pack named by their paths relative to root, decoding images if decode is set."""
+    with pack.PackWriter(output) as writer:
+        for path in paths:
+            name = os.path.relpath(path, root).replace(os.sep, '/')
+            kind = KINDS.get(os.path.splitext(path)[1].lower(), pack.RAW)
+            if decode and kind in (pack.BMP, pack.IMAGE):
+                writer.add_pixels(name, image.load(path).convert(fmt))
+            else:
+                with open(path, 'rb') as f:
+                    writer.add(name, f.read(), kind)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build a pack file of assets for sdl2hl.pack.Pack.')
+    parser.add_argument('output', help='the pack file to write')
+    parser.add_argument('paths', nargs='+', help='the files to add, or directories to add every file in')
+    parser.add_argument('--root', default='.', help='the directory asset names are relative to')
+    parser.add_argument('--decode', action='store_true', help='store images as decoded ARGB8888 pixels')
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            for directory, _, names in os.walk(path):
+                files.extend(os.path.join(directory, name) for name in sorted(names))
+        else:
+            files.append(path)
+    make_pack(args.output, files, args.root, args.decode)
@@ -10,20 +10,33 @@ sdl2hl.init()
 window = sdl2hl.Window()
 renderer = sdl2hl.Renderer(window)
 avatar = sdl2hl.Rect(w=64, h=64)
+dispatcher = sdl2hl.events.Dispatcher()
+
+
+@dispatcher.handler(sdl2hl.EventType.quit)
+def quit(event):
+    sdl2hl.quit()
+    sys.exit()
+
+@dispatcher.handler(sdl2hl.EventType.keydown, sdl2hl.KeyCode.left)
+def move_left(event):
+    avatar.x -= 1
+
+@dispatcher.handler(sdl2hl.EventType.keydown, sdl2hl.KeyCode.right)
+def move_right(event):
+    avatar.x += 1
+
+@dispatcher.handler(sdl2hl.EventType.keydown, sdl2hl.KeyCode.up)
+def move_up(event):
+    avatar.y -= 1
+
+@dispatcher.handler(sdl2hl.EventType.keydown, sdl2hl.KeyCode.down)
+def move_down(event):
+    avatar.y += 1
+
 
 while True:
-    for event in sdl2hl.events.poll():
-        if event.type == sdl2hl.QUIT:
-            sdl2hl.quit()
-            sys.exit()
-        elif event.type == sdl2hl.EventType.keydown and event.keycode == sdl2hl.KeyCode.left:
-            avatar.x -= 1
-        elif event.type == sdl2hl.EventType.keydown and event.keycode == sdl2hl.KeyCode.right:
-            avatar.x += 1
-        elif event.type == sdl2hl.EventType.keydown and event.keycode == sdl2hl.KeyCode.up:
-            avatar.y -= 1
-        elif event.type == sdl2hl.EventType.keydown and event.keycode == sdl2hl.KeyCode.down:
-            avatar.y += 1
+    dispatcher.drain()
 
     renderer.draw_color = BACKGROUND_COLOR
     renderer.clear()
@@ -31,4 +44,3 @@ while True:
     renderer.fill_rect(avatar)
 
     renderer.present()
-
@@ -12,3 +12,8 @@ from error import SDLError
 from gamecontroller import *
 import image
 import mixer
+import spatial
+import atlas
+from rwops import RWops
+import compositor
+import displaylist
@@ -0,0 +1,315 @@
+import array
+
+from pixels import PixelFormat
+from rect import Rect
+from renderer import BlendMode, Texture, TextureAccess
+
+
+class SkylinePacker(object):
+    """Packs rectangles into a fixed area using the skyline bottom-left heuristic.
+
+    The packer tracks the top edge of the packed rectangles as a list of horizontal segments, and places each new
+    rectangle where its bottom edge would be lowest.
+    """
+
+    def __init__(self, w, h):
+        """Create an empty SkylinePacker.
+
+        Args:
+            w (int): The width of the area to pack into.
+            h (int): The height of the area to pack into.
+        """
+        self._w = w
+        self._h = h
+        self._skyline = [[0, 0, w]]
+        self._used = 0
+
+    @property
+    def w(self):
+        """int: The width of the area to pack into."""
+        return self._w
+
+    @property
+    def h(self):
+        """int: The height of the area to pack into."""
+        return self._h
+
+    @property
+    def occupancy(self):
+        """float: The fraction of the area covered by packed rectangles."""
+        return float(self._used) / (self._w * self._h)
+
+    def _fit(self, index, w, h):
+        skyline = self._skyline
+        x = skyline[index][0]
+        if x + w > self._w:
+            return None
+        y = 0
+        remaining = w
+        while remaining > 0:
+            _, segment_y, segment_w = skyline[index]
+            y = max(y, segment_y)
+            if y + h > self._h:
+                return None
+            remaining -= segment_w
+            index += 1
+        return y
+
+    def insert(self, w, h):
+        """Find space for a rectangle and mark it as used.
+
+        Args:
+            w (int): The width of the rectangle.
+            h (int): The height of the rectangle.
+
+        Returns:
+            Optional[Tuple[int, int]]: The position of the rectangle's top left corner, or None if it does not fit.
+        """
+        skyline = self._skyline
+        best = None
+        for i, (x, _, segment_w) in enumerate(skyline):
+            y = self._fit(i, w, h)
+            if y is not None and (best is None or y + h < best[0] or (y + h == best[0] and segment_w < best[1])):
+                best = (y + h, segment_w, i, x, y)
+        if best is None:
+            return None
+
+        _, _, index, x, y = best
+        skyline.insert(index, [x, y + h, w])
+        right = x + w
+        i = index + 1
+        while i < len(skyline) and skyline[i][0] < right:
+            segment = skyline[i]
+            shrink = right - segment[0]
+            if shrink < segment[2]:
+                segment[0] += shrink
+                segment[2] -= shrink
+                break
+            del skyline[i]
+
+        i = 0
+        while i < len(skyline) - 1:
+            if skyline[i][1] == skyline[i + 1][1]:
+                skyline[i][2] += skyline[i + 1][2]
+                del skyline[i + 1]
+            else:
+                i += 1
+
+        self._used += w * h
+        return x, y
+
+    def reset(self):
+        """Mark the whole area as free."""
+        self._skyline = [[0, 0, self._w]]
+        self._used = 0
+
+
+class _Page(object):
+
+    __slots__ = ('texture', 'packer', 'sprites')
+
+    def __init__(self, texture, packer):
+        self.texture = texture
+        self.packer = packer
+        self.sprites = []
+
+
+class Sprite(object):
+    """A handle to an image packed into a TextureAtlas.
+
+    The handle stays valid when the atlas is repacked; its texture and source_rect are updated in place.
+    """
+
+    __slots__ = ('_page', '_surface', 'source_rect')
+
+    @property
+    def texture(self):
+        """Texture: The atlas page containing the image."""
+        return self._page.texture
+
+    @property
+    def w(self):
+        """int: The width of the image in pixels."""
+        return self.source_rect.w
+
+    @property
+    def h(self):
+        """int: The height of the image in pixels."""
+        return self.source_rect.h
+
+
+class TextureAtlas(object):
+    """Packs many surfaces into a few large textures, so they can be drawn without switching textures.
+
+    Surfaces are converted to the atlas format and kept, so that the atlas can be repacked after sprites have been
+    removed or to pack them more tightly.
+    """
+
+    def __init__(self, renderer, page_size=2048, padding=1, fmt=PixelFormat.argb8888):
+        """Create an empty TextureAtlas.
+
+        Args:
+            renderer (Renderer): The renderer the page textures are created for.
+            page_size (int): The width and height of each page, clamped to the renderer's maximum texture size.
+            padding (int): The number of pixels left empty between images.
+            fmt (PixelFormat): The pixel format of the pages.
+        """
+        self._renderer = renderer
+        max_w = renderer.max_texture_width
+        max_h = renderer.max_texture_height
+        # A maximum size of 0 means the renderer has no limit.
+        self._page_w = min(page_size, max_w) if max_w else page_size
+        self._page_h = min(page_size, max_h) if max_h else page_size
+        self._padding = padding
+        self._format = fmt
+        self._pages = []
+        self._removed = 0
+
+    @property
+    def pages(self):
+        """List[Texture]: The textures the images are packed into."""
+        return [page.texture for page in self._pages]
+
+    @property
+    def sprites(self):
+        """List[Sprite]: Every image in the atlas."""
+        return [sprite for page in self._pages for sprite in page.sprites]
+
+    def _new_page(self, texture=None):
+        if texture is None:
+            texture = Texture(self._renderer, self._format, TextureAccess.static, self._page_w, self._page_h)
+            texture.blend_mode = BlendMode.blend
+        page = _Page(texture, SkylinePacker(self._page_w, self._page_h))
+        self._pages.append(page)
+        return page
+
+    def _place(self, page, sprite):
+        surface = sprite._surface
+        w = surface.w
+        h = surface.h
+        position = page.packer.insert(w + self._padding, h + self._padding)
+        if position is None:
+            return False
+        sprite._page = page
+        sprite.source_rect.x, sprite.source_rect.y = position
+        page.sprites.append(sprite)
+        page.texture.update(surface.pixels, sprite.source_rect, surface.pitch)
+        return True
+
+    def add(self, surface):
+        """Copy a surface into the atlas.
+
+        Space left by removed sprites is reclaimed by repacking when no page has room for the surface; otherwise a
+        new page is created.
+
+        Args:
+            surface (Surface): The image to add.
+
+        Returns:
+            Sprite: A handle to the packed image.
+
+        Raises:
+            ValueError: If the surface is larger than a page.
+            SDLError: If the surface cannot be converted, or a page cannot be created or updated.
+        """
+        if surface.w + self._padding > self._page_w or surface.h + self._padding > self._page_h:
+            raise ValueError('surface does not fit in a {}x{} atlas page'.format(self._page_w, self._page_h))
+
+        sprite = Sprite()
+        sprite._surface = surface.convert(self._format)
+        sprite.source_rect = Rect(0, 0, surface.w, surface.h)
+
+        for page in self._pages:
+            if self._place(page, sprite):
+                return sprite
+        if self._removed:
+            self._repack(self.sprites + [sprite])
+        else:
+            self._place(self._new_page(), sprite)
+        return sprite
+
+    def remove(self, sprite):
+        """Remove an image from the atlas. Its space is reclaimed the next time the atlas is repacked.
+
+        Args:
+            sprite (Sprite): The image to remove.
+
+        Raises:
+            ValueError: If the sprite is not in the atlas.
+        """
+        sprite._page.sprites.remove(sprite)
+        self._removed += 1
+
+    def repack(self):
+        """Pack every image again from scratch, tallest first, and free any pages left empty.
+
+        Raises:
+            SDLError: If a page cannot be created or updated.
+        """
+        self._repack(self.sprites)
+
+    def _repack(self, sprites):
+        textures = [page.texture for page in self._pages]
+        self._pages = []
+        self._removed = 0
+        for sprite in sorted(sprites, key=lambda sprite: (sprite.h, sprite.w), reverse=True):
+            for page in self._pages:
+                if self._place(page, sprite):
+                    break
+            else:
+                self._place(self._new_page(textures.pop(0) if textures else None), sprite)
+
+
+class SpriteBatch(object):
+    """Collects sprite draws and issues them with one Renderer.copy_many call per run of sprites on the same page.
+
+    Draw order is preserved: a new run starts whenever a sprite is on a different page than the previous one.
+    """
+
+    def __init__(self, renderer):
+        """Create an empty SpriteBatch.
+
+        Args:
+            renderer (Renderer): The renderer to draw with.
+        """
+        self._renderer = renderer
+        self._runs = []
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def add(self, sprite, x, y, w=None, h=None):
+        """Queue a sprite to be drawn.
+
+        Args:
+            sprite (Sprite): The sprite to draw.
+            x (int): The x coordinate of the destination.
+            y (int): The y coordinate of the destination.
+            w (Optional[int]): The width of the destination, or None for the sprite's width.
+            h (Optional[int]): The height of the destination, or None for the sprite's height.
+        """
+        texture = sprite._page.texture
+        runs = self._runs
+        if not runs or runs[-1][0] is not texture:
+            runs.append((texture, array.array('i'), array.array('i')))
+        _, source_rects, dest_rects = runs[-1]
+        source_rect = sprite.source_rect._ptr
+        source_rects.extend((source_rect.x, source_rect.y, source_rect.w, source_rect.h))
+        dest_rects.extend((x, y, source_rect.w if w is None else w, source_rect.h if h is None else h))
+        self._count += 1
+
+    def draw(self):
+        """Draw every queued sprite.
+
+        Raises:
+            SDLError: If an error is encountered.
+        """
+        copy_many = self._renderer.copy_many
+        for texture, source_rects, dest_rects in self._runs:
+            copy_many(texture, source_rects, dest_rects)
+
+    def clear(self):
+        """Remove every queued sprite."""
+        self._runs = []
+        self._count = 0
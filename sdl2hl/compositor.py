@@ -0,0 +1,232 @@
+from rect import Rect
+
+
+class Layer(object):
+    """A part of a scene, drawn by a callback, which the Compositor redraws only where it has changed."""
+
+    def __init__(self, compositor, draw, rect):
+        self._compositor = compositor
+        self._draw = draw
+        self._rect = rect
+        self._visible = True
+
+    @property
+    def rect(self):
+        """Rect: The area the layer draws in, or None if it may draw anywhere.
+
+        Moving the layer invalidates both the area it left and the area it moved to.
+        """
+        return self._rect
+
+    @rect.setter
+    def rect(self, rect):
+        self.invalidate()
+        self._rect = rect
+        self.invalidate()
+
+    @property
+    def visible(self):
+        """bool: Whether the layer is drawn. Showing or hiding it invalidates its area."""
+        return self._visible
+
+    @visible.setter
+    def visible(self, visible):
+        if visible != self._visible:
+            self._visible = visible
+            self._compositor.invalidate(self._rect)
+
+    def invalidate(self, rect=None):
+        """Mark part of the layer as changed, so it is redrawn by the next call to Compositor.compose.
+
+        Args:
+            rect (Rect): The area that changed, or None for the layer's entire area.
+        """
+        if rect is None:
+            rect = self._rect
+        elif self._rect is not None:
+            rect = rect.intersect(self._rect)
+            if rect is None:
+                return
+        self._compositor.invalidate(rect)
+
+
+class Compositor(object):
+    """Redraws only the parts of a software rendered scene which changed since the last frame.
+
+    The scene is a stack of layers, drawn bottom to top. Changes are recorded as dirty rectangles, and overlapping
+    rectangles are merged so no pixel is drawn twice. On each frame, every layer overlapping a dirty rectangle is
+    drawn with the renderer's clip rect set to it, so pixels outside the dirty rectangles are left untouched.
+
+    If the renderer draws to a window's surface, only the dirty rectangles are copied to the screen.
+    """
+
+    def __init__(self, renderer, window=None, background=(0, 0, 0, 255), max_rects=32):
+        """Create a Compositor with no layers. The first frame redraws the whole output.
+
+        Args:
+            renderer (Renderer): The renderer to draw with, usually a software renderer.
+            window (Window): The window whose surface the renderer draws to, or None to present with the renderer.
+            background (Tuple[int, int, int, int]): The color dirty rectangles are filled with before the layers are
+                                                    drawn, or None to leave them for the layers to fill.
+            max_rects (int): The most dirty rectangles to draw separately. When there are more, they are replaced by
+                             the rectangle enclosing all of them.
+        """
+        self._renderer = renderer
+        self._window = window
+        self._background = background
+        self._max_rects = max_rects
+        self._layers = []
+        w, h = renderer.output_size
+        self._bounds = Rect(0, 0, w, h)
+        self._dirty = [Rect(0, 0, w, h)]
+        self._dirty_rects = []
+        self._pixels_touched = 0
+        self._total_pixels_touched = 0
+        self._frames = 0
+
+    @property
+    def layers(self):
+        """List[Layer]: The layers, from bottom to top."""
+        return list(self._layers)
+
+    @property
+    def dirty_rects(self):
+        """List[Rect]: The areas redrawn by the last frame."""
+        return list(self._dirty_rects)
+
+    @property
+    def pixels_touched(self):
+        """int: The number of pixels redrawn by the last frame."""
+        return self._pixels_touched
+
+    @property
+    def coverage(self):
+        """float: The fraction of the output redrawn by the last frame, or 0.0 if the output is empty."""
+        area = self._bounds.w * self._bounds.h
+        if not area:
+            return 0.0
+        return float(self._pixels_touched) / area
+
+    @property
+    def frames(self):
+        """int: The number of frames composed."""
+        return self._frames
+
+    @property
+    def total_pixels_touched(self):
+        """int: The number of pixels redrawn by every frame."""
+        return self._total_pixels_touched
+
+    def add_layer(self, draw, rect=None):
+        """Add a layer on top of the existing ones.
+
+        Args:
+            draw (Callable[[Renderer, Rect], None]): Draws the layer, given the renderer and the dirty rectangle being
+                                                     redrawn. Drawing outside the rectangle is clipped, so drawing the
+                                                     whole layer is always correct; the rectangle allows skipping parts
+                                                     of it.
+            rect (Rect): The area the layer draws in, or None if it may draw anywhere.
+
+        Returns:
+            Layer: The new layer.
+        """
+        layer = Layer(self, draw, rect)
+        self._layers.append(layer)
+        self.invalidate(rect)
+        return layer
+
+    def remove_layer(self, layer):
+        """Remove a layer, invalidating its area.
+
+        Args:
+            layer (Layer): The layer to remove.
+
+        Raises:
+            ValueError: If the layer is not in the compositor.
+        """
+        self._layers.remove(layer)
+        self.invalidate(layer.rect)
+
+    def invalidate(self, rect=None):
+        """Mark an area as changed, so it is redrawn by the next frame.
+
+        Args:
+            rect (Rect): The area that changed, or None for the whole output.
+        """
+        rect = self._bounds.intersect(self._bounds if rect is None else rect)
+        if rect is None:
+            return
+        dirty = self._dirty
+        i = 0
+        while i < len(dirty):
+            if rect.has_intersection(dirty[i]):
+                # The union may now overlap rectangles which were already checked, so check them all again.
+                rect = rect.union(dirty.pop(i))
+                i = 0
+            else:
+                i += 1
+        dirty.append(rect)
+        if len(dirty) > self._max_rects:
+            enclosing = dirty[0]
+            for other in dirty:
+                enclosing = enclosing.union(other)
+            self._dirty = [enclosing]
+
+    def resize(self, w, h):
+        """Set the size of the output, and invalidate all of it.
+
+        compose calls this itself when the renderer's output size has changed, so it only needs to be called to clip
+        invalidations made after a resize, and before the next frame, to the new size.
+
+        Args:
+            w (int): The width of the output in pixels.
+            h (int): The height of the output in pixels.
+        """
+        self._bounds = Rect(0, 0, w, h)
+        self._dirty = []
+        self.invalidate()
+
+    def compose(self):
+        """Redraw the dirty areas and present them. If the output has been resized, all of it is redrawn.
+
+        Returns:
+            List[Rect]: The areas redrawn, which is empty if nothing changed.
+
+        Raises:
+            SDLError: If an error is encountered while drawing or presenting.
+        """
+        renderer = self._renderer
+        w, h = renderer.output_size
+        if w != self._bounds.w or h != self._bounds.h:
+            self.resize(w, h)
+        dirty = self._dirty
+        self._dirty = []
+        self._dirty_rects = dirty
+        self._frames += 1
+        self._pixels_touched = sum(rect.w * rect.h for rect in dirty)
+        self._total_pixels_touched += self._pixels_touched
+        if not dirty:
+            return dirty
+
+        clip_rect = renderer.clip_rect
+        if self._background is not None:
+            draw_color = renderer.draw_color
+        try:
+            for rect in dirty:
+                renderer.clip_rect = rect
+                if self._background is not None:
+                    renderer.draw_color = self._background
+                    renderer.fill_rect(rect)
+                for layer in self._layers:
+                    if layer._visible and (layer._rect is None or layer._rect.has_intersection(rect)):
+                        layer._draw(renderer, rect)
+        finally:
+            renderer.clip_rect = clip_rect
+            if self._background is not None:
+                renderer.draw_color = draw_color
+
+        if self._window is not None:
+            self._window.update_surface(dirty)
+        else:
+            renderer.present()
+        return dirty
@@ -0,0 +1,375 @@
+import array
+
+from sdl2._sdl2 import ffi, lib
+from error import check_int_err
+from renderer import _cache_state
+
+
+# Recorded opcodes, each followed by a fixed number of int arguments.
+_COLOR = 0 # r, g, b, a
+_BLEND = 1 # blend mode
+_FILL_RECT = 2 # x, y, w, h
+_DRAW_RECT = 3 # x, y, w, h
+_DRAW_LINE = 4 # x1, y1, x2, y2
+_DRAW_POINT = 5 # x, y
+_COPY = 6 # texture index, flags, source x, y, w, h, dest x, y, w, h
+_CALL = 7 # child index
+
+_ARGUMENT_COUNTS = {_COLOR: 4, _BLEND: 1, _FILL_RECT: 4, _DRAW_RECT: 4, _DRAW_LINE: 4, _DRAW_POINT: 2, _COPY: 10,
+                    _CALL: 1}
+
+_HAS_SOURCE = 1
+_HAS_DEST = 2
+
+
+class DisplayList(object):
+    """A recorded sequence of rendering commands, which can be drawn many times.
+
+    Commands are recorded with the same methods as on Renderer, and packed into an int array. The first draw after a
+    change compiles the list: nested lists are inlined, the transform is applied, draw color and blend mode changes
+    which would not change anything are dropped, and runs of similar commands are packed into C arrays. Drawing then
+    issues one SDL call per run (or per copy) from a single loop.
+
+    The renderer's draw color and blend mode are left as the last recorded ones after drawing.
+    """
+
+    def __init__(self, sort_textures=False):
+        """Create an empty DisplayList.
+
+        Args:
+            sort_textures (bool): Whether to reorder each run of consecutive copies so copies of the same texture are
+                                  adjacent. This reduces texture switches, but changes the stacking order of copies, so
+                                  it is only correct when the copies in a run do not overlap.
+        """
+        self._commands = array.array('i')
+        self._textures = []
+        self._children = []
+        self._translation = (0, 0)
+        self._scale = 1.0
+        self._sort_textures = sort_textures
+        self._draw_color = None
+        self._blend_mode = None
+        self._version = 0
+        self._compiled = None
+        self._compiled_stamp = None
+        self._final_state = (None, None)
+
+    def __len__(self):
+        """Return the number of recorded commands, counting a nested list as one."""
+        count = 0
+        commands = self._commands
+        i = 0
+        while i < len(commands):
+            i += 1 + _ARGUMENT_COUNTS[commands[i]]
+            count += 1
+        return count
+
+    @property
+    def translation(self):
+        """Tuple[int, int]: The offset added to every coordinate, after scaling."""
+        return self._translation
+
+    @translation.setter
+    def translation(self, translation):
+        x, y = translation
+        self._translation = (x, y)
+        self._version += 1
+
+    @property
+    def scale(self):
+        """float: The factor every coordinate and size is multiplied by. Results are rounded to whole pixels."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale):
+        self._scale = scale
+        self._version += 1
+
+    @property
+    def draw_color(self):
+        """Tuple[int, int, int, int]: The last recorded drawing color, or None if none was recorded. Setting it
+        records a color change.
+        """
+        return self._draw_color
+
+    @draw_color.setter
+    def draw_color(self, rgba):
+        r, g, b, a = rgba
+        self._draw_color = (r, g, b, a)
+        self._record(_COLOR, r, g, b, a)
+
+    @property
+    def blend_mode(self):
+        """BlendMode: The last recorded blend mode, or None if none was recorded. Setting it records a blend mode
+        change.
+        """
+        return self._blend_mode
+
+    @blend_mode.setter
+    def blend_mode(self, blend_mode):
+        self._blend_mode = blend_mode
+        self._record(_BLEND, blend_mode)
+
+    def _record(self, *command):
+        self._commands.extend(command)
+        self._version += 1
+
+    def fill_rect(self, rect):
+        """Record filling a rectangle with the drawing color.
+
+        Args:
+            rect (Rect): The destination rectangle.
+        """
+        self._record(_FILL_RECT, rect.x, rect.y, rect.w, rect.h)
+
+    def fill_rects(self, *rects):
+        """Record filling some number of rectangles with the drawing color.
+
+        Args:
+            *rects (Rect): The destination rectangles.
+        """
+        for rect in rects:
+            self.fill_rect(rect)
+
+    def draw_rect(self, rect):
+        """Record drawing the outline of a rectangle.
+
+        Args:
+            rect (Rect): The destination rectangle.
+        """
+        self._record(_DRAW_RECT, rect.x, rect.y, rect.w, rect.h)
+
+    def draw_rects(self, *rects):
+        """Record drawing the outlines of some number of rectangles.
+
+        Args:
+            *rects (Rect): The destination rectangles.
+        """
+        for rect in rects:
+            self.draw_rect(rect)
+
+    def draw_line(self, x1, y1, x2, y2):
+        """Record drawing a line.
+
+        Args:
+            x1 (int): The x coordinate of the start point.
+            y1 (int): The y coordinate of the start point.
+            x2 (int): The x coordinate of the end point.
+            y2 (int): The y coordinate of the end point.
+        """
+        self._record(_DRAW_LINE, x1, y1, x2, y2)
+
+    def draw_point(self, x, y):
+        """Record drawing a point.
+
+        Args:
+            x (int): The x coordinate of the point.
+            y (int): The y coordinate of the point.
+        """
+        self._record(_DRAW_POINT, x, y)
+
+    def copy(self, texture, source_rect=None, dest_rect=None):
+        """Record copying a portion of a texture. The texture is kept alive as long as it is in the list.
+
+        Args:
+            texture (Texture): The source texture.
+            source_rect (Rect): The source rectangle, or None for the entire texture.
+            dest_rect (Rect): The destination rectangle, or None for the entire rendering target, which is not
+                              transformed.
+        """
+        textures = self._textures
+        for index, recorded in enumerate(textures):
+            if recorded is texture:
+                break
+        else:
+            index = len(textures)
+            textures.append(texture)
+        flags = 0
+        source = dest = (0, 0, 0, 0)
+        if source_rect is not None:
+            flags |= _HAS_SOURCE
+            source = (source_rect.x, source_rect.y, source_rect.w, source_rect.h)
+        if dest_rect is not None:
+            flags |= _HAS_DEST
+            dest = (dest_rect.x, dest_rect.y, dest_rect.w, dest_rect.h)
+        self._record(_COPY, index, flags, *(source + dest))
+
+    def call(self, display_list):
+        """Record drawing another display list, with its transform applied within this list's transform.
+
+        Later changes to the nested list are seen when this list is drawn.
+
+        Args:
+            display_list (DisplayList): The list to draw.
+
+        Raises:
+            ValueError: If the nested list contains this list.
+        """
+        if display_list is self or display_list._contains(self):
+            raise ValueError('a display list cannot contain itself')
+        self._children.append(display_list)
+        self._record(_CALL, len(self._children) - 1)
+
+    def _contains(self, display_list):
+        return any(child is display_list or child._contains(display_list) for child in self._children)
+
+    def reset(self):
+        """Remove every recorded command."""
+        self._commands = array.array('i')
+        self._textures = []
+        self._children = []
+        self._draw_color = None
+        self._blend_mode = None
+        self._version += 1
+
+    def _stamp(self):
+        return (self._version, tuple(child._stamp() for child in self._children))
+
+    def _flatten(self, x, y, scale, out):
+        """Append this list's commands to out as tuples, with coordinates transformed and nested lists inlined."""
+        tx, ty = self._translation
+        x += tx * scale
+        y += ty * scale
+        scale *= self._scale
+        if x == int(x) and y == int(y) and scale == 1:
+            x = int(x)
+            y = int(y)
+            point = lambda px, py: (x + px, y + py)
+            size = lambda w, h: (w, h)
+        else:
+            point = lambda px, py: (int(round(x + px * scale)), int(round(y + py * scale)))
+            size = lambda w, h: (int(round(w * scale)), int(round(h * scale)))
+
+        commands = self._commands
+        i = 0
+        while i < len(commands):
+            opcode = commands[i]
+            args = commands[i + 1:i + 1 + _ARGUMENT_COUNTS[opcode]]
+            i += 1 + len(args)
+            if opcode in (_FILL_RECT, _DRAW_RECT):
+                out.append((opcode,) + point(args[0], args[1]) + size(args[2], args[3]))
+            elif opcode == _DRAW_LINE:
+                out.append((opcode,) + point(args[0], args[1]) + point(args[2], args[3]))
+            elif opcode == _DRAW_POINT:
+                out.append((opcode,) + point(args[0], args[1]))
+            elif opcode == _COPY:
+                texture = self._textures[args[0]]
+                flags = args[1]
+                dest = tuple(args[6:10])
+                if flags & _HAS_DEST:
+                    dest = point(dest[0], dest[1]) + size(dest[2], dest[3])
+                out.append((opcode, texture, flags) + tuple(args[2:6]) + dest)
+            elif opcode == _CALL:
+                self._children[args[0]]._flatten(x, y, scale, out)
+            else:
+                out.append((opcode,) + tuple(args))
+        return out
+
+    def _sort_copies(self, commands):
+        # Textures are ordered by first use, and the sort is stable, so copies of each texture keep their order.
+        order = {}
+        texture_order = lambda copy: order.setdefault(id(copy[1]), len(order))
+        sorted_commands = []
+        run = []
+        for command in commands:
+            if command[0] == _COPY:
+                run.append(command)
+                continue
+            sorted_commands.extend(sorted(run, key=texture_order))
+            run = []
+            sorted_commands.append(command)
+        sorted_commands.extend(sorted(run, key=texture_order))
+        return sorted_commands
+
+    def _compile(self):
+        commands = self._flatten(0, 0, 1.0, [])
+        if self._sort_textures:
+            commands = self._sort_copies(commands)
+
+        ops = []
+        color = blend_mode = None
+        batch_key = None
+        batch = []
+
+        def flush():
+            if not batch:
+                return
+            opcode = batch_key[0]
+            if opcode == _COPY:
+                _, texture, flags = batch_key
+                source = ffi.new('SDL_Rect[]', [command[3:7] for command in batch]) if flags & _HAS_SOURCE else None
+                dest = ffi.new('SDL_Rect[]', [command[7:11] for command in batch]) if flags & _HAS_DEST else None
+                ops.append((_COPY, texture._ptr, source, dest, len(batch)))
+            elif opcode == _DRAW_POINT:
+                ops.append((_DRAW_POINT, ffi.new('SDL_Point[]', [command[1:] for command in batch]), len(batch)))
+            elif opcode == _DRAW_LINE:
+                ops.append((_DRAW_LINE, [command[1:] for command in batch]))
+            else:
+                ops.append((opcode, ffi.new('SDL_Rect[]', [command[1:] for command in batch]), len(batch)))
+            del batch[:]
+
+        for command in commands:
+            opcode = command[0]
+            if opcode == _COLOR:
+                if command[1:] != color:
+                    flush()
+                    color = command[1:]
+                    ops.append(command)
+            elif opcode == _BLEND:
+                if command[1] != blend_mode:
+                    flush()
+                    blend_mode = command[1]
+                    ops.append(command)
+            else:
+                key = (_COPY, command[1], command[2]) if opcode == _COPY else (opcode,)
+                if key != batch_key:
+                    flush()
+                    batch_key = key
+                batch.append(command)
+        flush()
+        self._final_state = (color, blend_mode)
+        return ops
+
+    def draw(self, renderer):
+        """Draw the recorded commands, compiling them first if the list or a nested list has changed.
+
+        Args:
+            renderer (Renderer): The renderer to draw with.
+
+        Raises:
+            SDLError: If an error is encountered.
+        """
+        stamp = self._stamp()
+        if stamp != self._compiled_stamp:
+            self._compiled = self._compile()
+            self._compiled_stamp = stamp
+
+        renderer_ptr = renderer._ptr
+        for op in self._compiled:
+            opcode = op[0]
+            if opcode == _COPY:
+                _, texture_ptr, source, dest, count = op
+                render_copy = lib.SDL_RenderCopy
+                for i in range(count):
+                    check_int_err(render_copy(renderer_ptr, texture_ptr, ffi.NULL if source is None else source + i,
+                                              ffi.NULL if dest is None else dest + i))
+            elif opcode == _FILL_RECT:
+                check_int_err(lib.SDL_RenderFillRects(renderer_ptr, op[1], op[2]))
+            elif opcode == _COLOR:
+                check_int_err(lib.SDL_SetRenderDrawColor(renderer_ptr, op[1], op[2], op[3], op[4]))
+            elif opcode == _DRAW_RECT:
+                check_int_err(lib.SDL_RenderDrawRects(renderer_ptr, op[1], op[2]))
+            elif opcode == _BLEND:
+                check_int_err(lib.SDL_SetRenderDrawBlendMode(renderer_ptr, op[1]))
+            elif opcode == _DRAW_LINE:
+                for x1, y1, x2, y2 in op[1]:
+                    check_int_err(lib.SDL_RenderDrawLine(renderer_ptr, x1, y1, x2, y2))
+            elif opcode == _DRAW_POINT:
+                check_int_err(lib.SDL_RenderDrawPoints(renderer_ptr, op[1], op[2]))
+
+        # Keep the renderer's state cache in step with the state set above.
+        color, blend_mode = self._final_state
+        if color is not None:
+            _cache_state(renderer, 'draw_color', color)
+        if blend_mode is not None:
+            _cache_state(renderer, 'blend_mode', int(blend_mode))
@@ -2,9 +2,47 @@
 def get_mask(items):
     return reduce(lambda x, y : x | y, items, 0)
 
+
+_MAX_CACHED_MASKS = 4096
+
+_lookups = {}
+_item_caches = {}
+
+
+class _Lookup(dict):
+    """A table mapping raw values to the members of an enum.
+
+    Looking up a value is a single dict lookup, rather than a call to the enum's constructor. Values which are not in
+    the enum raise ValueError, like the constructor does.
+    """
+
+    def __init__(self, enum):
+        super(_Lookup, self).__init__((member.value, member) for member in enum)
+        self._enum = enum
+
+    def __missing__(self, value):
+        return self._enum(value)
+
+
+def get_lookup(enum):
+    """Return a table mapping raw values to the members of enum, which is built once per enum."""
+    lookup = _lookups.get(enum)
+    if lookup is None:
+        lookup = _lookups[enum] = _Lookup(enum)
+    return lookup
+
 def get_items(enum, mask, blacklist=frozenset()):
-    items = set()
-    for item in enum:
-        if item not in blacklist and item & mask:
-            items.add(item)
+    """Return the members of enum which share bits with mask, excluding any members in blacklist.
+
+    The result for each mask is cached, so repeated calls with the same mask are a dict lookup.
+    """
+    blacklist = frozenset(blacklist)
+    cache = _item_caches.get((enum, blacklist))
+    if cache is None:
+        cache = _item_caches[(enum, blacklist)] = {}
+    items = cache.get(mask)
+    if items is None:
+        items = frozenset(item for item in enum if item not in blacklist and item & mask)
+        if len(cache) < _MAX_CACHED_MASKS:
+            cache[mask] = items
     return items
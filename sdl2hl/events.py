@@ -1,4 +1,8 @@
 from enum import IntEnum
+import array
+import operator
+import struct
+from timeit import default_timer
 import weakref
 
 from sdl2._sdl2 import ffi, lib
@@ -6,7 +10,7 @@ from sdl2._sdl2 import ffi, lib
 from error import check_int_err
 from keycode import KeyCode, KeyMod
 from scancode import ScanCode
-from enumtools import get_items
+from enumtools import get_items, get_lookup
 from gamecontroller import ControllerAxis, ControllerButton
 
 
@@ -103,25 +107,60 @@ class KeyState(IntEnum):
     released = lib.SDL_RELEASED
 
 
+_EVENT_TYPE_LOOKUP = get_lookup(EventType)
+_WINDOW_EVENT_TYPE_LOOKUP = get_lookup(WindowEventType)
+_KEY_STATE_LOOKUP = get_lookup(KeyState)
+_SCANCODE_LOOKUP = get_lookup(ScanCode)
+_KEYCODE_LOOKUP = get_lookup(KeyCode)
+_CONTROLLER_AXIS_LOOKUP = get_lookup(ControllerAxis)
+_CONTROLLER_BUTTON_LOOKUP = get_lookup(ControllerButton)
+
+
+#: The names of the columns available from get_columns and EventQueue.drain_columns.
+EVENT_COLUMNS = ('type', 'timestamp', 'window_id', 'which', 'x', 'y', 'xrel', 'yrel', 'button', 'state', 'clicks',
+                 'axis', 'value', 'scancode', 'keycode', 'mod', 'repeat')
+
+_COLUMN_TYPECODES = dict.fromkeys(EVENT_COLUMNS, 'i')
+# Mouse ids are Uint32, so which is unsigned and SDL_TOUCH_MOUSEID reads as 0xFFFFFFFF. Joystick instance ids, which
+# are signed, are never negative for an open device.
+_COLUMN_TYPECODES.update(type='I', timestamp='I', window_id='I', which='I')
+
+
 class Event(object):
 
+    __slots__ = ('_ptr', '_owner')
+
     @staticmethod
-    def _from_ptr(ptr):
+    def _from_ptr(ptr, owner=None, materialize=False):
         event_class = _EVENT_TYPES.get(ptr.type, Event)
         event = object.__new__(event_class)
         event._ptr = ptr
+        if materialize:
+            return _RECORD_TYPES[event_class]._from_event(event)
+        if owner is not None:
+            event._owner = owner
         return event
 
     def __init__(self):
         self._ptr = ffi.new('SDL_Event *')
 
+    def copy(self):
+        """Return a copy of this event which does not share memory with the original.
+
+        Returns:
+            Event: A copy of the event.
+        """
+        return Event._from_ptr(ffi.new('SDL_Event *', self._ptr[0]))
+
     @property
     def type(self):
         """EventType: The type of the event."""
-        try:
-            return EventType(self._ptr.common.type)
-        except:
-            return EventType.lastevent
+        return _EVENT_TYPE_LOOKUP.get(self._ptr.common.type, EventType.lastevent)
+
+    @property
+    def raw_type(self):
+        """int: The type of the event, as a plain int."""
+        return self._ptr.common.type
 
     @property
     def timestamp(self):
@@ -130,11 +169,14 @@ class Event(object):
 
 
 class QuitEvent(Event):
-    pass
+
+    __slots__ = ()
     
 
 class WindowEvent(Event):
 
+    __slots__ = ()
+
     @property
     def window_id(self):
         """int: The id of the associated window."""
@@ -143,11 +185,18 @@ class WindowEvent(Event):
     @property
     def event(self):
         """WindowEventType: The type of window event."""
-        return WindowEventType(self._ptr.window.event)
+        return _WINDOW_EVENT_TYPE_LOOKUP[self._ptr.window.event]
+
+    @property
+    def raw_event(self):
+        """int: The type of window event, as a plain int."""
+        return self._ptr.window.event
 
 
 class KeyboardEvent(Event):
 
+    __slots__ = ()
+
     @property
     def window_id(self):
         """int: The id of window with keyboard focus, if any."""
@@ -156,7 +205,12 @@ class KeyboardEvent(Event):
     @property
     def state(self):
         """KeyState: The state of the key."""
-        return KeyState(self._ptr.key.state)
+        return _KEY_STATE_LOOKUP[self._ptr.key.state]
+
+    @property
+    def raw_state(self):
+        """int: The state of the key, as a plain int."""
+        return self._ptr.key.state
 
     @property
     def repeat(self):
@@ -166,21 +220,38 @@ class KeyboardEvent(Event):
     @property
     def scancode(self):
         """ScanCode: Physical keycode."""
-        return ScanCode(self._ptr.key.keysym.scancode)
+        return _SCANCODE_LOOKUP[self._ptr.key.keysym.scancode]
+
+    @property
+    def raw_scancode(self):
+        """int: Physical keycode, as a plain int."""
+        return self._ptr.key.keysym.scancode
 
     @property
     def keycode(self):
         """KeyCode: Virtual keycode."""
-        return KeyCode(self._ptr.key.keysym.sym)
+        return _KEYCODE_LOOKUP[self._ptr.key.keysym.sym]
+
+    @property
+    def raw_keycode(self):
+        """int: Virtual keycode, as a plain int."""
+        return self._ptr.key.keysym.sym
 
     @property
     def mod(self):
-        """Set[KeyMod]: The current key modifiers."""
+        """FrozenSet[KeyMod]: The current key modifiers."""
         return get_items(KeyMod, self._ptr.key.keysym.mod)
 
+    @property
+    def raw_mod(self):
+        """int: The current key modifiers, as a plain int bitmask of KeyMod values."""
+        return self._ptr.key.keysym.mod
+
 
 class TextInputEvent(Event):
     
+    __slots__ = ()
+
     @property
     def window_id(self):
         """int: The id of the window with keyboard focus, if any."""
@@ -194,6 +265,8 @@ class TextInputEvent(Event):
         
 class MouseMotionEvent(Event):
 
+    __slots__ = ()
+
     @property
     def window_id(self):
         """int: The id of the associated window."""
@@ -237,6 +310,8 @@ class MouseMotionEvent(Event):
 
 class MouseButtonEvent(Event):
 
+    __slots__ = ()
+
     @property
     def window_id(self):
         """int: The id of the associated window."""
@@ -255,7 +330,12 @@ class MouseButtonEvent(Event):
     @property
     def state(self):
         """KeyState: The state of the mouse button."""
-        return KeyState(self._ptr.button.state)
+        return _KEY_STATE_LOOKUP[self._ptr.button.state]
+
+    @property
+    def raw_state(self):
+        """int: The state of the mouse button, as a plain int."""
+        return self._ptr.button.state
         
     @property
     def clicks(self):
@@ -275,6 +355,8 @@ class MouseButtonEvent(Event):
 
 class ControllerAxisEvent(Event):
     
+    __slots__ = ()
+
     @property
     def which(self):
         """int: The controller instance id."""
@@ -283,7 +365,12 @@ class ControllerAxisEvent(Event):
     @property
     def axis(self):
         """ControllerAxis: The controller axis."""
-        return ControllerAxis(self._ptr.caxis.axis)
+        return _CONTROLLER_AXIS_LOOKUP[self._ptr.caxis.axis]
+
+    @property
+    def raw_axis(self):
+        """int: The controller axis, as a plain int."""
+        return self._ptr.caxis.axis
 
     @property
     def value(self):
@@ -293,6 +380,8 @@ class ControllerAxisEvent(Event):
 
 class ControllerButtonEvent(Event):
     
+    __slots__ = ()
+
     @property
     def which(self):
         """int: The controller instance id."""
@@ -301,12 +390,22 @@ class ControllerButtonEvent(Event):
     @property
     def button(self):
         """ControllerButton: The controller button."""
-        return ControllerButton(self._ptr.cbutton.button)
+        return _CONTROLLER_BUTTON_LOOKUP[self._ptr.cbutton.button]
+
+    @property
+    def raw_button(self):
+        """int: The controller button, as a plain int."""
+        return self._ptr.cbutton.button
         
     @property
     def state(self):
         """KeyState: The button state."""
-        return KeyState(self._ptr.cbutton.state)
+        return _KEY_STATE_LOOKUP[self._ptr.cbutton.state]
+
+    @property
+    def raw_state(self):
+        """int: The button state, as a plain int."""
+        return self._ptr.cbutton.state
 
 
 def pump():
@@ -316,7 +415,7 @@ def pump():
     """
     lib.SDL_PumpEvents()
 
-def peek(quantity, min_type=EventType.firstevent, max_type=EventType.lastevent):
+def peek(quantity, min_type=EventType.firstevent, max_type=EventType.lastevent, materialize=False):
     """Return events at the front of the event queue, within the specified minimum and maximum type,
     and do not remove them from the queue.
 
@@ -324,6 +423,8 @@ def peek(quantity, min_type=EventType.firstevent, max_type=EventType.lastevent):
         quantity (int): The maximum number of events to return.
         min_type (int): The minimum value for the event type of the returned events.
         max_type (int): The maximum value for the event type of the returned events.
+        materialize (bool): If True, return events with every field read up front, which do not keep the memory they
+                            were read from alive.
 
     Returns:
         List[Event]: Events from the front of the event queue.
@@ -332,9 +433,9 @@ def peek(quantity, min_type=EventType.firstevent, max_type=EventType.lastevent):
         SDLError: If there was an error retrieving the events.
     """
 
-    return _peep(quantity, lib.SDL_PEEKEVENT, min_type, max_type)
+    return _peep(quantity, lib.SDL_PEEKEVENT, min_type, max_type, materialize)
 
-def get(quantity, min_type=EventType.firstevent, max_type=EventType.lastevent):
+def get(quantity, min_type=EventType.firstevent, max_type=EventType.lastevent, materialize=False):
     """Return events at the front of the event queue, within the specified minimum and maximum type,
     and remove them from the queue.
 
@@ -342,6 +443,8 @@ def get(quantity, min_type=EventType.firstevent, max_type=EventType.lastevent):
         quantity (int): The maximum number of events to return.
         min_type (int): The minimum value for the event type of the returned events.
         max_type (int): The maximum value for the event type of the returned events.
+        materialize (bool): If True, return events with every field read up front, which do not keep the memory they
+                            were read from alive.
 
     Returns:
         List[Event]: Events from the front of the event queue.
@@ -349,12 +452,15 @@ def get(quantity, min_type=EventType.firstevent, max_type=EventType.lastevent):
     Raises:
         SDLError: If there was an error retrieving the events.
     """
-    return _peep(quantity, lib.SDL_GETEVENT, min_type, max_type)
+    return _peep(quantity, lib.SDL_GETEVENT, min_type, max_type, materialize)
 
-def _peep(quantity, action, min_type, max_type):
+def _peep(quantity, action, min_type, max_type, materialize):
     events = ffi.new('SDL_Event[]', quantity)
     quantity_retrieved = check_int_err(lib.SDL_PeepEvents(events, quantity, action, min_type, max_type))
 
+    if materialize:
+        return [Event._from_ptr(events + i, materialize=True) for i in range(quantity_retrieved)]
+
     result = []
     for i in range(quantity_retrieved):
         event_ptr = events + i
@@ -362,18 +468,401 @@ def _peep(quantity, action, min_type, max_type):
         result.append(Event._from_ptr(event_ptr))
     return result
 
-def poll():
+class EventQueue(object):
+    """A reusable buffer for removing events from the event queue in bulk.
+
+    The events returned by drain are views onto a single buffer which is allocated once, when the EventQueue is created.
+    Each view is only valid until the next time the buffer is refilled; use Event.copy to keep an event for longer, or
+    create the queue with materialize set to read every field of each event up front.
+
+    Materializing trades memory and creation time for faster repeated reads: each record is created several times
+    slower than a view and takes more memory, but reading its fields afterwards is several times faster. Only
+    materialize events whose fields are read more than once, or which must outlive the buffer.
+    """
+
+    def __init__(self, capacity=256, materialize=False):
+        """Create an EventQueue.
+
+        Args:
+            capacity (int): The maximum number of events retrieved at once.
+            materialize (bool): If True, return events with every field read up front, which remain valid after the
+                                buffer is refilled.
+        """
+        self._capacity = capacity
+        self._materialize = materialize
+        self._events = ffi.new('SDL_Event[]', capacity)
+
+    @property
+    def capacity(self):
+        """int: The maximum number of events retrieved at once."""
+        return self._capacity
+
+    def _fill(self, min_type, max_type):
+        return check_int_err(lib.SDL_PeepEvents(self._events, self._capacity, lib.SDL_GETEVENT, min_type, max_type))
+
+    def drain(self, min_type=EventType.firstevent, max_type=EventType.lastevent):
+        """Pump the event loop, then remove up to capacity events within the specified minimum and maximum type from
+        the front of the event queue.
+
+        Args:
+            min_type (int): The minimum value for the event type of the returned events.
+            max_type (int): The maximum value for the event type of the returned events.
+
+        Returns:
+            List[Event]: Views of the removed events, valid until the buffer is next refilled.
+
+        Raises:
+            SDLError: If there was an error retrieving the events.
+        """
+        lib.SDL_PumpEvents()
+        events = self._events
+        materialize = self._materialize
+        return [Event._from_ptr(events + i, events, materialize) for i in range(self._fill(min_type, max_type))]
+
+    def drain_columns(self, min_type=EventType.firstevent, max_type=EventType.lastevent, columns=EVENT_COLUMNS):
+        """Pump the event loop, then remove up to capacity events within the specified minimum and maximum type from
+        the front of the event queue, and return their fields as columns.
+
+        Args:
+            min_type (int): The minimum value for the event type of the returned events.
+            max_type (int): The maximum value for the event type of the returned events.
+            columns (Iterable[str]): The names of the columns to return, from EVENT_COLUMNS.
+
+        Returns:
+            Dict[str, array.array]: The value of each field for each event, by column name. Fields which do not apply
+                                    to the type of an event are 0.
+
+        Raises:
+            SDLError: If there was an error retrieving the events.
+        """
+        lib.SDL_PumpEvents()
+        return _columns(self._events, self._fill(min_type, max_type), columns)
+
+    def __iter__(self):
+        """Pump the event loop, then remove and iterate over every pending event, refilling the buffer as needed.
+
+        Returns:
+            Iterable[Event]: Views of the removed events, valid until the buffer is next refilled.
+        """
+        lib.SDL_PumpEvents()
+        events = self._events
+        materialize = self._materialize
+        while True:
+            count = self._fill(EventType.firstevent, EventType.lastevent)
+            for i in range(count):
+                yield Event._from_ptr(events + i, events, materialize)
+            if count < self._capacity:
+                break
+
+
+def get_columns(quantity, min_type=EventType.firstevent, max_type=EventType.lastevent, columns=EVENT_COLUMNS):
+    """Remove events at the front of the event queue, within the specified minimum and maximum type, and return their
+    fields as columns.
+
+    This reads every event in a single pass, without creating an Event for each one. The columns support the buffer
+    protocol, so they can be wrapped by numpy.frombuffer without copying.
+
+    Args:
+        quantity (int): The maximum number of events to return.
+        min_type (int): The minimum value for the event type of the returned events.
+        max_type (int): The maximum value for the event type of the returned events.
+        columns (Iterable[str]): The names of the columns to return, from EVENT_COLUMNS.
+
+    Returns:
+        Dict[str, array.array]: The value of each field for each event, by column name. Fields which do not apply to
+                                the type of an event are 0.
+
+    Raises:
+        SDLError: If there was an error retrieving the events.
+    """
+    events = ffi.new('SDL_Event[]', quantity)
+    count = check_int_err(lib.SDL_PeepEvents(events, quantity, lib.SDL_GETEVENT, min_type, max_type))
+    return _columns(events, count, columns)
+
+def _columns(events, count, names):
+    for name in names:
+        if name not in _COLUMN_TYPECODES:
+            raise ValueError('unknown event column: %s' % name)
+    columns = {name: array.array(_COLUMN_TYPECODES[name], [0]) * count for name in names}
+    buf = ffi.buffer(events, count * _EVENT_SIZE)
+
+    # For each layout, the position of each requested column in the unpacked values.
+    targets = {}
+    for i in range(count):
+        offset = i * _EVENT_SIZE
+        layout, layout_names = _COLUMN_LAYOUTS.get(_unpack_type(buf, offset)[0], _COMMON_LAYOUT)
+        layout_targets = targets.get(layout)
+        if layout_targets is None:
+            layout_targets = targets[layout] = [(j, columns[name]) for j, name in enumerate(layout_names)
+                                                if name in columns]
+        values = layout.unpack_from(buf, offset)
+        for j, column in layout_targets:
+            column[i] = values[j]
+    return columns
+
+def poll(materialize=False):
     """Polls for currently pending events.
 
+    Args:
+        materialize (bool): If True, return events with every field read up front, which lets a single buffer be
+                            reused for polling.
+
     Returns:
         Iterable[Event]: Events from the event queue.
     """
     event_ptr = ffi.new('SDL_Event *')
     while lib.SDL_PollEvent(event_ptr):
-        yield Event._from_ptr(event_ptr)
-        event_ptr = ffi.new('SDL_Event *')
+        yield Event._from_ptr(event_ptr, materialize=materialize)
+        if not materialize:
+            event_ptr = ffi.new('SDL_Event *')
+
+
+_SUBTYPE_READERS = {
+    lib.SDL_WINDOWEVENT: lambda ptr: ptr.window.event,
+    lib.SDL_KEYDOWN: lambda ptr: ptr.key.keysym.sym,
+    lib.SDL_KEYUP: lambda ptr: ptr.key.keysym.sym,
+    lib.SDL_CONTROLLERBUTTONDOWN: lambda ptr: ptr.cbutton.button,
+    lib.SDL_CONTROLLERBUTTONUP: lambda ptr: ptr.cbutton.button,
+}
+
+# Read the same subtypes from an Event, which may be a view or a record without a pointer.
+_SUBTYPE_GETTERS = {
+    lib.SDL_WINDOWEVENT: operator.attrgetter('raw_event'),
+    lib.SDL_KEYDOWN: operator.attrgetter('raw_keycode'),
+    lib.SDL_KEYUP: operator.attrgetter('raw_keycode'),
+    lib.SDL_CONTROLLERBUTTONDOWN: operator.attrgetter('raw_button'),
+    lib.SDL_CONTROLLERBUTTONUP: operator.attrgetter('raw_button'),
+}
+
+
+class Dispatcher(object):
+    """Calls the handlers registered for each event removed from the event queue.
+
+    Handlers are registered for an EventType, and may be narrowed to a WindowEventType for window events, a KeyCode for
+    keyboard events or a ControllerButton for controller button events. Registrations are compiled into a table keyed
+    on the integer event type, so dispatching an event costs one lookup, and events without handlers are discarded
+    without creating an Event for them.
+    """
+
+    def __init__(self, capacity=256):
+        """Create a Dispatcher.
+
+        Args:
+            capacity (int): The maximum number of events retrieved from the event queue at once.
+        """
+        self._queue = EventQueue(capacity)
+        self._handlers = {}
+        self._counters = {}
+        self._table = None
+
+    def register(self, event_type, handler, subtype=None):
+        """Register a handler to be called with each event of the given type.
+
+        Args:
+            event_type (EventType): The type of event to handle.
+            handler (Callable[[Event], None]): The function to call with each event.
+            subtype (Optional[Union[WindowEventType, KeyCode, ControllerButton]]): If given, only call the handler for
+                                                                                   events with this window event type,
+                                                                                   keycode or controller button.
+
+        Raises:
+            ValueError: If a subtype is given for an event type which does not have one.
+        """
+        if subtype is not None and event_type not in _SUBTYPE_READERS:
+            raise ValueError('{} events cannot be narrowed by subtype'.format(EventType(event_type).name))
+        key = (int(event_type), None if subtype is None else int(subtype))
+        self._handlers.setdefault(key, []).append(handler)
+        self._counters.setdefault(handler, [0, 0.0])
+        self._table = None
+
+    def unregister(self, event_type, handler, subtype=None):
+        """Remove a handler registered with the same arguments.
+
+        Args:
+            event_type (EventType): The type of event the handler was registered for.
+            handler (Callable[[Event], None]): The handler to remove.
+            subtype (Optional[Union[WindowEventType, KeyCode, ControllerButton]]): The subtype the handler was
+                                                                                   registered for.
+
+        Raises:
+            ValueError: If the handler is not registered with these arguments.
+        """
+        key = (int(event_type), None if subtype is None else int(subtype))
+        handlers = self._handlers.get(key, [])
+        handlers.remove(handler)
+        if not handlers:
+            del self._handlers[key]
+        self._table = None
+
+    def handler(self, event_type, subtype=None):
+        """Return a decorator which registers the decorated function as a handler.
+
+        Args:
+            event_type (EventType): The type of event to handle.
+            subtype (Optional[Union[WindowEventType, KeyCode, ControllerButton]]): If given, only call the handler for
+                                                                                   events with this subtype.
+
+        Returns:
+            Callable[[Callable[[Event], None]], Callable[[Event], None]]: The decorator.
+        """
+        def decorator(handler):
+            self.register(event_type, handler, subtype)
+            return handler
+        return decorator
+
+    def _compile(self):
+        table = {}
+        for (event_type, subtype), handlers in self._handlers.items():
+            entry = table.setdefault(event_type, [(), {}])
+            counted = tuple((handler, self._counters[handler]) for handler in handlers)
+            if subtype is None:
+                entry[0] = counted
+            else:
+                entry[1][subtype] = counted
+        # Each subtype's handlers run after the handlers for the whole event type.
+        for entry in table.values():
+            by_subtype = entry[1]
+            for subtype in by_subtype:
+                by_subtype[subtype] = entry[0] + by_subtype[subtype]
+        self._table = {event_type: tuple(entry) for event_type, entry in table.items()}
+        return self._table
+
+    def _handlers_for(self, table, event_type, source, readers):
+        entry = table.get(event_type)
+        if entry is None:
+            return ()
+        handlers, by_subtype = entry
+        if not by_subtype:
+            return handlers
+        return by_subtype.get(readers[event_type](source), handlers)
+
+    def dispatch(self, event):
+        """Call the handlers registered for an event.
+
+        Args:
+            event (Event): The event to dispatch.
+
+        Returns:
+            int: The number of handlers called.
+        """
+        table = self._table if self._table is not None else self._compile()
+        handlers = self._handlers_for(table, event.raw_type, event, _SUBTYPE_GETTERS)
+        timer = default_timer
+        for handler, counter in handlers:
+            start = timer()
+            handler(event)
+            counter[1] += timer() - start
+            counter[0] += 1
+        return len(handlers)
+
+    def drain(self):
+        """Pump the event loop, then remove every pending event from the event queue and dispatch it.
+
+        The events passed to handlers are views onto the dispatcher's buffer, valid until the handler returns; use
+        Event.copy to keep an event for longer.
+
+        Returns:
+            int: The number of events removed.
+
+        Raises:
+            SDLError: If there was an error retrieving the events.
+        """
+        table = self._table if self._table is not None else self._compile()
+        queue = self._queue
+        events = queue._events
+        capacity = queue._capacity
+        timer = default_timer
+        total = 0
+        lib.SDL_PumpEvents()
+        while True:
+            count = queue._fill(EventType.firstevent, EventType.lastevent)
+            for i in range(count):
+                event_ptr = events + i
+                handlers = self._handlers_for(table, event_ptr.type, event_ptr, _SUBTYPE_READERS)
+                if not handlers:
+                    continue
+                event = Event._from_ptr(event_ptr, events)
+                for handler, counter in handlers:
+                    start = timer()
+                    handler(event)
+                    counter[1] += timer() - start
+                    counter[0] += 1
+            total += count
+            if count < capacity:
+                return total
+
+    @property
+    def stats(self):
+        """Dict[Callable[[Event], None], Tuple[int, float]]: The number of calls to each handler, and the total time
+        in seconds spent in them.
+        """
+        return {handler: (counter[0], counter[1]) for handler, counter in self._counters.items()}
+
+    def reset_stats(self):
+        """Set every handler's call count and time back to zero."""
+        for counter in self._counters.values():
+            counter[0] = 0
+            counter[1] = 0.0
       
         
+_COLUMN_FIELDS = [
+    ((EventType.windowevent,), 'window', [('window_id', 'windowID')]),
+    ((EventType.keydown, EventType.keyup), 'key', [
+        ('window_id', 'windowID'), ('state', 'state'), ('repeat', 'repeat'), ('scancode', 'keysym.scancode'),
+        ('keycode', 'keysym.sym'), ('mod', 'keysym.mod')]),
+    ((EventType.textinput,), 'text', [('window_id', 'windowID')]),
+    ((EventType.mousemotion,), 'motion', [
+        ('window_id', 'windowID'), ('which', 'which'), ('state', 'state'), ('x', 'x'), ('y', 'y'), ('xrel', 'xrel'),
+        ('yrel', 'yrel')]),
+    ((EventType.mousebuttondown, EventType.mousebuttonup), 'button', [
+        ('window_id', 'windowID'), ('which', 'which'), ('button', 'button'), ('state', 'state'), ('clicks', 'clicks'),
+        ('x', 'x'), ('y', 'y')]),
+    ((EventType.mousewheel,), 'wheel', [('window_id', 'windowID'), ('which', 'which'), ('x', 'x'), ('y', 'y')]),
+    ((EventType.joyaxismotion,), 'jaxis', [('which', 'which'), ('axis', 'axis'), ('value', 'value')]),
+    ((EventType.joybuttondown, EventType.joybuttonup), 'jbutton', [
+        ('which', 'which'), ('button', 'button'), ('state', 'state')]),
+    ((EventType.controlleraxismotion,), 'caxis', [('which', 'which'), ('axis', 'axis'), ('value', 'value')]),
+    ((EventType.controllerbuttondown, EventType.controllerbuttonup), 'cbutton', [
+        ('which', 'which'), ('button', 'button'), ('state', 'state')]),
+]
+
+_STRUCT_CODES = {1: 'b', 2: 'h', 4: 'i'}
+
+def _make_layout(member, fields):
+    """Return a Struct which unpacks the given fields of an SDL_Event union member, and the column for each value."""
+    located = [(0, 'I', 'type'), (4, 'I', 'timestamp')]
+    for column, path in fields:
+        offset = 0
+        ctype = ffi.typeof('SDL_Event')
+        for name in (member + '.' + path).split('.'):
+            field = dict(ctype.fields)[name]
+            offset += field.offset
+            ctype = field.type
+        size = ffi.sizeof(ctype)
+        if size == 4:
+            code = _COLUMN_TYPECODES[column]
+        elif ctype.kind == 'primitive' and ctype.cname.startswith('u'):
+            code = _STRUCT_CODES[size].upper()
+        else:
+            code = _STRUCT_CODES[size]
+        located.append((offset, code, column))
+
+    fmt = '='
+    position = 0
+    for offset, code, column in sorted(located):
+        fmt += '%dx%s' % (offset - position, code)
+        position = offset + struct.calcsize('=' + code)
+    return struct.Struct(fmt), [column for offset, code, column in sorted(located)]
+
+_EVENT_SIZE = ffi.sizeof('SDL_Event')
+_unpack_type = struct.Struct('=I').unpack_from
+_COMMON_LAYOUT = _make_layout('common', [])
+_COLUMN_LAYOUTS = {}
+for _types, _member, _fields in _COLUMN_FIELDS:
+    _layout = _make_layout(_member, _fields)
+    for _type in _types:
+        _COLUMN_LAYOUTS[_type] = _layout
+
 _EVENT_TYPES = {
     EventType.quit : QuitEvent,
     EventType.windowevent: WindowEvent,
@@ -387,4 +876,60 @@ _EVENT_TYPES = {
     EventType.controllerbuttondown : ControllerButtonEvent,
     EventType.controllerbuttonup : ControllerButtonEvent,
 }
-    
+
+
+class _EventRecord(object):
+    """A mixin for events whose fields have all been read into slots, so they no longer refer to an SDL_Event.
+
+    Enum-typed fields are stored as their raw ints and decoded when read, so reading an event with a value missing
+    from an enum cannot fail, and records stay small.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _from_event(cls, event):
+        record = object.__new__(cls)
+        for name in cls._fields:
+            setattr(record, name, getattr(event, name))
+        return record
+
+    def copy(self):
+        """Return this event, since it does not share memory with anything.
+
+        Returns:
+            Event: This event.
+        """
+        return self
+
+
+def _lookup_or_raw(lookup):
+    return lambda raw: lookup.get(raw, raw)
+
+# Decoders for the fields of records which have raw_ counterparts. Values missing from an enum, which newer versions
+# of SDL may report, are returned as plain ints.
+_RECORD_DECODERS = {
+    'type': lambda raw: _EVENT_TYPE_LOOKUP.get(raw, EventType.lastevent),
+    'event': _lookup_or_raw(_WINDOW_EVENT_TYPE_LOOKUP),
+    'state': _lookup_or_raw(_KEY_STATE_LOOKUP),
+    'scancode': _lookup_or_raw(_SCANCODE_LOOKUP),
+    'keycode': _lookup_or_raw(_KEYCODE_LOOKUP),
+    'mod': lambda raw: get_items(KeyMod, raw),
+    'axis': _lookup_or_raw(_CONTROLLER_AXIS_LOOKUP),
+    'button': _lookup_or_raw(_CONTROLLER_BUTTON_LOOKUP),
+}
+
+def _decoded_property(event_class, name):
+    get_raw = operator.attrgetter('raw_' + name)
+    decode = _RECORD_DECODERS[name]
+    return property(lambda self: decode(get_raw(self)), doc=getattr(event_class, name).__doc__)
+
+def _make_record_type(event_class):
+    names = set(name for name in dir(event_class) if isinstance(getattr(event_class, name), property))
+    decoded = set(name for name in names if 'raw_' + name in names)
+    fields = tuple(sorted(names - decoded))
+    namespace = {name: _decoded_property(event_class, name) for name in decoded}
+    namespace.update(__slots__=fields, _fields=fields, __module__=__name__)
+    return type(event_class.__name__ + 'Record', (_EventRecord, event_class), namespace)
+
+_RECORD_TYPES = {event_class: _make_record_type(event_class) for event_class in set(_EVENT_TYPES.values()) | {Event}}
@@ -6,6 +6,7 @@ import enumtools
 
 from surface import Surface
 from renderer import Texture
+import rwops
 
 
 class ImageInitFlag(IntEnum):
@@ -32,12 +33,14 @@ def quit():
 def load(file):
     """Load an image from a file name in a new surface. Type detected from file name.
     Args
-        file: The name of the image file.
+        file: The name of the image file, or an RWops to read it from.
 
     Returns:
         A new surface.
 
     """
+    if isinstance(file, rwops.RWops):
+        return Surface._from_ptr(check_ptr_err(lib.IMG_Load_RW(file._ptr, 0)))
     return Surface._from_ptr(check_ptr_err(lib.IMG_Load(file)))
 
 
@@ -45,11 +48,13 @@ def load_texture(renderer, file):
     """Load an image directly into a render texture.
     Args:
         renderer: The renderer to make the texture.
-        file: The image file to load.
+        file: The image file to load, or an RWops to read it from.
 
     Returns:
         A new texture
     """
+    if isinstance(file, rwops.RWops):
+        return Texture._from_ptr(check_ptr_err(lib.IMG_LoadTexture_RW(renderer._ptr, file._ptr, 0)))
     return Texture._from_ptr(check_ptr_err(lib.IMG_LoadTexture(renderer._ptr, file)))
 
 
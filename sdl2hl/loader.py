@@ -0,0 +1,360 @@
+import collections
+import functools
+import threading
+from timeit import default_timer
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+import image
+from mixer import Chunk
+from renderer import Texture
+from surface import Surface
+from ttf import Font
+
+
+class CancelledError(Exception):
+    """Raised when getting the result of a cancelled load."""
+
+
+_PENDING = 'pending'
+_RUNNING = 'running'
+_DECODED = 'decoded'
+_FINISHED = 'finished'
+_CANCELLED = 'cancelled'
+
+
+def _read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _upload_bytes(decoded):
+    # Only surfaces count towards the byte budget, which limits the pixels uploaded to textures.
+    return decoded.h * decoded.pitch if isinstance(decoded, Surface) else 0
+
+
+class Future(object):
+    """The eventual result of a load submitted to an AssetLoader."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._state = _PENDING
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+
+    def cancel(self):
+        """Cancel the load if it has not started decoding, or if it is waiting to be uploaded.
+
+        Returns:
+            bool: True if the load was cancelled.
+        """
+        with self._condition:
+            if self._state in (_FINISHED, _RUNNING):
+                return False
+            if self._state != _CANCELLED:
+                self._state = _CANCELLED
+                self._condition.notify_all()
+        self._run_callbacks()
+        return True
+
+    def cancelled(self):
+        """Return whether the load was cancelled.
+
+        Returns:
+            bool: True if the load was cancelled.
+        """
+        return self._state == _CANCELLED
+
+    def done(self):
+        """Return whether the load has finished, failed or been cancelled.
+
+        Returns:
+            bool: True if the load will not make further progress.
+        """
+        return self._state in (_FINISHED, _CANCELLED)
+
+    def result(self, timeout=None):
+        """Wait for the load to finish and return the loaded asset.
+
+        Loads which need uploading only finish during AssetLoader.upload, so do not wait for them on the thread which
+        calls it.
+
+        Args:
+            timeout (Optional[float]): The most seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            object: The loaded asset.
+
+        Raises:
+            CancelledError: If the load was cancelled.
+            RuntimeError: If the timeout expired first.
+            Exception: The exception raised by the load, if it failed.
+        """
+        exception = self.exception(timeout)
+        if exception is not None:
+            raise exception
+        return self._result
+
+    def exception(self, timeout=None):
+        """Wait for the load to finish and return the exception it raised.
+
+        Args:
+            timeout (Optional[float]): The most seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            Optional[Exception]: The exception raised by the load, or None if it succeeded.
+
+        Raises:
+            CancelledError: If the load was cancelled.
+            RuntimeError: If the timeout expired first.
+        """
+        with self._condition:
+            end = None if timeout is None else default_timer() + timeout
+            while not self.done():
+                remaining = None if end is None else end - default_timer()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if self._state == _CANCELLED:
+                raise CancelledError()
+            if self._state != _FINISHED:
+                raise RuntimeError('timed out waiting for the load')
+            return self._exception
+
+    def add_done_callback(self, fn):
+        """Call a function with this future when it is done, or immediately if it already is.
+
+        Callbacks are called on the thread that completes the load: a worker thread for loads without an upload, and
+        the thread calling AssetLoader.upload or Future.cancel otherwise.
+
+        Args:
+            fn (Callable[[Future], None]): The function to call.
+        """
+        with self._condition:
+            if not self.done():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def _start(self):
+        with self._condition:
+            if self._state != _PENDING:
+                return False
+            self._state = _RUNNING
+            return True
+
+    def _set_decoded(self):
+        with self._condition:
+            if self._state != _RUNNING:
+                return False
+            self._state = _DECODED
+            return True
+
+    def _finish(self, result=None, exception=None):
+        with self._condition:
+            if self._state == _CANCELLED:
+                return
+            self._result = result
+            self._exception = exception
+            self._state = _FINISHED
+            self._condition.notify_all()
+        self._run_callbacks()
+
+    def _run_callbacks(self):
+        with self._condition:
+            callbacks = self._callbacks
+            self._callbacks = []
+        for fn in callbacks:
+            fn(self)
+
+
+class AssetLoader(object):
+    """Decodes assets on a pool of worker threads, and uploads textures on the main thread within a budget.
+
+    SDL releases the GIL while decoding, so workers decode files in parallel with the main thread. Textures must be
+    created on the thread that owns the renderer, so load_texture decodes to a Surface on a worker and leaves the
+    upload to upload, which should be called once per frame. SDL_ttf is not thread safe, so load_font only reads the
+    font file on a worker, and opens the font during upload too.
+    """
+
+    def __init__(self, workers=2):
+        """Create an AssetLoader and start its workers.
+
+        Args:
+            workers (int): The number of worker threads.
+        """
+        self._tasks = queue.Queue()
+        self._uploads = collections.deque()
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._threads = []
+        for _ in range(workers):
+            thread = threading.Thread(target=self._work)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def progress(self):
+        """Tuple[int, int]: The number of loads done, including failed and cancelled loads, and the number of loads
+                            submitted.
+        """
+        return self._completed, self._submitted
+
+    @property
+    def pending_uploads(self):
+        """int: The number of decoded textures and fonts waiting for upload."""
+        return len(self._uploads)
+
+    def _completed_one(self, future):
+        with self._lock:
+            self._completed += 1
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, fn, args, upload = task
+            if not future._start():
+                continue
+            try:
+                result = fn(*args)
+            except Exception as e:
+                future._finish(exception=e)
+                continue
+            if upload is None:
+                future._finish(result)
+            elif future._set_decoded():
+                self._uploads.append((future, upload, result))
+
+    def _submit(self, fn, args, upload=None):
+        future = Future()
+        with self._lock:
+            self._submitted += 1
+        future.add_done_callback(self._completed_one)
+        self._tasks.put((future, fn, args, upload))
+        return future
+
+    def submit(self, fn, *args):
+        """Call a function on a worker thread.
+
+        Args:
+            fn (Callable[..., object]): The function to call.
+            *args: The arguments to call fn with.
+
+        Returns:
+            Future: The eventual return value of fn.
+        """
+        return self._submit(fn, args)
+
+    def load_bmp(self, path):
+        """Load a surface from a BMP file on a worker thread.
+
+        Args:
+            path (str): Path to the BMP file to load.
+
+        Returns:
+            Future: The eventual Surface.
+        """
+        return self._submit(Surface.load_bmp, (path,))
+
+    def load_image(self, path):
+        """Load a surface from an image file on a worker thread.
+
+        Args:
+            path (str): Path to the image file to load.
+
+        Returns:
+            Future: The eventual Surface.
+        """
+        return self._submit(image.load, (path,))
+
+    def load_chunk(self, path):
+        """Load an audio chunk from a file on a worker thread.
+
+        Args:
+            path (str): Path to the audio file to load.
+
+        Returns:
+            Future: The eventual Chunk.
+        """
+        return self._submit(Chunk.from_path, (path,))
+
+    def load_font(self, path, size):
+        """Read a font file on a worker thread, then open the font during upload.
+
+        Args:
+            path (str): Path to the font file to load.
+            size (int): The point size of the font.
+
+        Returns:
+            Future: The eventual Font.
+        """
+        return self._submit(_read_file, (path,), lambda font_bytes: Font(font_bytes, size))
+
+    def load_texture(self, renderer, path):
+        """Decode an image file on a worker thread, then create a texture from it during upload.
+
+        Args:
+            renderer (Renderer): The renderer to create the texture for.
+            path (str): Path to the image file to load.
+
+        Returns:
+            Future: The eventual Texture.
+        """
+        return self._submit(image.load, (path,), functools.partial(Texture.from_surface, renderer))
+
+    def upload(self, budget_ms=2.0, budget_bytes=None):
+        """Create textures for decoded images and open fonts whose files have been read, until a time or size budget is
+        spent. Call this on the thread that owns the renderers, once per frame.
+
+        At least one asset is uploaded per call if any are waiting, so loading always makes progress.
+
+        Args:
+            budget_ms (Optional[float]): The most milliseconds to spend, or None for no time limit.
+            budget_bytes (Optional[int]): The most bytes of pixels to upload, or None for no size limit.
+
+        Returns:
+            int: The number of textures and fonts uploaded.
+        """
+        uploads = self._uploads
+        deadline = None if budget_ms is None else default_timer() + budget_ms / 1000.0
+        uploaded = 0
+        spent_bytes = 0
+        while uploads:
+            future, upload, decoded = uploads[0]
+            size = _upload_bytes(decoded)
+            if uploaded:
+                if deadline is not None and default_timer() >= deadline:
+                    break
+                if budget_bytes is not None and spent_bytes + size > budget_bytes:
+                    break
+            uploads.popleft()
+            if future.cancelled():
+                continue
+            try:
+                asset = upload(decoded)
+            except Exception as e:
+                future._finish(exception=e)
+                continue
+            spent_bytes += size
+            uploaded += 1
+            future._finish(asset)
+        return uploaded
+
+    def shutdown(self, wait=True):
+        """Stop the worker threads after the loads already submitted have been decoded.
+
+        Args:
+            wait (bool): If True, wait for the workers to stop.
+        """
+        for _ in self._threads:
+            self._tasks.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
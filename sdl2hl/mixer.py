@@ -3,6 +3,7 @@ from enum import IntEnum
 from sdl2._sdl2 import lib
 from error import check_int_err, check_ptr_err
 import enumtools
+import rwops
 
 
 class AudioInitFlag(IntEnum):
@@ -28,14 +29,27 @@ class Chunk(object):
 
     @staticmethod
     def from_path(path):
-        rw = check_ptr_err(lib.SDL_RWFromFile(path, "rb"))
+        """Load a chunk from a file, or from an RWops.
+
+        Args:
+            path (Union[str, RWops]): Path to the audio file, or a stream to read it from.
+
+        Returns:
+            Chunk: The decoded audio.
+
+        Raises:
+            SDLError: If the audio cannot be loaded.
+        """
+        ptr = check_ptr_err(lib.Mix_LoadWAV_RW(*rwops._open(path)))
         chunk = object.__new__(Chunk)
-        chunk._ptr = check_ptr_err(lib.Mix_LoadWAV_RW(rw, 1))
+        chunk._ptr = ptr
         return chunk
     
     def __init__(self, audio_bytes):
-        rw = check_ptr_err(lib.SDL_RWFromConstMem(audio_bytes, len(audio_bytes)))
-        self._ptr = check_ptr_err(lib.Mix_LoadWAV_RW(rw, 1))
+        # The stream must stay open until SDL_mixer has finished reading it.
+        rw = rwops.RWops.from_buffer(audio_bytes)
+        self._ptr = check_ptr_err(lib.Mix_LoadWAV_RW(rw._ptr, 0))
+        rw.close()
         
     def __del__(self):
         lib.Mix_FreeChunk(self._ptr)
@@ -0,0 +1,270 @@
+import json
+import mmap
+import struct
+
+from sdl2._sdl2 import ffi
+import image
+from mixer import Chunk
+from pixels import PixelFormat
+from renderer import Texture, TextureAccess
+from rwops import RWops
+from surface import Surface
+from ttf import Font
+
+
+_MAGIC = b'SDLPACK1'
+_HEADER = struct.Struct('<8sQQ')
+_ALIGNMENT = 16
+
+RAW = 'raw' #: Bytes which are not loaded by SDL.
+BMP = 'bmp' #: A BMP image, loaded with Surface.load_bmp.
+IMAGE = 'image' #: An image in any format supported by SDL_image.
+PIXELS = 'pixels' #: Pixels decoded ahead of time, loaded without decoding.
+AUDIO = 'audio' #: An audio file, loaded as a Chunk.
+FONT = 'font' #: A font file.
+
+
+class PackWriter(object):
+    """Writes assets into a new pack file."""
+
+    def __init__(self, path):
+        """Create a pack file, replacing any existing file.
+
+        Args:
+            path (str): Path to the pack file.
+        """
+        self._file = open(path, 'wb')
+        self._file.write(_HEADER.pack(_MAGIC, 0, 0))
+        self._index = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write(self, name, data, kind, **info):
+        if name in self._index:
+            raise ValueError('the pack already contains {}'.format(name))
+        f = self._file
+        f.write(b'\0' * (-f.tell() % _ALIGNMENT))
+        info.update(offset=f.tell(), length=len(data), kind=kind)
+        f.write(data)
+        self._index[name] = info
+
+    def add(self, name, data, kind=RAW):
+        """Add an asset.
+
+        Args:
+            name (str): The name to look the asset up by.
+            data (bytes): The contents of the asset file.
+            kind (str): How the asset is loaded: RAW, BMP, IMAGE, AUDIO or FONT.
+
+        Raises:
+            ValueError: If the pack already contains an asset with the name.
+        """
+        self._write(name, data, kind)
+
+    def add_pixels(self, name, surface):
+        """Add the pixels of a surface, so it can be loaded without decoding.
+
+        Args:
+            name (str): The name to look the asset up by.
+            surface (Surface): The surface to store. It must not be RLE encoded.
+
+        Raises:
+            ValueError: If the pack already contains an asset with the name.
+        """
+        self._write(name, surface.pixels.tobytes(), PIXELS, w=surface.w, h=surface.h, pitch=surface.pitch,
+                    format=int(surface.format))
+
+    def close(self):
+        """Write the index and close the file. Closing a closed writer does nothing."""
+        f = self._file
+        if f.closed:
+            return
+        index = json.dumps(self._index, sort_keys=True).encode('utf-8')
+        index_offset = f.tell()
+        f.write(index)
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, index_offset, len(index)))
+        f.close()
+
+
+class PackEntry(object):
+    """The location and kind of an asset in a pack."""
+
+    __slots__ = ('name', 'offset', 'length', 'kind', 'w', 'h', 'pitch', 'format')
+
+    def __init__(self, name, info):
+        self.name = name
+        self.offset = info['offset']
+        self.length = info['length']
+        self.kind = info['kind']
+        self.w = info.get('w')
+        self.h = info.get('h')
+        self.pitch = info.get('pitch')
+        self.format = PixelFormat(info['format']) if 'format' in info else None
+
+
+class Pack(object):
+    """A pack file, memory mapped so that assets are read from it in place.
+
+    A pack file starts with a header of the magic bytes, the offset of the index and its length. The assets follow,
+    each aligned to 16 bytes, and the index comes last: a JSON object mapping each asset name to its offset, length
+    and kind, and for pre-decoded pixels, its width, height, pitch and pixel format.
+
+    The file is mapped copy-on-write, so surfaces sharing its memory can be drawn to without changing the file.
+    """
+
+    def __init__(self, path):
+        """Open a pack file.
+
+        Args:
+            path (str): Path to the pack file.
+
+        Raises:
+            ValueError: If the file is not a pack file.
+            EnvironmentError: If the file cannot be opened or mapped.
+        """
+        with open(path, 'rb') as f:
+            self._mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, index_offset, index_length = _HEADER.unpack_from(self._mapping, 0)
+        if magic != _MAGIC:
+            raise ValueError('{} is not a pack file'.format(path))
+        index = json.loads(self._mapping[index_offset:index_offset + index_length].decode('utf-8'))
+        self._entries = {name: PackEntry(name, info) for name, info in index.items()}
+        self._data = ffi.from_buffer(self._mapping)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def entry(self, name):
+        """Get the location and kind of an asset.
+
+        Args:
+            name (str): The name of the asset.
+
+        Returns:
+            PackEntry: The asset's entry in the index.
+
+        Raises:
+            KeyError: If the pack does not contain the asset.
+        """
+        return self._entries[name]
+
+    def read(self, name):
+        """Copy the contents of an asset.
+
+        Args:
+            name (str): The name of the asset.
+
+        Returns:
+            bytes: The contents of the asset.
+
+        Raises:
+            KeyError: If the pack does not contain the asset.
+        """
+        entry = self._entries[name]
+        return self._mapping[entry.offset:entry.offset + entry.length]
+
+    def rwops(self, name):
+        """Get a stream reading an asset in place.
+
+        Args:
+            name (str): The name of the asset.
+
+        Returns:
+            RWops: A stream over the asset's contents, which keeps the pack's memory mapped.
+
+        Raises:
+            KeyError: If the pack does not contain the asset.
+        """
+        entry = self._entries[name]
+        return RWops.from_buffer(self._mapping, entry.offset, entry.length)
+
+    def load_surface(self, name):
+        """Load a surface from a BMP, IMAGE or PIXELS asset.
+
+        Surfaces loaded from PIXELS assets share the pack's memory instead of copying it.
+
+        Args:
+            name (str): The name of the asset.
+
+        Returns:
+            Surface: The loaded surface.
+
+        Raises:
+            KeyError: If the pack does not contain the asset.
+            ValueError: If the asset is not an image.
+            SDLError: If the image cannot be loaded.
+        """
+        entry = self._entries[name]
+        if entry.kind == PIXELS:
+            return Surface.from_buffer(self._mapping, entry.w, entry.h, entry.pitch, entry.format, entry.offset)
+        if entry.kind == BMP:
+            return Surface.load_bmp(self.rwops(name))
+        if entry.kind == IMAGE:
+            return image.load(self.rwops(name))
+        raise ValueError('{} is a {} asset, not an image'.format(name, entry.kind))
+
+    def load_texture(self, renderer, name):
+        """Load a texture from a BMP, IMAGE or PIXELS asset.
+
+        Args:
+            renderer (Renderer): The renderer to create the texture for.
+            name (str): The name of the asset.
+
+        Returns:
+            Texture: The loaded texture.
+
+        Raises:
+            KeyError: If the pack does not contain the asset.
+            ValueError: If the asset is not an image.
+            SDLError: If the image cannot be loaded.
+        """
+        entry = self._entries[name]
+        if entry.kind == PIXELS:
+            texture = Texture(renderer, entry.format, TextureAccess.static, entry.w, entry.h)
+            texture.update(ffi.buffer(self._data + entry.offset, entry.length), pitch=entry.pitch)
+            return texture
+        if entry.kind in (BMP, IMAGE):
+            return Texture.from_surface(renderer, self.load_surface(name))
+        raise ValueError('{} is a {} asset, not an image'.format(name, entry.kind))
+
+    def load_chunk(self, name):
+        """Load an audio chunk from an asset.
+
+        Args:
+            name (str): The name of the asset.
+
+        Returns:
+            Chunk: The decoded audio.
+
+        Raises:
+            KeyError: If the pack does not contain the asset.
+            SDLError: If the audio cannot be loaded.
+        """
+        return Chunk.from_path(self.rwops(name))
+
+    def load_font(self, name, size):
+        """Open a font from an asset. The font reads from the pack's memory for as long as it is open.
+
+        Args:
+            name (str): The name of the asset.
+            size (int): The point size of the font.
+
+        Returns:
+            Font: The opened font.
+
+        Raises:
+            KeyError: If the pack does not contain the asset.
+            SDLError: If the font cannot be opened.
+        """
+        return Font.from_path(self.rwops(name), size)
@@ -0,0 +1,128 @@
+import hashlib
+import mmap
+import os
+import struct
+
+from sdl2._sdl2 import ffi
+import image
+from pixels import PixelFormat
+from renderer import Texture, TextureAccess
+
+
+_MAGIC = b'SDLPIX01'
+_HEADER = struct.Struct('<8sIIII')
+
+# Formats which can be uploaded without conversion by most renderers, in order of preference.
+_PREFERRED_FORMATS = (PixelFormat.argb8888, PixelFormat.abgr8888, PixelFormat.rgb888, PixelFormat.bgr888)
+
+
+class PixelCache(object):
+    """Stores decoded images on disk, so that later runs can upload them to textures without decoding them again.
+
+    Each image is cached in a format the renderer supports natively, in a file named after a hash of the image's path,
+    modification time and size, so editing an image invalidates its cache file. Cache files are memory mapped and
+    uploaded straight from the mapping.
+    """
+
+    def __init__(self, directory, fmt=None):
+        """Create a PixelCache, creating its directory if needed.
+
+        Args:
+            directory (str): The directory to keep cache files in.
+            fmt (Optional[PixelFormat]): The format to cache pixels in, or None to choose one of the renderer's
+                                         texture formats.
+        """
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._directory = directory
+        self._format = fmt
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self):
+        """int: The number of images loaded from the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """int: The number of images which had to be decoded."""
+        return self._misses
+
+    def _choose_format(self, renderer):
+        if self._format is not None:
+            return self._format
+        texture_formats = renderer.texture_formats
+        for fmt in _PREFERRED_FORMATS:
+            if fmt in texture_formats:
+                return fmt
+        return PixelFormat.argb8888
+
+    def _cache_path(self, path, fmt):
+        stat = os.stat(path)
+        key = '{}|{!r}|{}|{}'.format(os.path.abspath(path), stat.st_mtime, stat.st_size, int(fmt))
+        return os.path.join(self._directory, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.pix')
+
+    def _read(self, cache_path, renderer, access, fmt):
+        try:
+            f = open(cache_path, 'rb')
+        except EnvironmentError:
+            return None
+        with f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                return None
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, w, h, pitch, cached_format = _HEADER.unpack_from(mapping, 0)
+        if magic != _MAGIC or cached_format != fmt or size != _HEADER.size + h * pitch:
+            return None
+        texture = Texture(renderer, fmt, access, w, h)
+        texture.update(ffi.buffer(ffi.from_buffer(mapping) + _HEADER.size, h * pitch), pitch=pitch)
+        return texture
+
+    def _write(self, cache_path, surface):
+        temporary_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+        with open(temporary_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, surface.w, surface.h, surface.pitch, surface.format))
+            f.write(surface.pixels)
+        try:
+            os.rename(temporary_path, cache_path)
+        except OSError:
+            # Another process cached the same image first.
+            os.remove(temporary_path)
+
+    def load_texture(self, renderer, path, access=TextureAccess.static):
+        """Load an image into a texture, from the cache if it holds an up to date copy, and otherwise by decoding it
+        and caching the result.
+
+        Args:
+            renderer (Renderer): The renderer to create the texture for.
+            path (str): Path to the image file.
+            access (TextureAccess): The access of the texture.
+
+        Returns:
+            Texture: A texture containing the image.
+
+        Raises:
+            EnvironmentError: If the image file does not exist, or the cache file cannot be written.
+            SDLError: If the image cannot be decoded, or the texture cannot be created.
+        """
+        fmt = self._choose_format(renderer)
+        cache_path = self._cache_path(path, fmt)
+        texture = self._read(cache_path, renderer, access, fmt)
+        if texture is not None:
+            self._hits += 1
+            return texture
+
+        self._misses += 1
+        surface = image.load(path).convert(fmt)
+        self._write(cache_path, surface)
+        texture = Texture(renderer, fmt, access, surface.w, surface.h)
+        texture.update(surface.pixels, pitch=surface.pitch)
+        return texture
+
+    def clear(self):
+        """Delete every cache file."""
+        for name in os.listdir(self._directory):
+            if name.endswith('.pix'):
+                os.remove(os.path.join(self._directory, name))
@@ -41,3 +41,23 @@ class PixelFormat(IntEnum):
     yv12 = lib.SDL_PIXELFORMAT_YV12
     yvyu = lib.SDL_PIXELFORMAT_YVYU
 
+
+
+_PACKED_YUV_FORMATS = frozenset([PixelFormat.yuy2, PixelFormat.uyvy, PixelFormat.yvyu])
+
+
+def bytes_per_pixel(fmt):
+    """Get the number of bytes used to store a pixel in a pixel format.
+
+    Planar YUV formats store one byte of luma per pixel in their first plane, so 1 is returned for them.
+
+    Args:
+        fmt (PixelFormat): The pixel format.
+
+    Returns:
+        int: The number of bytes per pixel.
+    """
+    # Formats which are not FourCC codes have 1 in their top four bits, and their bytes per pixel in the lowest byte.
+    if fmt and (fmt >> 28) & 0x0F != 1:
+        return 2 if fmt in _PACKED_YUV_FORMATS else 1
+    return fmt & 0xFF
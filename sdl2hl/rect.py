@@ -1,9 +1,102 @@
 from sdl2._sdl2 import ffi, lib
 
 
+class _Arena(object):
+    """A reusable C array, grown as needed, used to pack wrapper objects for batched SDL calls."""
+
+    def __init__(self, ctype):
+        self._ctype = ctype + '[]'
+        self._capacity = 0
+        self._array = ffi.new(self._ctype, 0)
+
+    def reserve(self, count):
+        """Return the underlying array, growing it so it holds at least count items."""
+        if count > self._capacity:
+            self._capacity = max(count, 2 * self._capacity)
+            self._array = ffi.new(self._ctype, self._capacity)
+        return self._array
+
+
+_point_arena = _Arena('SDL_Point')
+
+_numpy_module = []
+
+
+def _numpy():
+    """Return the numpy module, or None if it is not installed. The import is only attempted once."""
+    if not _numpy_module:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy_module.append(numpy)
+    return _numpy_module[0]
+
+def _is_buffer(obj):
+    try:
+        ffi.from_buffer(obj)
+    except TypeError:
+        return False
+    return True
+
+
+_BYTE_FORMATS = ('B', 'b', 'c')
+_INT_FORMATS = ('i', 'l')
+
+
+def _buffer_format(items):
+    """Return the struct format character of the items in a buffer, without byte order, and their size in bytes."""
+    try:
+        view = memoryview(items)
+    except TypeError:
+        # Python 2's array.array and str only support the old buffer protocol.
+        typecode = getattr(items, 'typecode', None)
+        if typecode is None:
+            return 'B', 1
+        return typecode, items.itemsize
+    return view.format.lstrip('@='), view.itemsize
+
+
+def _pack(ctype, items, arena):
+    """Return a pointer to items as a C array of ctype, and the number of items.
+
+    RectArrays, PointArrays and buffers of packed 32-bit integers are used in place, without copying. Sequences of
+    wrapper objects (e.g. Rect or Point) are copied into the given arena, which is reused by the next call.
+    """
+    if isinstance(items, _StructArray):
+        if items._ctype != ctype:
+            raise TypeError('expected an array of %s, not %s' % (ctype, items._ctype))
+        return items._ptr, len(items)
+
+    try:
+        data = ffi.from_buffer(items)
+    except TypeError:
+        array = arena.reserve(len(items))
+        for i, item in enumerate(items):
+            array[i] = item._ptr[0]
+        return array, len(items)
+
+    fmt, itemsize = _buffer_format(items)
+    if not (fmt in _BYTE_FORMATS or (fmt in _INT_FORMATS and itemsize == 4)):
+        raise TypeError("buffer must contain 32-bit integers or raw bytes, not items of format '%s' (%d bytes)" %
+                        (fmt, itemsize))
+    size = ffi.sizeof(ctype)
+    if len(data) % size:
+        raise ValueError('buffer length is not a multiple of sizeof(%s)' % ctype)
+    return ffi.cast(ctype + ' *', data), len(data) // size
+
+
 class Point(object):
     """A point on a 2D plane."""
 
+    @staticmethod
+    def _from_ptr(ptr, owner=None):
+        point = object.__new__(Point)
+        point._ptr = ptr
+        # The object owning the memory ptr points into, kept alive for as long as the point.
+        point._owner = owner
+        return point
+
     def __init__(self, x=0, y=0):
         """Construct a new point.
 
@@ -42,21 +135,29 @@ class Rect(object):
     """A rectangle, with the origin at the upper left."""
 
     @staticmethod
-    def enclose_points(points, clip_rect):
+    def _from_ptr(ptr, owner=None):
+        rect = object.__new__(Rect)
+        rect._ptr = ptr
+        # The object owning the memory ptr points into, kept alive for as long as the rect.
+        rect._owner = owner
+        return rect
+
+    @staticmethod
+    def enclose_points(points, clip_rect=None):
         """Return the minimal rectangle enclosing the given set of points
 
         Args:
-            points (List[Point]): The set of points that the new Rect must enclose.
-            clip_rect (Rect): A clipping Rect.
+            points (List[Point]): The set of points that the new Rect must enclose, as Point objects, a PointArray or a
+                                  buffer of packed 32-bit (x, y) values.
+            clip_rect (Rect): A clipping Rect, or None to consider all points.
 
         Returns:
-            Rect: A new Rect enclosing the given points.
+            Rect: A new Rect enclosing the given points, or None if no points were enclosed.
         """
-        point_array = ffi.new('SDL_Point[]', len(points))
-        for i, p in enumerate(points):
-            point_array[i] = p._ptr
+        point_ptr, count = _pack('SDL_Point', points, _point_arena)
         enclosing_rect = Rect()
-        if lib.SDL_EnclosePoints(point_array, len(points), clip_rect._ptr, enclosing_rect._ptr):
+        clip_rect_ptr = ffi.NULL if clip_rect is None else clip_rect._ptr
+        if lib.SDL_EnclosePoints(point_ptr, count, clip_rect_ptr, enclosing_rect._ptr):
             return enclosing_rect
         else:
             return None
@@ -136,7 +237,7 @@ class Rect(object):
                 intersection.
         """
         intersection = Rect()
-        if lib.SDL_IntersectRect(self._ptr, self._ptr, intersection._ptr):
+        if lib.SDL_IntersectRect(self._ptr, other._ptr, intersection._ptr):
             return intersection
         else:
             return None
@@ -154,3 +255,292 @@ class Rect(object):
         lib.SDL_UnionRect(self._ptr, other._ptr, union._ptr)
         return union
          
+
+
+class _StructArray(object):
+
+    _ctype = None
+    _item_type = None
+
+    @classmethod
+    def _from_ptr(cls, ptr, length, owner):
+        array = object.__new__(cls)
+        array._ptr = ptr
+        array._length = length
+        array._owner = owner
+        return array
+
+    def __init__(self, items=0):
+        if isinstance(items, int):
+            self._owner = ffi.new(self._ctype + '[]', items)
+        elif isinstance(items, _StructArray) or _is_buffer(items):
+            item_ptr, count = _pack(self._ctype, items, None)
+            self._owner = ffi.new(self._ctype + '[]', count)
+            ffi.memmove(self._owner, item_ptr, ffi.sizeof(self._owner))
+        else:
+            items = list(items)
+            self._owner = ffi.new(self._ctype + '[]', len(items))
+            for i, item in enumerate(items):
+                self._set(self._owner, i, item)
+        self._ptr = self._owner + 0
+        self._length = len(self._owner)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                raise ValueError('slice step must be 1')
+            return self._from_ptr(self._ptr + start, max(stop - start, 0), self._owner)
+        return self._item_type._from_ptr(self._ptr + self._check_index(index), self._owner)
+
+    def __setitem__(self, index, value):
+        self._set(self._ptr, self._check_index(index), value)
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield self._item_type._from_ptr(self._ptr + i, self._owner)
+
+    def _set(self, ptr, index, value):
+        if isinstance(value, self._item_type):
+            ptr[index] = value._ptr[0]
+        else:
+            ptr[index] = tuple(value)
+
+    def _check_index(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('array index out of range')
+        return index
+
+    def _offset(self):
+        """Return the offset in bytes of the first item within the owning array."""
+        return (self._ptr - self._owner) * ffi.sizeof(self._ctype)
+
+    @property
+    def view(self):
+        """memoryview: A writable view of the raw bytes of the array, sharing its memory and keeping it alive."""
+        # The buffer is built from the owning array rather than from _ptr, so that it holds a reference to it.
+        offset = self._offset()
+        return memoryview(ffi.buffer(self._owner))[offset:offset + self._length * ffi.sizeof(self._ctype)]
+
+    def as_array(self):
+        """Return a NumPy array sharing the memory of this array. NumPy must be installed.
+
+        Returns:
+            numpy.ndarray: An int32 array with one row per item.
+        """
+        import numpy
+        fields = ffi.sizeof(self._ctype) // ffi.sizeof('int')
+        return numpy.frombuffer(ffi.buffer(self._owner), dtype=numpy.int32, count=self._length * fields,
+                                offset=self._offset()).reshape(self._length, fields)
+
+    def _unpack(self):
+        """Return the fields of every item as a flat list of ints, copied out of the array in a single call."""
+        return ffi.unpack(ffi.cast('int *', self._ptr), self._length * (ffi.sizeof(self._ctype) // ffi.sizeof('int')))
+
+    def _pack_fields(self, values):
+        """Copy a flat list of ints, as returned by _unpack, back into the array in a single call."""
+        ffi.cast('int *', self._ptr)[0:len(values)] = values
+
+    def translate(self, dx, dy):
+        """Move every item in the array, in place.
+
+        The items are moved with NumPy if it is installed. Otherwise the array is unpacked and packed again in a single
+        call each, so no C data is accessed per item.
+
+        Args:
+            dx (int): The distance to move in the x direction.
+            dy (int): The distance to move in the y direction.
+        """
+        if _numpy() is not None:
+            items = self.as_array()
+            items[:, 0] += dx
+            items[:, 1] += dy
+            return
+        fields = ffi.sizeof(self._ctype) // ffi.sizeof('int')
+        values = self._unpack()
+        values[0::fields] = [x + dx for x in values[0::fields]]
+        values[1::fields] = [y + dy for y in values[1::fields]]
+        self._pack_fields(values)
+
+
+class PointArray(_StructArray):
+    """An array of points, stored in a single contiguous block of memory."""
+
+    _ctype = 'SDL_Point'
+    _item_type = Point
+
+    def __init__(self, points=0):
+        """Construct a new PointArray.
+
+        Args:
+            points (Union[int, Iterable[Point]]): The number of points in the array (all initialized to (0, 0)), or the
+                                                  points to copy into the array, as Point objects, (x, y) tuples or a
+                                                  buffer of packed 32-bit (x, y) values.
+        """
+        super(PointArray, self).__init__(points)
+
+    def enclose(self, clip_rect=None):
+        """Return the minimal rectangle enclosing the points in this array.
+
+        Args:
+            clip_rect (Rect): A clipping Rect, or None to consider all points.
+
+        Returns:
+            Rect: A new Rect enclosing the points, or None if no points were enclosed.
+        """
+        return Rect.enclose_points(self, clip_rect)
+
+
+class RectArray(_StructArray):
+    """An array of rectangles, stored in a single contiguous block of memory.
+
+    Indexing returns a Rect that shares memory with the array, and slicing returns a RectArray that shares memory with
+    the array.
+    """
+
+    _ctype = 'SDL_Rect'
+    _item_type = Rect
+
+    def __init__(self, rects=0):
+        """Construct a new RectArray.
+
+        Args:
+            rects (Union[int, Iterable[Rect]]): The number of rectangles in the array (all initialized to
+                                                (0, 0, 0, 0)), or the rectangles to copy into the array, as Rect
+                                                objects, (x, y, w, h) tuples or a buffer of packed 32-bit
+                                                (x, y, w, h) values.
+        """
+        super(RectArray, self).__init__(rects)
+
+    def _columns(self):
+        values = self._unpack()
+        return values[0::4], values[1::4], values[2::4], values[3::4]
+
+    def _check_other(self, other):
+        if isinstance(other, RectArray) and len(other) != self._length:
+            raise ValueError('arrays must be the same length')
+
+    def _pairs(self, other):
+        """Return the columns x, y, w, h of this array followed by those of the other rectangle or array."""
+        self._check_other(other)
+        if isinstance(other, RectArray):
+            return self._columns() + other._columns()
+        other = other._ptr
+        return self._columns() + tuple([value] * self._length for value in (other.x, other.y, other.w, other.h))
+
+    def _numpy_pairs(self, numpy, other):
+        """Return this array and the other rectangle or array as int32 NumPy arrays of (x, y, w, h) rows, with the
+        corners of both, and whether each of their rectangles is empty.
+        """
+        self._check_other(other)
+        a = self.as_array()
+        if isinstance(other, RectArray):
+            b = other.as_array()
+        else:
+            b = numpy.array([[other.x, other.y, other.w, other.h]], dtype=numpy.int32)
+        a_empty = (a[:, 2] <= 0) | (a[:, 3] <= 0)
+        b_empty = (b[:, 2] <= 0) | (b[:, 3] <= 0)
+        return a, b, a[:, :2] + a[:, 2:], b[:, :2] + b[:, 2:], a_empty, b_empty
+
+    def has_intersection(self, other):
+        """Return whether each rectangle in this array intersects with another rectangle.
+
+        Like the other batched operations, this is computed with NumPy if it is installed, or otherwise in Python from
+        the array's fields, which are copied out in a single call. The results match SDL's.
+
+        Args:
+            other (Union[Rect, RectArray]): The rectangle to test intersection with, or an array of the same length
+                                            whose rectangles are tested pairwise.
+
+        Returns:
+            List[bool]: True for each rectangle with an intersection, False otherwise.
+        """
+        numpy = _numpy()
+        if numpy is not None:
+            a, b, a_end, b_end, a_empty, b_empty = self._numpy_pairs(numpy, other)
+            overlap = numpy.minimum(a_end, b_end) > numpy.maximum(a[:, :2], b[:, :2])
+            return (~a_empty & ~b_empty & overlap[:, 0] & overlap[:, 1]).tolist()
+        return [aw > 0 and ah > 0 and bw > 0 and bh > 0 and
+                (ax if ax > bx else bx) < (ax + aw if ax + aw < bx + bw else bx + bw) and
+                (ay if ay > by else by) < (ay + ah if ay + ah < by + bh else by + bh)
+                for ax, ay, aw, ah, bx, by, bw, bh in zip(*self._pairs(other))]
+
+    def intersect(self, other):
+        """Calculate the intersection of each rectangle in this array and another rectangle.
+
+        Args:
+            other (Union[Rect, RectArray]): The other rectangle, or an array of the same length whose rectangles are
+                                            intersected pairwise.
+
+        Returns:
+            RectArray: The intersections, with an empty rectangle (0, 0, 0, 0) where there is no intersection.
+        """
+        numpy = _numpy()
+        if numpy is not None:
+            a, b, a_end, b_end, a_empty, b_empty = self._numpy_pairs(numpy, other)
+            start = numpy.maximum(a[:, :2], b[:, :2])
+            size = numpy.minimum(a_end, b_end) - start
+            result = RectArray(self._length)
+            items = result.as_array()
+            items[:, :2] = start
+            items[:, 2:] = size
+            items[a_empty | b_empty | (size[:, 0] <= 0) | (size[:, 1] <= 0)] = 0
+            return result
+        values = []
+        extend = values.extend
+        for ax, ay, aw, ah, bx, by, bw, bh in zip(*self._pairs(other)):
+            x1 = ax if ax > bx else bx
+            y1 = ay if ay > by else by
+            x2 = ax + aw if ax + aw < bx + bw else bx + bw
+            y2 = ay + ah if ay + ah < by + bh else by + bh
+            if aw > 0 and ah > 0 and bw > 0 and bh > 0 and x2 > x1 and y2 > y1:
+                extend((x1, y1, x2 - x1, y2 - y1))
+            else:
+                extend((0, 0, 0, 0))
+        result = RectArray(self._length)
+        result._pack_fields(values)
+        return result
+
+    def union(self, other):
+        """Calculate the union of each rectangle in this array and another rectangle.
+
+        Args:
+            other (Union[Rect, RectArray]): The other rectangle, or an array of the same length whose rectangles are
+                                            unioned pairwise.
+
+        Returns:
+            RectArray: The unions.
+        """
+        numpy = _numpy()
+        if numpy is not None:
+            a, b, a_end, b_end, a_empty, b_empty = self._numpy_pairs(numpy, other)
+            start = numpy.minimum(a[:, :2], b[:, :2])
+            union = numpy.hstack((start, numpy.maximum(a_end, b_end) - start))
+            # An empty rectangle does not contribute to the union, as in SDL_UnionRect.
+            a_empty = a_empty[:, None]
+            b_empty = b_empty[:, None]
+            result = RectArray(self._length)
+            result.as_array()[:] = numpy.where(a_empty, numpy.where(b_empty, 0, b), numpy.where(b_empty, a, union))
+            return result
+        values = []
+        extend = values.extend
+        for ax, ay, aw, ah, bx, by, bw, bh in zip(*self._pairs(other)):
+            # An empty rectangle does not contribute to the union, as in SDL_UnionRect.
+            if aw <= 0 or ah <= 0:
+                extend((bx, by, bw, bh) if bw > 0 and bh > 0 else (0, 0, 0, 0))
+            elif bw <= 0 or bh <= 0:
+                extend((ax, ay, aw, ah))
+            else:
+                x1 = ax if ax < bx else bx
+                y1 = ay if ay < by else by
+                x2 = ax + aw if ax + aw > bx + bw else bx + bw
+                y2 = ay + ah if ay + ah > by + bh else by + bh
+                extend((x1, y1, x2 - x1, y2 - y1))
+        result = RectArray(self._length)
+        result._pack_fields(values)
+        return result
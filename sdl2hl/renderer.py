@@ -1,8 +1,9 @@
+import contextlib
 from enum import IntEnum
 
 from sdl2._sdl2 import ffi, lib
 from error import check_int_err, check_ptr_err
-from pixels import PixelFormat
+from pixels import PixelFormat, bytes_per_pixel
 import rect
 import enumtools
 
@@ -22,16 +23,57 @@ class BlendMode(IntEnum):
     none = lib.SDL_BLENDMODE_NONE
 
 
+_source_rect_arena = rect._Arena('SDL_Rect')
+_rect_arena = rect._Arena('SDL_Rect')
+_point_arena = rect._Arena('SDL_Point')
+
+
+def _varargs(items, item_type):
+    """Return the single packed array passed in place of varargs items, or items itself."""
+    if len(items) == 1 and not isinstance(items[0], item_type):
+        return items[0]
+    return items
+
+
+def _state_changed(obj, key, value):
+    """Return whether setting a state of a Renderer or Texture would change it. Always True if it is not caching state.
+    """
+    state = obj._state
+    if state is not None and key in state and state[key] == value:
+        obj._elided_calls += 1
+        return False
+    return True
+
+
+def _cache_state(obj, key, value):
+    """Cache a state of a Renderer or Texture after it has been set, if it is caching state."""
+    if obj._state is not None:
+        obj._state[key] = value
+
+
+def _decode(enum, value):
+    """Return the member of enum with the given value, or the value itself if the enum has no such member.
+
+    SDL may report values this module does not know about, such as custom blend modes from
+    SDL_ComposeCustomBlendMode, or pixel formats added by newer versions of SDL.
+    """
+    return enumtools.get_lookup(enum).get(value, value)
+
+
 class Renderer(object):
 
+    __slots__ = ('_ptr', '_surface', '_name', '_flags', '_texture_formats', '_max_texture_width', '_max_texture_height',
+                 '_state', '_elided_calls', '_render_target', '__weakref__')
+
     @staticmethod
     def _from_ptr(ptr):
         renderer = object.__new__(Renderer)
         renderer._ptr = ptr
+        renderer._init()
         return renderer
 
     @staticmethod
-    def create_software_renderer(self, surface):
+    def create_software_renderer(surface):
         """Create a 2D software rendering context for a surface.
 
         Args:
@@ -44,7 +86,9 @@ class Renderer(object):
             SDLError: If there was an error creating the renderer.
         """
         renderer = object.__new__(Renderer)
-        renderer._ptr = self._ptr = check_ptr_err(lib.SDL_CreateSoftwareRenderer(surface._ptr))
+        renderer._ptr = check_ptr_err(lib.SDL_CreateSoftwareRenderer(surface._ptr))
+        renderer._surface = surface
+        renderer._init()
         return renderer
 
     def __init__(self, window, index=-1, flags=frozenset()):
@@ -60,63 +104,152 @@ class Renderer(object):
             SDLError: If there was an error creating the renderer.
         """
         self._ptr = check_ptr_err(lib.SDL_CreateRenderer(window._ptr, index, enumtools.get_mask(flags)))
+        self._init()
 
     def __del__(self):
         lib.SDL_DestroyRenderer(self._ptr)
 
-    def _get_renderer_info(self):
+    def _init(self):
+        # The renderer info never changes, so it is queried once.
         info = ffi.new('SDL_RendererInfo *')
         check_int_err(lib.SDL_GetRendererInfo(self._ptr, info))
-        return info
+        self._name = ffi.string(info.name)
+        self._flags = enumtools.get_items(RendererFlags, info.flags)
+        self._texture_formats = frozenset(info.texture_formats[i] for i in range(info.num_texture_formats))
+        self._max_texture_width = info.max_texture_width
+        self._max_texture_height = info.max_texture_height
+        self._state = None
+        self._elided_calls = 0
+        self._render_target = None
+
+    @property
+    def cache_state(self):
+        """bool: Whether the draw color, blend mode, viewport, clip rect and render target are cached.
+
+        While caching, getters are served from the cache without calling SDL, and setters which would not change the
+        state are skipped. State changed by calling SDL directly is not seen, so only enable caching if the renderer's
+        state is only changed through this object. Disabling caching discards the cache.
+
+        SDL resets the viewport when the output is resized, so while caching, the viewport and clip rect check the
+        output size on each access and are discarded from the cache when it has changed.
+        """
+        return self._state is not None
+
+    @cache_state.setter
+    def cache_state(self, cache_state):
+        self._state = {} if cache_state else None
+
+    @property
+    def elided_calls(self):
+        """int: The number of SDL calls skipped because of state caching."""
+        return self._elided_calls
 
     @property
     def name(self):
         """str: The name of the renderer."""
-        return self._get_renderer_info().name
+        return self._name
 
     @property
     def flags(self):
-        """Set[RendererFlags]: Supported renderer flags."""
-        return enumtools.get_items(RendererFlags, self._get_renderer_info().flags)
+        """FrozenSet[RendererFlags]: Supported renderer flags."""
+        return self._flags
 
     @property
     def texture_formats(self):
-        """Set[PixelFormat]: The available texture formats."""
-        info = self._get_renderer_info()
-        return {PixelFormat(info.texture_formats[i]) for i in range(info.num_texture_formats)}
+        """Set[PixelFormat]: The available texture formats. Formats unknown to PixelFormat are given as ints."""
+        return set(_decode(PixelFormat, fmt) for fmt in self._texture_formats)
 
     @property
     def max_texture_width(self):
         """int: The maximum texture width."""
-        return self._get_renderer_info().max_texture_width
+        return self._max_texture_width
 
     @property
     def max_texture_height(self):
         """int: The maximum texture height."""
-        return self._get_renderer_info().max_texture_height
+        return self._max_texture_height
 
     @property
     def draw_color(self):
         """Tuple[int, int, int, int]: The color used for drawing operations in (red, green, blue, alpha) format."""
+        state = self._state
+        if state is not None and 'draw_color' in state:
+            return state['draw_color']
         rgba = ffi.new('Uint8[]', 4)
         check_int_err(lib.SDL_GetRenderDrawColor(self._ptr, rgba + 0, rgba + 1, rgba + 2, rgba + 3))
-        return (rgba[0], rgba[1], rgba[2], rgba[3])
+        draw_color = (rgba[0], rgba[1], rgba[2], rgba[3])
+        if state is not None:
+            state['draw_color'] = draw_color
+        return draw_color
 
     @draw_color.setter
     def draw_color(self, rgba):
         r, g, b, a = rgba
-        check_int_err(lib.SDL_SetRenderDrawColor(self._ptr, r, g, b, a))
+        if _state_changed(self, 'draw_color', (r, g, b, a)):
+            check_int_err(lib.SDL_SetRenderDrawColor(self._ptr, r, g, b, a))
+            _cache_state(self, 'draw_color', (r, g, b, a))
+
+    def _check_output_size(self):
+        # Called before using a cached viewport or clip rect, which resizing the output invalidates.
+        state = self._state
+        size = self.output_size
+        if state.get('output_size') != size:
+            state.pop('viewport', None)
+            state.pop('clip_rect', None)
+            state['output_size'] = size
+
+    def _get_rect_state(self, key, get):
+        state = self._state
+        if state is not None:
+            self._check_output_size()
+        if state is not None and key in state:
+            value = state[key]
+        else:
+            r = rect.Rect(0, 0, 0, 0)
+            get(self._ptr, r._ptr)
+            value = (r.x, r.y, r.w, r.h)
+            if state is not None:
+                state[key] = value
+        return rect.Rect(*value)
 
     @property
     def viewport(self):
         """Rect: The drawing area for rendering on the current target."""
-        viewport = rect.Rect(0, 0, 0, 0)
-        check_int_err(lib.SDL_RenderGetViewport(self._ptr, viewport._ptr))
-        return viewport
+        return self._get_rect_state('viewport', lib.SDL_RenderGetViewport)
 
     @viewport.setter
     def viewport(self, viewport):
-        check_int_err(lib.SDL_RenderSetViewport(self._ptr, viewport._ptr))
+        value = (viewport.x, viewport.y, viewport.w, viewport.h)
+        if self._state is not None:
+            self._check_output_size()
+        if _state_changed(self, 'viewport', value):
+            check_int_err(lib.SDL_RenderSetViewport(self._ptr, viewport._ptr))
+            _cache_state(self, 'viewport', value)
+
+    @property
+    def clip_rect(self):
+        """Rect: The area of the current target drawing is clipped to, or None if clipping is disabled."""
+        clip_rect = self._get_rect_state('clip_rect', lib.SDL_RenderGetClipRect)
+        if clip_rect.w == 0 or clip_rect.h == 0:
+            return None
+        return clip_rect
+
+    @clip_rect.setter
+    def clip_rect(self, clip_rect):
+        # SDL reports a disabled clip rect as an empty one.
+        value = (0, 0, 0, 0) if clip_rect is None else (clip_rect.x, clip_rect.y, clip_rect.w, clip_rect.h)
+        if self._state is not None:
+            self._check_output_size()
+        if _state_changed(self, 'clip_rect', value):
+            check_int_err(lib.SDL_RenderSetClipRect(self._ptr, ffi.NULL if clip_rect is None else clip_rect._ptr))
+            _cache_state(self, 'clip_rect', value)
+
+    @property
+    def output_size(self):
+        """Tuple[int, int]: The width and height of the rendering output in pixels."""
+        size = ffi.new('int[]', 2)
+        check_int_err(lib.SDL_GetRendererOutputSize(self._ptr, size + 0, size + 1))
+        return (size[0], size[1])
 
     @property
     def render_target_supported(self):
@@ -126,11 +259,21 @@ class Renderer(object):
     @property
     def render_target(self):
         """Texture: The current render target, or None if using the default render target."""
+        state = self._state
+        if state is not None and 'render_target' in state:
+            return self._render_target
         render_target = lib.SDL_GetRenderTarget(self._ptr)
         if render_target == ffi.NULL:
-            return None
+            texture = None
+        elif self._render_target is not None and self._render_target._ptr == render_target:
+            # Return the texture that was set, rather than a second wrapper which would also destroy it.
+            texture = self._render_target
         else:
-            return Texture._from_ptr(render_target)
+            texture = Texture._from_ptr(render_target)
+        if state is not None:
+            state['render_target'] = render_target
+            self._render_target = texture
+        return texture
 
     @render_target.setter
     def render_target(self, texture):
@@ -138,18 +281,32 @@ class Renderer(object):
             p = texture._ptr
         else:
             p = ffi.NULL
-        check_int_err(lib.SDL_SetRenderTarget(self._ptr, p))
+        if _state_changed(self, 'render_target', p):
+            check_int_err(lib.SDL_SetRenderTarget(self._ptr, p))
+            self._render_target = texture
+            _cache_state(self, 'render_target', p)
+            if self._state is not None:
+                # Changing the target resets the viewport and clip rect.
+                self._state.pop('viewport', None)
+                self._state.pop('clip_rect', None)
 
     @property
     def blend_mode(self):
-        """BlendMode: The blend mode used for drawing operations."""
+        """BlendMode: The blend mode used for drawing operations, or an int for a custom blend mode."""
+        state = self._state
+        if state is not None and 'blend_mode' in state:
+            return _decode(BlendMode, state['blend_mode'])
         blend_mode_ptr = ffi.new('int *')
         check_int_err(lib.SDL_GetRenderDrawBlendMode(self._ptr, blend_mode_ptr))
-        return BlendMode(blend_mode_ptr[0])
+        if state is not None:
+            state['blend_mode'] = blend_mode_ptr[0]
+        return _decode(BlendMode, blend_mode_ptr[0])
 
     @blend_mode.setter
     def blend_mode(self, blend_mode):
-        check_int_err(lib.SDL_SetRenderDrawBlendMode(self._ptr, blend_mode))
+        if _state_changed(self, 'blend_mode', blend_mode):
+            check_int_err(lib.SDL_SetRenderDrawBlendMode(self._ptr, blend_mode))
+            _cache_state(self, 'blend_mode', int(blend_mode))
 
     def clear(self):
         """Clear the current rendering target with the drawing color.
@@ -179,15 +336,16 @@ class Renderer(object):
         """Draw a series of connected lines on the current rendering target.
 
         Args:
-            *points (Point): The points along the lines.
+            *points (Point): The points along the lines, or a single buffer of packed 32-bit (x, y) values (e.g.
+                             array.array('i') or an int32 NumPy array of shape Nx2), which is used without copying.
 
         Raises:
+            TypeError: If a buffer of items other than 32-bit integers or bytes is given.
+            ValueError: If a buffer of the wrong size is given.
             SDLError: If an error is encountered.
         """
-        point_array = ffi.new('SDL_Point[]', len(points))
-        for i, p in enumerate(points):
-            point_array[i] = p._ptr[0]
-        check_int_err(lib.SDL_RenderDrawLines(self._ptr, point_array, len(points)))
+        point_ptr, count = rect._pack('SDL_Point', _varargs(points, rect.Point), _point_arena)
+        check_int_err(lib.SDL_RenderDrawLines(self._ptr, point_ptr, count))
 
     def draw_point(self, x, y):
         """Draw a point on the current rendering target.
@@ -205,15 +363,16 @@ class Renderer(object):
         """Draw multiple points on the current rendering target.
 
         Args:
-            *points (Point): The points to draw.
+            *points (Point): The points to draw, or a single buffer of packed 32-bit (x, y) values (e.g.
+                             array.array('i') or an int32 NumPy array of shape Nx2), which is used without copying.
 
         Raises:
+            TypeError: If a buffer of items other than 32-bit integers or bytes is given.
+            ValueError: If a buffer of the wrong size is given.
             SDLError: If an error is encountered.
         """
-        point_array = ffi.new('SDL_Point[]', len(points))
-        for i, p in enumerate(points):
-            point_array[i] = p._ptr[0]
-        check_int_err(lib.SDL_RenderDrawPoints(self._ptr, point_array, len(points)))
+        point_ptr, count = rect._pack('SDL_Point', _varargs(points, rect.Point), _point_arena)
+        check_int_err(lib.SDL_RenderDrawPoints(self._ptr, point_ptr, count))
 
     def draw_rect(self, rect):
         """Draw a rectangle on the current rendering target.
@@ -230,15 +389,16 @@ class Renderer(object):
         """Draw some number of rectangles on the current rendering target.
 
         Args:
-            *rects (Rect): The destination rectangles.
+            *rects (Rect): The destination rectangles, or a single buffer of packed 32-bit (x, y, w, h) values (e.g.
+                           array.array('i') or an int32 NumPy array of shape Nx4), which is used without copying.
 
         Raises:
+            TypeError: If a buffer of items other than 32-bit integers or bytes is given.
+            ValueError: If a buffer of the wrong size is given.
             SDLError: If an error is encountered.
         """
-        rect_array = ffi.new('SDL_Rect[]', len(rects))
-        for i, r in enumerate(rects):
-            rect_array[i] = r._ptr[0]
-        check_int_err(lib.SDL_RenderDrawRects(self._ptr, rect_array, len(rects)))
+        rect_ptr, count = rect._pack('SDL_Rect', _varargs(rects, rect.Rect), _rect_arena)
+        check_int_err(lib.SDL_RenderDrawRects(self._ptr, rect_ptr, count))
 
     def fill_rect(self, rect):
         """Fill a rectangle on the current rendering target with the drawing color.
@@ -255,15 +415,16 @@ class Renderer(object):
         """Fill some number of rectangles on the current rendering target with the drawing color.
 
         Args:
-            *rects (Rect): The destination rectangles.
+            *rects (Rect): The destination rectangles, or a single buffer of packed 32-bit (x, y, w, h) values (e.g.
+                           array.array('i') or an int32 NumPy array of shape Nx4), which is used without copying.
 
         Raises:
+            TypeError: If a buffer of items other than 32-bit integers or bytes is given.
+            ValueError: If a buffer of the wrong size is given.
             SDLError: If an error is encountered.
         """
-        rect_array = ffi.new('SDL_Rect[]', len(rects))
-        for i, r in enumerate(rects):
-            rect_array[i] = r._ptr[0]
-        check_int_err(lib.SDL_RenderFillRects(self._ptr, rect_array, len(rects)))
+        rect_ptr, count = rect._pack('SDL_Rect', _varargs(rects, rect.Rect), _rect_arena)
+        check_int_err(lib.SDL_RenderFillRects(self._ptr, rect_ptr, count))
 
     def copy(self, texture, source_rect=None, dest_rect=None, rotation=0, center=None, flip=lib.SDL_FLIP_NONE):
         """Copy a portion of the source texture to the current rendering target, rotating it by angle around the given center.
@@ -297,6 +458,67 @@ class Renderer(object):
             
         check_int_err(lib.SDL_RenderCopyEx(self._ptr, texture._ptr, source_rect_ptr, dest_rect_ptr, rotation, center_ptr, flip))
 
+    def copy_many(self, texture, source_rects=None, dest_rects=None, rotations=None, centers=None, flips=None):
+        """Copy many portions of the source texture to the current rendering target.
+
+        The rectangles are packed into C arrays once per call, so no Python objects are created per copy. Buffers of
+        packed 32-bit integers (e.g. array.array('i') or an int32 NumPy array of shape Nx4) are used without copying.
+        Rotation and flipping are only performed if rotations, centers or flips are given.
+
+        Args:
+            texture (Texture): The source texture.
+            source_rects (Iterable[Rect]): The source rectangles, as Rect objects or a buffer of packed (x, y, w, h)
+                                           values, or None to copy the entire texture each time.
+            dest_rects (Iterable[Rect]): The destination rectangles, as Rect objects or a buffer of packed
+                                         (x, y, w, h) values, or None to copy to the entire rendering target each time.
+            rotations (Sequence[float]): The angle in degrees each dest_rect will be rotated by, or None for no rotation.
+            centers (Iterable[Point]): The points around which each dest_rect will be rotated, as Point objects or a
+                                       buffer of packed (x, y) values, or None to rotate around the center of each
+                                       dest_rect.
+            flips (Sequence[int]): The flipping actions performed on each copy, or None for no flipping.
+
+        Raises:
+            TypeError: If a buffer of items other than 32-bit integers or bytes is given.
+            ValueError: If the given sequences have different lengths, or none of them were given.
+            SDLError: If an error is encountered.
+        """
+        counts = set()
+        source_ptr = dest_ptr = center_ptr = None
+        if source_rects is not None:
+            source_ptr, count = rect._pack('SDL_Rect', source_rects, _source_rect_arena)
+            counts.add(count)
+        if dest_rects is not None:
+            dest_ptr, count = rect._pack('SDL_Rect', dest_rects, _rect_arena)
+            counts.add(count)
+        if centers is not None:
+            center_ptr, count = rect._pack('SDL_Point', centers, _point_arena)
+            counts.add(count)
+        if rotations is not None:
+            counts.add(len(rotations))
+        if flips is not None:
+            counts.add(len(flips))
+        if len(counts) != 1:
+            raise ValueError('copy_many requires sequences of equal length')
+        count = counts.pop()
+
+        renderer_ptr = self._ptr
+        texture_ptr = texture._ptr
+        if rotations is None and centers is None and flips is None:
+            render_copy = lib.SDL_RenderCopy
+            for i in range(count):
+                check_int_err(render_copy(renderer_ptr, texture_ptr,
+                                          ffi.NULL if source_ptr is None else source_ptr + i,
+                                          ffi.NULL if dest_ptr is None else dest_ptr + i))
+        else:
+            render_copy_ex = lib.SDL_RenderCopyEx
+            for i in range(count):
+                check_int_err(render_copy_ex(renderer_ptr, texture_ptr,
+                                             ffi.NULL if source_ptr is None else source_ptr + i,
+                                             ffi.NULL if dest_ptr is None else dest_ptr + i,
+                                             0 if rotations is None else rotations[i],
+                                             ffi.NULL if center_ptr is None else center_ptr + i,
+                                             lib.SDL_FLIP_NONE if flips is None else flips[i]))
+
     def present(self):
         """Update the screen with rendering performed."""
         lib.SDL_RenderPresent(self._ptr)
@@ -310,10 +532,13 @@ class TextureAccess(IntEnum):
 
 class Texture(object):
 
+    __slots__ = ('_ptr', '_format', '_access', '_w', '_h', '_state', '_elided_calls', '__weakref__')
+
     @staticmethod
     def _from_ptr(ptr):
         renderer = object.__new__(Texture)
         renderer._ptr = ptr
+        renderer._init()
         return renderer
 
     @staticmethod
@@ -331,6 +556,7 @@ class Texture(object):
         """
         texture = object.__new__(Texture)
         texture._ptr = check_ptr_err(lib.SDL_CreateTextureFromSurface(renderer._ptr, surface._ptr))
+        texture._init()
         return texture
 
     def __init__(self, renderer, fmt, access, w, h):
@@ -348,73 +574,186 @@ class Texture(object):
                       of range.
         """
         self._ptr = check_ptr_err(lib.SDL_CreateTexture(renderer._ptr, fmt, access, w, h))
+        self._init()
 
     def __del__(self):
         lib.SDL_DestroyTexture(self._ptr)
 
+    def _init(self):
+        # The format, access and size of a texture never change, so they are queried once.
+        fmt = ffi.new('Uint32 *')
+        access_w_h = ffi.new('int[]', 3)
+        check_int_err(lib.SDL_QueryTexture(self._ptr, fmt, access_w_h + 0, access_w_h + 1, access_w_h + 2))
+        self._format = fmt[0]
+        self._access = access_w_h[0]
+        self._w = access_w_h[1]
+        self._h = access_w_h[2]
+        self._state = None
+        self._elided_calls = 0
+
+    @property
+    def cache_state(self):
+        """bool: Whether the color mod, alpha mod and blend mode are cached.
+
+        While caching, getters are served from the cache without calling SDL, and setters which would not change the
+        state are skipped. Disabling caching discards the cache.
+        """
+        return self._state is not None
+
+    @cache_state.setter
+    def cache_state(self, cache_state):
+        self._state = {} if cache_state else None
+
+    @property
+    def elided_calls(self):
+        """int: The number of SDL calls skipped because of state caching."""
+        return self._elided_calls
+
     @property
     def format(self):
         """PixelFormat: The raw format of the texture. The actual format may differ, but pixel transfers will use this
-                        format.
+                        format. A format unknown to PixelFormat is given as an int.
         """
-        fmt = ffi.new('Uint32 *')
-        check_int_err(lib.SDL_QueryTexture(self._ptr, fmt, ffi.NULL, ffi.NULL, ffi.NULL))
-        return PixelFormat(fmt[0])
+        return _decode(PixelFormat, self._format)
 
     @property
     def access(self):
         """TextureAccess: The actual access to the texture."""
-        access = ffi.new('int *')
-        check_int_err(lib.SDL_QueryTexture(self._ptr, ffi.NULL, access, ffi.NULL, ffi.NULL))
-        return TextureAccess(access[0])
+        return _decode(TextureAccess, self._access)
 
     @property
     def w(self):
         """int: The width of the texture in pixels."""
-        w = ffi.new('int *')
-        check_int_err(lib.SDL_QueryTexture(self._ptr, ffi.NULL, ffi.NULL, w, ffi.NULL))
-        return w[0]
+        return self._w
 
     @property
     def h(self):
         """int: The height of the texture in pixels."""
-        h = ffi.new('int *')
-        check_int_err(lib.SDL_QueryTexture(self._ptr, ffi.NULL, ffi.NULL, ffi.NULL, h))
-        return h[0]
+        return self._h
+
+    def query(self):
+        """Get the attributes of the texture, which are fixed when it is created.
+
+        Returns:
+            Tuple[PixelFormat, TextureAccess, int, int]: The format, access, width and height of the texture.
+        """
+        return self.format, self.access, self._w, self._h
 
     @property
     def color_mod(self):
         """Tuple[int, int, int]: The additional color value used in render copy operations in (red, green, blue)
                                  format.
         """
+        state = self._state
+        if state is not None and 'color_mod' in state:
+            return state['color_mod']
         rgb = ffi.new('Uint8[]', 3)
         check_int_err(lib.SDL_GetTextureColorMod(self._ptr, rgb + 0, rgb + 1, rgb + 2))
-        return (rgb[0], rgb[1], rgb[2])
+        color_mod = (rgb[0], rgb[1], rgb[2])
+        if state is not None:
+            state['color_mod'] = color_mod
+        return color_mod
 
     @color_mod.setter
     def color_mod(self, rgb):
         r, g, b = rgb
-        check_int_err(lib.SDL_SetTextureColorMod(self._ptr, r, g, b))
+        if _state_changed(self, 'color_mod', (r, g, b)):
+            check_int_err(lib.SDL_SetTextureColorMod(self._ptr, r, g, b))
+            _cache_state(self, 'color_mod', (r, g, b))
 
     @property
     def alpha_mod(self):
         """int: The additional alpha value used in render copy operations."""
+        state = self._state
+        if state is not None and 'alpha_mod' in state:
+            return state['alpha_mod']
         a = ffi.new('Uint8 *')
         check_int_err(lib.SDL_GetTextureAlphaMod(self._ptr, a))
+        if state is not None:
+            state['alpha_mod'] = a[0]
         return a[0]
 
     @alpha_mod.setter
     def alpha_mod(self, a):
-        check_int_err(lib.SDL_SetTextureAlphaMod(self._ptr, a))
+        if _state_changed(self, 'alpha_mod', a):
+            check_int_err(lib.SDL_SetTextureAlphaMod(self._ptr, a))
+            _cache_state(self, 'alpha_mod', a)
 
     @property
     def blend_mode(self):
-        """BlendMode: The blend mode used for drawing operations."""
+        """BlendMode: The blend mode used for drawing operations, or an int for a custom blend mode."""
+        state = self._state
+        if state is not None and 'blend_mode' in state:
+            return _decode(BlendMode, state['blend_mode'])
         blend_mode_ptr = ffi.new('int *')
         lib.SDL_GetTextureBlendMode(self._ptr, blend_mode_ptr)
-        return BlendMode(blend_mode_ptr[0])
+        if state is not None:
+            state['blend_mode'] = blend_mode_ptr[0]
+        return _decode(BlendMode, blend_mode_ptr[0])
 
     @blend_mode.setter
     def blend_mode(self, blend_mode):
-        check_int_err(lib.SDL_SetTextureBlendMode(self._ptr, blend_mode))
-    
+        if _state_changed(self, 'blend_mode', blend_mode):
+            check_int_err(lib.SDL_SetTextureBlendMode(self._ptr, blend_mode))
+            _cache_state(self, 'blend_mode', int(blend_mode))
+
+    def _size(self, rect):
+        if rect is not None:
+            return rect.w, rect.h
+        return self._w, self._h
+
+    @contextlib.contextmanager
+    def lock(self, rect=None):
+        """Lock a portion of a streaming texture for write-only pixel access, and unlock it on leaving the with block.
+
+        The pixels are written straight into the texture's memory, so nothing is allocated or copied per frame. Their
+        initial contents are undefined, and the memoryview is only valid inside the with block::
+
+            with texture.lock() as (pixels, pitch):
+                pixels[0:4] = b'\xff\x00\x00\xff'
+
+        Args:
+            rect (Rect): The area to lock, or None to lock the entire texture.
+
+        Yields:
+            Tuple[memoryview, int]: The locked pixels as bytes, and the length of a row of them in bytes.
+
+        Raises:
+            SDLError: If the texture is not a streaming texture or is already locked.
+        """
+        pixels = ffi.new('void **')
+        pitch = ffi.new('int *')
+        check_int_err(lib.SDL_LockTexture(self._ptr, ffi.NULL if rect is None else rect._ptr, pixels, pitch))
+        try:
+            w, h = self._size(rect)
+            # The last row of a locked rect may end at the end of the texture's memory, so exclude its padding.
+            size = (h - 1) * pitch[0] + w * bytes_per_pixel(self._format) if h else 0
+            yield memoryview(ffi.buffer(pixels[0], size)), pitch[0]
+        finally:
+            lib.SDL_UnlockTexture(self._ptr)
+
+    def update(self, pixels, rect=None, pitch=None):
+        """Replace a portion of the texture with new pixels, in the format of the texture.
+
+        This is a fairly slow function, intended for static textures that do not change often. Streaming textures are
+        better filled with lock.
+
+        Args:
+            pixels (buffer): Any object supporting the buffer protocol, such as bytes, bytearray, array.array, a
+                             memoryview or a NumPy array, containing the pixel data.
+            rect (Rect): The area to update, or None to update the entire texture.
+            pitch (Optional[int]): The length of a row of pixels in bytes, or None if rows are tightly packed.
+
+        Raises:
+            ValueError: If pixels is too small for the area.
+            SDLError: If the texture cannot be updated.
+        """
+        w, h = self._size(rect)
+        row = w * bytes_per_pixel(self._format)
+        if pitch is None:
+            pitch = row
+        data = ffi.from_buffer(pixels)
+        if h and len(data) < (h - 1) * pitch + row:
+            raise ValueError('{} bytes of pixels is too small to update {}x{} pixels with a pitch of {}'.format(
+                len(data), w, h, pitch))
+        check_int_err(lib.SDL_UpdateTexture(self._ptr, ffi.NULL if rect is None else rect._ptr, data, pitch))
@@ -0,0 +1,229 @@
+import collections
+import os
+
+import image
+from mixer import Chunk
+from pixels import bytes_per_pixel
+from surface import Surface
+from ttf import Font
+
+
+class _Entry(object):
+
+    __slots__ = ('key', 'asset', 'references', 'nbytes')
+
+
+def _surface_bytes(surface):
+    return surface.h * surface.pitch
+
+def _texture_bytes(texture):
+    return texture.w * texture.h * bytes_per_pixel(texture.format)
+
+def _chunk_bytes(chunk):
+    return chunk._ptr.alen
+
+
+class ResourceManager(object):
+    """Loads each asset once and shares it between everything that acquires it.
+
+    Assets are reference counted: acquire one with an acquire method and release it when done with it. Released assets
+    stay cached, so acquiring them again is free, until the total size of all cached assets exceeds the budget; then
+    the least recently released assets are dropped. Assets still referenced are never dropped, so the budget can be
+    exceeded while they are in use.
+    """
+
+    def __init__(self, renderer=None, budget=256 * 1024 * 1024):
+        """Create an empty ResourceManager.
+
+        Args:
+            renderer (Optional[Renderer]): The renderer textures are created for, required for acquire_texture.
+            budget (int): The most bytes of assets to keep cached.
+        """
+        self._renderer = renderer
+        self._budget = budget
+        self._entries = {}
+        self._asset_keys = {}
+        self._unreferenced = collections.OrderedDict()
+        self._bytes_by_kind = collections.defaultdict(int)
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def budget(self):
+        """int: The most bytes of assets to keep cached."""
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget):
+        self._budget = budget
+        self._evict()
+
+    @property
+    def hits(self):
+        """int: The number of acquisitions of an asset which was already loaded."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """int: The number of acquisitions which loaded an asset."""
+        return self._misses
+
+    @property
+    def evictions(self):
+        """int: The number of released assets dropped to stay within the budget."""
+        return self._evictions
+
+    @property
+    def bytes(self):
+        """int: The estimated size of every cached asset in bytes."""
+        return self._bytes
+
+    @property
+    def bytes_by_kind(self):
+        """Dict[str, int]: The estimated size of the cached assets in bytes, by kind of asset ('surface', 'texture',
+                           'font' or 'chunk').
+        """
+        return dict(self._bytes_by_kind)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _acquire(self, kind, path, params, load, measure):
+        key = (kind, os.path.abspath(path)) + params
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._hits += 1
+            self._unreferenced.pop(key, None)
+            entry.references += 1
+            return entry.asset
+
+        self._misses += 1
+        asset = load()
+        entry = _Entry()
+        entry.key = key
+        entry.asset = asset
+        entry.references = 1
+        entry.nbytes = measure(asset)
+        self._entries[key] = entry
+        self._asset_keys[id(asset)] = key
+        self._bytes += entry.nbytes
+        self._bytes_by_kind[kind] += entry.nbytes
+        self._evict()
+        return asset
+
+    def acquire_surface(self, path):
+        """Get the surface loaded from an image file, loading it if needed.
+
+        Args:
+            path (str): Path to the image file.
+
+        Returns:
+            Surface: The shared surface.
+
+        Raises:
+            SDLError: If the file cannot be loaded.
+        """
+        return self._acquire('surface', path, (), lambda: image.load(path), _surface_bytes)
+
+    def acquire_bmp(self, path):
+        """Get the surface loaded from a BMP file, loading it if needed.
+
+        Args:
+            path (str): Path to the BMP file.
+
+        Returns:
+            Surface: The shared surface.
+
+        Raises:
+            SDLError: If the file cannot be loaded.
+        """
+        return self._acquire('surface', path, ('bmp',), lambda: Surface.load_bmp(path), _surface_bytes)
+
+    def acquire_texture(self, path):
+        """Get the texture loaded from an image file, loading it if needed.
+
+        Args:
+            path (str): Path to the image file.
+
+        Returns:
+            Texture: The shared texture.
+
+        Raises:
+            ValueError: If the manager was created without a renderer.
+            SDLError: If the file cannot be loaded.
+        """
+        if self._renderer is None:
+            raise ValueError('textures require a ResourceManager created with a renderer')
+        return self._acquire('texture', path, (), lambda: image.load_texture(self._renderer, path), _texture_bytes)
+
+    def acquire_font(self, path, size):
+        """Get a font at a point size, loading it if needed.
+
+        The size of a font is estimated as the size of its file.
+
+        Args:
+            path (str): Path to the font file.
+            size (int): The point size of the font.
+
+        Returns:
+            Font: The shared font.
+
+        Raises:
+            SDLError: If the file cannot be loaded.
+        """
+        return self._acquire('font', path, (size,), lambda: Font.from_path(path, size),
+                             lambda font: os.path.getsize(path))
+
+    def acquire_chunk(self, path):
+        """Get the audio chunk loaded from a file, loading it if needed.
+
+        Args:
+            path (str): Path to the audio file.
+
+        Returns:
+            Chunk: The shared chunk.
+
+        Raises:
+            SDLError: If the file cannot be loaded.
+        """
+        return self._acquire('chunk', path, (), lambda: Chunk.from_path(path), _chunk_bytes)
+
+    def release(self, asset):
+        """Release a reference to an asset acquired from this manager.
+
+        Args:
+            asset (object): The asset to release.
+
+        Raises:
+            ValueError: If the asset was not acquired from this manager, or has been released more times than it was
+                        acquired.
+        """
+        key = self._asset_keys.get(id(asset))
+        entry = self._entries.get(key)
+        if entry is None or entry.asset is not asset or entry.references == 0:
+            raise ValueError('asset is not acquired from this ResourceManager')
+        entry.references -= 1
+        if entry.references == 0:
+            self._unreferenced[key] = entry
+            self._evict()
+
+    def _evict(self):
+        unreferenced = self._unreferenced
+        while self._bytes > self._budget and unreferenced:
+            key, entry = unreferenced.popitem(last=False)
+            self._drop(entry)
+            self._evictions += 1
+
+    def _drop(self, entry):
+        del self._entries[entry.key]
+        del self._asset_keys[id(entry.asset)]
+        self._bytes -= entry.nbytes
+        self._bytes_by_kind[entry.key[0]] -= entry.nbytes
+
+    def clear(self):
+        """Drop every cached asset which is not referenced."""
+        while self._unreferenced:
+            _, entry = self._unreferenced.popitem()
+            self._drop(entry)
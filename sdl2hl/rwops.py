@@ -0,0 +1,136 @@
+import mmap
+import os
+
+from sdl2._sdl2 import ffi, lib
+from error import check_int_err, check_ptr_err
+
+
+class RWops(object):
+    """A stream of data for SDL to load assets from: a file, or a block of memory read in place.
+
+    Loaders read from the current position of the stream, and leave it after the data they read. Memory streams keep
+    the object they read from alive for as long as the RWops exists.
+    """
+
+    @staticmethod
+    def from_path(path, mode='rb'):
+        """Open a file.
+
+        Args:
+            path (str): Path to the file.
+            mode (str): The mode to open the file in, as for fopen.
+
+        Returns:
+            RWops: A stream reading from the file.
+
+        Raises:
+            SDLError: If the file cannot be opened.
+        """
+        ptr = check_ptr_err(lib.SDL_RWFromFile(path, mode))
+        rwops = object.__new__(RWops)
+        rwops._ptr = ptr
+        rwops._buffer = None
+        return rwops
+
+    @staticmethod
+    def from_buffer(buffer, offset=0, length=None):
+        """Read from an object supporting the buffer protocol, such as bytes, a memoryview or an mmap, without copying
+        it.
+
+        Args:
+            buffer (object): The object to read from. It must not be resized while the RWops exists.
+            offset (int): The offset in bytes of the data within the buffer.
+            length (Optional[int]): The length in bytes of the data, or None to read to the end of the buffer.
+
+        Returns:
+            RWops: A stream reading from the buffer.
+
+        Raises:
+            ValueError: If offset and length do not lie within the buffer.
+            SDLError: If the stream cannot be created.
+        """
+        data = ffi.from_buffer(buffer)
+        if length is None:
+            length = len(data) - offset
+        if offset < 0 or length < 0 or offset + length > len(data):
+            raise ValueError('offset {} and length {} are outside a buffer of {} bytes'.format(offset, length,
+                                                                                              len(data)))
+        ptr = check_ptr_err(lib.SDL_RWFromConstMem(data + offset, length))
+        rwops = object.__new__(RWops)
+        rwops._ptr = ptr
+        rwops._buffer = data
+        return rwops
+
+    @staticmethod
+    def from_mmap(path, offset=0, length=None):
+        """Map a file into memory and read from it in place.
+
+        Pages of the file are only read from disk when they are accessed, and are shared with other processes mapping
+        the same file.
+
+        Args:
+            path (str): Path to the file.
+            offset (int): The offset in bytes of the data within the file.
+            length (Optional[int]): The length in bytes of the data, or None to read to the end of the file.
+
+        Returns:
+            RWops: A stream reading from the mapped file.
+
+        Raises:
+            ValueError: If offset and length do not lie within the file.
+            EnvironmentError: If the file cannot be mapped.
+        """
+        with open(path, 'rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return RWops.from_buffer(mapping, offset, length)
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Close the stream and release the buffer it reads from. Closing a closed stream does nothing.
+
+        Raises:
+            SDLError: If an error occurred while closing a file.
+        """
+        ptr = self._ptr
+        if ptr != ffi.NULL:
+            self._ptr = ffi.NULL
+            self._buffer = None
+            check_int_err(ptr.close(ptr))
+
+    @property
+    def size(self):
+        """int: The size of the data in bytes."""
+        return check_int_err(self._ptr.size(self._ptr))
+
+    def tell(self):
+        """Get the current position in the stream.
+
+        Returns:
+            int: The current position in bytes.
+        """
+        return self.seek(0, os.SEEK_CUR)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move to a position in the stream.
+
+        Args:
+            offset (int): The offset in bytes, relative to whence.
+            whence (int): os.SEEK_SET, os.SEEK_CUR or os.SEEK_END, which have the same values as SDL's RW_SEEK_SET,
+                          RW_SEEK_CUR and RW_SEEK_END.
+
+        Returns:
+            int: The new position in bytes.
+
+        Raises:
+            SDLError: If the stream cannot seek.
+        """
+        return check_int_err(self._ptr.seek(self._ptr, offset, whence))
+
+
+def _open(source):
+    """Return an SDL_RWops pointer for a path or RWops, and whether the loader should close it when done."""
+    if isinstance(source, RWops):
+        return source._ptr, 0
+    return check_ptr_err(lib.SDL_RWFromFile(source, "rb")), 1
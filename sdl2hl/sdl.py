@@ -40,10 +40,10 @@ def was_init():
     """This function returns the subsystems which have previously been initialized.
 
     Returns:
-        Set[InitFlag]: Flags indicating which subsystems have been initialized.
+        FrozenSet[InitFlag]: Flags indicating which subsystems have been initialized.
     """
     mask = lib.SDL_WasInit(0)
-    return enumtools.get_items(InitFlags, mask, {InitFlags.everything})
+    return enumtools.get_items(InitFlag, mask, frozenset([InitFlag.everything]))
 
 def quit():
     """ This function cleans up all initialized subsystems. You should call it upon all exit conditions."""
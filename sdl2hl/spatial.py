@@ -0,0 +1,525 @@
+from rect import Rect
+
+
+def _bounds(rect):
+    """Return the (x, y, w, h) bounds of a Rect or an (x, y, w, h) sequence."""
+    if isinstance(rect, Rect):
+        ptr = rect._ptr
+        return (ptr.x, ptr.y, ptr.w, ptr.h)
+    x, y, w, h = rect
+    return (x, y, w, h)
+
+
+def _overlaps(a, b):
+    """Return whether two (x, y, w, h) bounds intersect, with the same semantics as Rect.has_intersection."""
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return (aw > 0 and ah > 0 and bw > 0 and bh > 0 and
+            ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah)
+
+
+def _contains_point(bounds, x, y):
+    rx, ry, rw, rh = bounds
+    return rx <= x < rx + rw and ry <= y < ry + rh
+
+
+class _SpatialIndex(object):
+
+    @classmethod
+    def from_rect_array(cls, rects, *args, **kwargs):
+        """Create an index containing every rectangle in a RectArray, keyed by row index.
+
+        Args:
+            rects (RectArray): The rectangles to index.
+            *args: Passed to the index constructor.
+            **kwargs: Passed to the index constructor.
+
+        Returns:
+            An index whose keys are the row indices of rects.
+        """
+        index = cls(*args, **kwargs)
+        ptr = rects._ptr
+        for i in range(len(rects)):
+            r = ptr[i]
+            index.insert(i, (r.x, r.y, r.w, r.h))
+        return index
+
+    def __init__(self):
+        self._bounds = {}
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def __contains__(self, key):
+        return key in self._bounds
+
+    def __iter__(self):
+        return iter(self._bounds)
+
+    def bounds(self, key):
+        """Return the bounds stored for a key.
+
+        Args:
+            key (Hashable): The key of the rectangle.
+
+        Returns:
+            Tuple[int, int, int, int]: The (x, y, w, h) bounds of the rectangle.
+
+        Raises:
+            KeyError: If the key is not in the index.
+        """
+        return self._bounds[key]
+
+
+class SpatialHash(_SpatialIndex):
+    """A uniform grid of cells used to quickly find overlapping rectangles.
+
+    Each rectangle is stored under a key in every cell it covers, so queries only need to test rectangles which share
+    a cell. This works best when cell_size is a little larger than a typical rectangle. Rectangles may be given as
+    Rect objects or (x, y, w, h) tuples.
+    """
+
+    def __init__(self, cell_size=64):
+        """Create an empty spatial hash.
+
+        Args:
+            cell_size (int): The width and height of each grid cell.
+        """
+        super(SpatialHash, self).__init__()
+        self._cell_size = cell_size
+        self._cells = {}
+        self._cell_ranges = {}
+
+    @property
+    def cell_size(self):
+        """int: The width and height of each grid cell."""
+        return self._cell_size
+
+    def _cell_range(self, bounds):
+        x, y, w, h = bounds
+        if w <= 0 or h <= 0:
+            return None
+        size = self._cell_size
+        return (x // size, y // size, (x + w - 1) // size, (y + h - 1) // size)
+
+    def _add_to_cells(self, key, cell_range):
+        if cell_range is None:
+            return
+        cells = self._cells
+        cx0, cy0, cx1, cy1 = cell_range
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = cell = set()
+                cell.add(key)
+
+    def _remove_from_cells(self, key, cell_range):
+        if cell_range is None:
+            return
+        cells = self._cells
+        cx0, cy0, cx1, cy1 = cell_range
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                cell = cells[(cx, cy)]
+                cell.discard(key)
+                if not cell:
+                    del cells[(cx, cy)]
+
+    def insert(self, key, rect):
+        """Add a rectangle to the index.
+
+        Args:
+            key (Hashable): The key identifying the rectangle.
+            rect (Rect): The bounds of the rectangle.
+
+        Raises:
+            KeyError: If the key is already in the index.
+        """
+        if key in self._bounds:
+            raise KeyError(key)
+        bounds = _bounds(rect)
+        cell_range = self._cell_range(bounds)
+        self._bounds[key] = bounds
+        self._cell_ranges[key] = cell_range
+        self._add_to_cells(key, cell_range)
+
+    def move(self, key, rect):
+        """Update the bounds of a rectangle already in the index.
+
+        Args:
+            key (Hashable): The key identifying the rectangle.
+            rect (Rect): The new bounds of the rectangle.
+
+        Raises:
+            KeyError: If the key is not in the index.
+        """
+        bounds = _bounds(rect)
+        old_cell_range = self._cell_ranges[key]
+        cell_range = self._cell_range(bounds)
+        self._bounds[key] = bounds
+        if cell_range != old_cell_range:
+            self._remove_from_cells(key, old_cell_range)
+            self._add_to_cells(key, cell_range)
+            self._cell_ranges[key] = cell_range
+
+    def remove(self, key):
+        """Remove a rectangle from the index.
+
+        Args:
+            key (Hashable): The key identifying the rectangle.
+
+        Raises:
+            KeyError: If the key is not in the index.
+        """
+        self._remove_from_cells(key, self._cell_ranges.pop(key))
+        del self._bounds[key]
+
+    def _candidates(self, cell_range):
+        candidates = set()
+        if cell_range is None:
+            return candidates
+        cells = self._cells
+        cx0, cy0, cx1, cy1 = cell_range
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            for (cx, cy), cell in cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    candidates.update(cell)
+        else:
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    cell = cells.get((cx, cy))
+                    if cell:
+                        candidates.update(cell)
+        return candidates
+
+    def query(self, rect):
+        """Find all rectangles in the index which intersect a rectangle.
+
+        Args:
+            rect (Rect): The rectangle to test intersection with.
+
+        Returns:
+            Set[Hashable]: The keys of the intersecting rectangles.
+        """
+        bounds = _bounds(rect)
+        all_bounds = self._bounds
+        return {key for key in self._candidates(self._cell_range(bounds)) if _overlaps(bounds, all_bounds[key])}
+
+    def query_point(self, x, y):
+        """Find all rectangles in the index which contain a point.
+
+        Args:
+            x (int): The x coordinate of the point.
+            y (int): The y coordinate of the point.
+
+        Returns:
+            Set[Hashable]: The keys of the rectangles containing the point.
+        """
+        size = self._cell_size
+        cell = self._cells.get((x // size, y // size), ())
+        all_bounds = self._bounds
+        return {key for key in cell if _contains_point(all_bounds[key], x, y)}
+
+    def pairs(self):
+        """Find all pairs of intersecting rectangles in the index.
+
+        Returns:
+            List[Tuple[Hashable, Hashable]]: The keys of each pair of intersecting rectangles, with each pair reported
+                                             once.
+        """
+        size = self._cell_size
+        all_bounds = self._bounds
+        result = []
+        for (cx, cy), cell in self._cells.items():
+            if len(cell) < 2:
+                continue
+            cell = [(key, all_bounds[key]) for key in cell]
+            for i, (key_a, a) in enumerate(cell):
+                ax, ay, aw, ah = a
+                for key_b, b in cell[i + 1:]:
+                    bx, by, bw, bh = b
+                    if ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah:
+                        # Only report the pair from the cell holding the top left corner of the intersection, so
+                        # that pairs sharing several cells are reported once.
+                        if max(ax, bx) // size == cx and max(ay, by) // size == cy:
+                            result.append((key_a, key_b))
+        return result
+
+
+class _Node(object):
+    __slots__ = ('x0', 'y0', 'x1', 'y1', 'parent', 'left', 'right', 'height', 'key', 'order')
+
+
+def _perimeter(x0, y0, x1, y1):
+    return (x1 - x0) + (y1 - y0)
+
+
+def _fit(node):
+    left, right = node.left, node.right
+    node.x0 = min(left.x0, right.x0)
+    node.y0 = min(left.y0, right.y0)
+    node.x1 = max(left.x1, right.x1)
+    node.y1 = max(left.y1, right.y1)
+    node.height = 1 + max(left.height, right.height)
+
+
+class AABBTree(_SpatialIndex):
+    """A dynamic bounding volume tree used to quickly find overlapping rectangles.
+
+    Unlike SpatialHash, the tree adapts to rectangles of widely varying sizes and to sparse worlds. The tree is kept
+    balanced with rotations as rectangles are added and removed, and each rectangle is stored with a margin, so small
+    moves do not need to restructure the tree. Rectangles may be given as Rect objects or (x, y, w, h) tuples.
+    """
+
+    def __init__(self, margin=4):
+        """Create an empty tree.
+
+        Args:
+            margin (int): The distance each stored rectangle is enlarged by on every side.
+        """
+        super(AABBTree, self).__init__()
+        self._margin = margin
+        self._root = None
+        self._leaves = {}
+        self._order = 0
+
+    def _insert_leaf(self, leaf):
+        if self._root is None:
+            leaf.parent = None
+            self._root = leaf
+            return
+
+        # Descend towards the sibling which minimizes the total perimeter of the tree.
+        x0, y0, x1, y1 = leaf.x0, leaf.y0, leaf.x1, leaf.y1
+        node = self._root
+        while node.left is not None:
+            perimeter = _perimeter(node.x0, node.y0, node.x1, node.y1)
+            combined = _perimeter(min(x0, node.x0), min(y0, node.y0), max(x1, node.x1), max(y1, node.y1))
+            cost = 2 * combined
+            inheritance = 2 * (combined - perimeter)
+
+            child_costs = []
+            for child in (node.left, node.right):
+                child_cost = _perimeter(min(x0, child.x0), min(y0, child.y0), max(x1, child.x1), max(y1, child.y1))
+                if child.left is not None:
+                    child_cost -= _perimeter(child.x0, child.y0, child.x1, child.y1)
+                child_costs.append(child_cost + inheritance)
+
+            if cost < child_costs[0] and cost < child_costs[1]:
+                break
+            node = node.left if child_costs[0] < child_costs[1] else node.right
+
+        sibling = node
+        parent = _Node()
+        parent.key = None
+        parent.height = 0
+        parent.parent = sibling.parent
+        parent.left = sibling
+        parent.right = leaf
+        if sibling.parent is None:
+            self._root = parent
+        elif sibling.parent.left is sibling:
+            sibling.parent.left = parent
+        else:
+            sibling.parent.right = parent
+        sibling.parent = parent
+        leaf.parent = parent
+        self._refit(parent)
+
+    def _remove_leaf(self, leaf):
+        parent = leaf.parent
+        if parent is None:
+            self._root = None
+            return
+        sibling = parent.left if parent.right is leaf else parent.right
+        grandparent = parent.parent
+        sibling.parent = grandparent
+        if grandparent is None:
+            self._root = sibling
+        else:
+            if grandparent.left is parent:
+                grandparent.left = sibling
+            else:
+                grandparent.right = sibling
+            self._refit(grandparent)
+
+    def _refit(self, node):
+        while node is not None:
+            node = self._balance(node)
+            _fit(node)
+            node = node.parent
+
+    def _replace_child(self, old, new):
+        parent = new.parent
+        if parent is None:
+            self._root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _balance(self, a):
+        # Rotate the taller grandchild up when the heights of a's children differ by more than one, and return the
+        # node now at a's position.
+        if a.left is None or a.height < 2:
+            return a
+        b, c = a.left, a.right
+        balance = c.height - b.height
+        if balance > 1:
+            f, g = c.left, c.right
+            c.left = a
+            c.parent = a.parent
+            a.parent = c
+            self._replace_child(a, c)
+            if f.height > g.height:
+                c.right, a.right = f, g
+            else:
+                c.right, a.right = g, f
+            a.right.parent = a
+            _fit(a)
+            _fit(c)
+            return c
+        if balance < -1:
+            d, e = b.left, b.right
+            b.left = a
+            b.parent = a.parent
+            a.parent = b
+            self._replace_child(a, b)
+            if d.height > e.height:
+                b.right, a.left = d, e
+            else:
+                b.right, a.left = e, d
+            a.left.parent = a
+            _fit(a)
+            _fit(b)
+            return b
+        return a
+
+    def _set_fat_bounds(self, leaf, bounds):
+        x, y, w, h = bounds
+        margin = self._margin
+        leaf.x0 = x - margin
+        leaf.y0 = y - margin
+        leaf.x1 = x + max(w, 0) + margin
+        leaf.y1 = y + max(h, 0) + margin
+
+    def insert(self, key, rect):
+        """Add a rectangle to the index.
+
+        Args:
+            key (Hashable): The key identifying the rectangle.
+            rect (Rect): The bounds of the rectangle.
+
+        Raises:
+            KeyError: If the key is already in the index.
+        """
+        if key in self._bounds:
+            raise KeyError(key)
+        bounds = _bounds(rect)
+        leaf = _Node()
+        leaf.left = leaf.right = None
+        leaf.height = 0
+        leaf.key = key
+        leaf.order = self._order
+        self._order += 1
+        self._set_fat_bounds(leaf, bounds)
+        self._bounds[key] = bounds
+        self._leaves[key] = leaf
+        self._insert_leaf(leaf)
+
+    def move(self, key, rect):
+        """Update the bounds of a rectangle already in the index.
+
+        Args:
+            key (Hashable): The key identifying the rectangle.
+            rect (Rect): The new bounds of the rectangle.
+
+        Raises:
+            KeyError: If the key is not in the index.
+        """
+        leaf = self._leaves[key]
+        bounds = _bounds(rect)
+        self._bounds[key] = bounds
+        x, y, w, h = bounds
+        if leaf.x0 <= x and leaf.y0 <= y and x + max(w, 0) <= leaf.x1 and y + max(h, 0) <= leaf.y1:
+            return
+        self._remove_leaf(leaf)
+        self._set_fat_bounds(leaf, bounds)
+        self._insert_leaf(leaf)
+
+    def remove(self, key):
+        """Remove a rectangle from the index.
+
+        Args:
+            key (Hashable): The key identifying the rectangle.
+
+        Raises:
+            KeyError: If the key is not in the index.
+        """
+        self._remove_leaf(self._leaves.pop(key))
+        del self._bounds[key]
+
+    def _leaves_overlapping(self, x0, y0, x1, y1):
+        if self._root is None:
+            return
+        stack = [self._root]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node = pop()
+            if node.x0 < x1 and x0 < node.x1 and node.y0 < y1 and y0 < node.y1:
+                if node.left is None:
+                    yield node
+                else:
+                    push(node.left)
+                    push(node.right)
+
+    def query(self, rect):
+        """Find all rectangles in the index which intersect a rectangle.
+
+        Args:
+            rect (Rect): The rectangle to test intersection with.
+
+        Returns:
+            Set[Hashable]: The keys of the intersecting rectangles.
+        """
+        bounds = _bounds(rect)
+        x, y, w, h = bounds
+        if w <= 0 or h <= 0:
+            return set()
+        all_bounds = self._bounds
+        return {leaf.key for leaf in self._leaves_overlapping(x, y, x + w, y + h)
+                if _overlaps(bounds, all_bounds[leaf.key])}
+
+    def query_point(self, x, y):
+        """Find all rectangles in the index which contain a point.
+
+        Args:
+            x (int): The x coordinate of the point.
+            y (int): The y coordinate of the point.
+
+        Returns:
+            Set[Hashable]: The keys of the rectangles containing the point.
+        """
+        all_bounds = self._bounds
+        return {leaf.key for leaf in self._leaves_overlapping(x, y, x + 1, y + 1)
+                if _contains_point(all_bounds[leaf.key], x, y)}
+
+    def pairs(self):
+        """Find all pairs of intersecting rectangles in the index.
+
+        Returns:
+            List[Tuple[Hashable, Hashable]]: The keys of each pair of intersecting rectangles, with each pair reported
+                                             once.
+        """
+        all_bounds = self._bounds
+        result = []
+        for key, leaf in self._leaves.items():
+            bounds = all_bounds[key]
+            x, y, w, h = bounds
+            if w <= 0 or h <= 0:
+                continue
+            for other in self._leaves_overlapping(x, y, x + w, y + h):
+                if other.order > leaf.order and _overlaps(bounds, all_bounds[other.key]):
+                    result.append((key, other.key))
+        return result
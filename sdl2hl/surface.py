@@ -1,5 +1,16 @@
+import array
+
 from sdl2._sdl2 import ffi, lib
 from error import check_int_err, check_ptr_err
+from pixels import PixelFormat, bytes_per_pixel
+import rect
+import rwops
+
+
+_source_rect_arena = rect._Arena('SDL_Rect')
+_dest_rect_arena = rect._Arena('SDL_Rect')
+# SDL_UpperBlit writes the clipped destination back, so destinations are copied here to leave the caller's untouched.
+_clipped_rect_arena = rect._Arena('SDL_Rect')
 
 
 class Surface(object):
@@ -16,7 +27,7 @@ class Surface(object):
         """Load a surface from a file.
 
         Args:
-            path (str): Path to the BMP file to load.
+            path (Union[str, RWops]): Path to the BMP file to load, or a stream to read it from.
 
         Returns:
             Surface: A surface containing the pixels loaded from the file.
@@ -24,8 +35,39 @@ class Surface(object):
         Raises:
             SDLError: If the file cannot be loaded.
         """
-        surface = object.__new__(Surface)
-        surface._ptr = check_ptr_err(lib.SDL_LoadBMP_RW(lib.SDL_RWFromFile(path, "rb"), 1))
+        return Surface._from_ptr(check_ptr_err(lib.SDL_LoadBMP_RW(*rwops._open(path))))
+
+    @staticmethod
+    def from_buffer(buffer, w, h, pitch, fmt, offset=0):
+        """Create a surface using existing memory for its pixels, without copying them.
+
+        Args:
+            buffer (object): An object supporting the buffer protocol, such as a bytearray, an mmap or a NumPy array,
+                             holding the pixels. It is kept alive as long as the surface, and must be writable if the
+                             surface is drawn to.
+            w (int): The width of the surface.
+            h (int): The height of the surface.
+            pitch (int): The length of a row of pixels in bytes.
+            fmt (PixelFormat): The pixel format of the pixels.
+            offset (int): The offset in bytes of the first pixel within the buffer.
+
+        Returns:
+            Surface: A surface whose pixels are the buffer's memory.
+
+        Raises:
+            ValueError: If the buffer is too small for the pixels.
+            SDLError: If the surface cannot be created.
+        """
+        data = ffi.from_buffer(buffer)
+        row = w * bytes_per_pixel(fmt)
+        if offset < 0 or (h and len(data) - offset < (h - 1) * pitch + row):
+            raise ValueError('{} bytes at offset {} is too small for {}x{} pixels with a pitch of {}'.format(
+                len(data), offset, w, h, pitch))
+        ptr = check_ptr_err(lib.SDL_CreateRGBSurfaceWithFormatFrom(data + offset, w, h, bytes_per_pixel(fmt) * 8,
+                                                                   pitch, fmt))
+        surface = Surface._from_ptr(ptr)
+        # SDL does not free pixels it did not allocate, so the buffer only has to outlive the surface.
+        surface._buffer = data
         return surface
 
     def __init__(self, w, h, depth, fmt):
@@ -44,6 +86,93 @@ class Surface(object):
         """int: The height of the surface."""
         return self._ptr.h
 
+    @property
+    def pitch(self):
+        """int: The length of a row of pixels in bytes."""
+        return self._ptr.pitch
+
+    @property
+    def format(self):
+        """PixelFormat: The format of the pixels."""
+        return PixelFormat(self._ptr.format.format)
+
+    @property
+    def must_lock(self):
+        """bool: Whether the surface is RLE encoded, so it must be locked before its pixels can be accessed."""
+        return bool(self._ptr.flags & lib.SDL_RLEACCEL)
+
+    @property
+    def pixels(self):
+        """memoryview: A writable view of the surface's pixels as bytes, sharing its memory.
+
+        The view covers h rows of pitch bytes each, and keeps the surface alive. For a surface which must be locked,
+        it must not be used after the surface is unlocked.
+
+        Raises:
+            ValueError: If the surface must be locked and is not.
+        """
+        return memoryview(self._pixel_buffer())
+
+    def _pixel_buffer(self):
+        ptr = self._ptr
+        if ptr.pixels == ffi.NULL:
+            raise ValueError('the surface is RLE encoded, and must be locked to access its pixels')
+        # The buffer keeps its cdata alive, and the cdata's destructor holds the surface, so the surface outlives any
+        # view or array built on the buffer.
+        pixels = ffi.gc(ffi.cast('char *', ptr.pixels), lambda _, surface=self: None)
+        return ffi.buffer(pixels, ptr.h * ptr.pitch)
+
+    def as_array(self):
+        """Return a NumPy array sharing the memory of the surface's pixels, which keeps the surface alive. NumPy must be
+        installed.
+
+        Pixels of 3 or 4 bytes are split into their bytes, in memory order, so the array of a 32 bit surface has the
+        shape (h, w, 4). Pixels of 1 or 2 bytes are not split, so the array has the shape (h, w). Padding at the end of
+        each row is skipped using the array's strides.
+
+        Returns:
+            numpy.ndarray: A uint8 or uint16 array indexed by row, column and, for 3 or 4 byte pixels, byte.
+
+        Raises:
+            ValueError: If the surface must be locked and is not.
+        """
+        import numpy
+        pixel_bytes = bytes_per_pixel(self.format)
+        pixels = self._pixel_buffer()
+        if pixel_bytes in (3, 4):
+            return numpy.ndarray((self.h, self.w, pixel_bytes), numpy.uint8, pixels,
+                                 strides=(self.pitch, pixel_bytes, 1))
+        dtype = numpy.uint16 if pixel_bytes == 2 else numpy.uint8
+        return numpy.ndarray((self.h, self.w), dtype, pixels, strides=(self.pitch, pixel_bytes))
+
+    def lock(self):
+        """Lock the surface so its pixels can be accessed, decoding them if the surface is RLE encoded.
+
+        Locks nest: the surface is locked until unlock has been called once for each call to lock.
+
+        Raises:
+            SDLError: If the surface cannot be locked.
+        """
+        check_int_err(lib.SDL_LockSurface(self._ptr))
+
+    def unlock(self):
+        """Release a lock on the surface, encoding its pixels again if it is RLE encoded and this was the last lock."""
+        lib.SDL_UnlockSurface(self._ptr)
+
+    def convert(self, fmt):
+        """Create a copy of the surface with its pixels in another format.
+
+        Args:
+            fmt (PixelFormat): The pixel format of the new surface.
+
+        Returns:
+            Surface: A new surface containing the converted pixels.
+
+        Raises:
+            SDLError: If the conversion fails.
+        """
+        return Surface._from_ptr(check_ptr_err(lib.SDL_ConvertSurfaceFormat(self._ptr, fmt, 0)))
+
     def blit(self, src_rect, dst_surf, dst_rect):
         """Performs a fast blit from the source surface to the destination surface.
         This assumes that the source and destination rectangles are
@@ -60,7 +189,93 @@ class Surface(object):
             SDLError: If the blit fails.
         """
         check_int_err(lib.SDL_UpperBlit(self._ptr, src_rect._ptr, dst_surf._ptr, dst_rect._ptr))
-        
+
+    def blit_many(self, src_surface, src_rects=None, dst_rects=None):
+        """Blit many portions of a source surface onto this surface, clipping each to this surface's clip rect.
+
+        The rectangles are packed into C arrays once per call, so no Python objects are created per blit. Buffers of
+        packed 32-bit integers (e.g. array.array('i') or an int32 NumPy array of shape Nx4) are used without copying,
+        and are not modified.
+
+        Args:
+            src_surface (Surface): The surface to copy pixels from.
+            src_rects (Iterable[Rect]): The source rectangles, as Rect objects or a buffer of packed (x, y, w, h)
+                                        values, or None to copy the entire source surface each time.
+            dst_rects (Iterable[Rect]): The destination rectangles, as Rect objects or a buffer of packed (x, y, w, h)
+                                        values. Only their positions are used. None blits each to the top left corner.
+
+        Raises:
+            TypeError: If a buffer of items other than 32-bit integers or bytes is given.
+            ValueError: If the given sequences have different lengths, or neither of them were given.
+            SDLError: If a blit fails.
+        """
+        counts = set()
+        src_ptr = dst_ptr = None
+        if src_rects is not None:
+            src_ptr, count = rect._pack('SDL_Rect', src_rects, _source_rect_arena)
+            counts.add(count)
+        if dst_rects is not None:
+            packed_ptr, count = rect._pack('SDL_Rect', dst_rects, _dest_rect_arena)
+            dst_ptr = _clipped_rect_arena.reserve(count)
+            ffi.memmove(dst_ptr, packed_ptr, count * ffi.sizeof('SDL_Rect'))
+            counts.add(count)
+        if len(counts) != 1:
+            raise ValueError('blit_many requires sequences of equal length')
+        count = counts.pop()
+
+        upper_blit = lib.SDL_UpperBlit
+        src_surface_ptr = src_surface._ptr
+        dst_surface_ptr = self._ptr
+        for i in range(count):
+            check_int_err(upper_blit(src_surface_ptr, ffi.NULL if src_ptr is None else src_ptr + i,
+                                     dst_surface_ptr, ffi.NULL if dst_ptr is None else dst_ptr + i))
+
+    def blit_tiles(self, tileset, tiles, tile_w, tile_h, x=0, y=0):
+        """Blit a grid of tiles from a tileset onto this surface.
+
+        Only the tiles which overlap this surface's clip rect are blitted, so a large map can be drawn through a small
+        surface cheaply.
+
+        Args:
+            tileset (Surface): The surface containing the tiles, laid out left to right and top to bottom with no
+                               spacing between them.
+            tiles (Sequence[Sequence[int]]): The index of the tile at each position in the map, by row then column, such
+                                             as a list of lists or a 2D NumPy array. Negative indices are left empty.
+            tile_w (int): The width of a tile.
+            tile_h (int): The height of a tile.
+            x (int): The x coordinate on this surface of the map's top left corner.
+            y (int): The y coordinate on this surface of the map's top left corner.
+
+        Raises:
+            ValueError: If the tile size is not positive, or is larger than the tileset.
+            SDLError: If a blit fails.
+        """
+        if tile_w <= 0 or tile_h <= 0:
+            raise ValueError('tile size must be positive, not {}x{}'.format(tile_w, tile_h))
+        if tile_w > tileset.w or tile_h > tileset.h:
+            raise ValueError('{}x{} tiles do not fit in a {}x{} tileset'.format(tile_w, tile_h, tileset.w, tileset.h))
+        clip = self._ptr.clip_rect
+        # Floor division rounds towards the start of the map, and the ranges below are clamped to the map's size.
+        first_row = max(0, (clip.y - y) // tile_h)
+        end_row = min(len(tiles), -((y - clip.y - clip.h) // tile_h))
+        first_column = max(0, (clip.x - x) // tile_w)
+        end_column = -((x - clip.x - clip.w) // tile_w)
+        tileset_columns = tileset.w // tile_w
+
+        src_rects = array.array('i')
+        dst_rects = array.array('i')
+        for row in range(first_row, end_row):
+            tile_row = tiles[row]
+            dst_y = y + row * tile_h
+            for column in range(first_column, min(len(tile_row), end_column)):
+                index = tile_row[column]
+                if index >= 0:
+                    src_rects.extend((index % tileset_columns * tile_w, index // tileset_columns * tile_h, tile_w,
+                                      tile_h))
+                    dst_rects.extend((x + column * tile_w, dst_y, tile_w, tile_h))
+        if dst_rects:
+            self.blit_many(tileset, src_rects, dst_rects)
+
     def save_bmp(self, path):
         check_int_err(lib.SDL_SaveBMP_RW(self._ptr, lib.SDL_RWFromFile(path, "wb"), 1))
 
@@ -0,0 +1,483 @@
+import array
+import collections
+from enum import IntEnum
+import weakref
+
+from sdl2._sdl2 import ffi
+from error import SDLError
+from pixels import PixelFormat
+from rect import Rect, RectArray
+from renderer import BlendMode, Texture, TextureAccess
+from atlas import SkylinePacker
+
+
+class TextAlign(IntEnum):
+    left = 0
+    center = 1
+    right = 2
+
+
+class TextRenderMode(IntEnum):
+    solid = 0 #: Fast, unantialiased rendering with Font.render_solid.
+    blended = 1 #: Antialiased rendering with Font.render_blended.
+
+
+_WHITE = (255, 255, 255, 255)
+
+
+class _GlyphPage(object):
+
+    __slots__ = ('texture', 'packer', 'keys', 'generation', 'last_used')
+
+
+class _Glyph(object):
+
+    __slots__ = ('page', 'x', 'y', 'w', 'h', 'advance')
+
+
+class GlyphCache(object):
+    """Rasterizes each glyph of each font once into shared textures, and lays out text from them.
+
+    Glyphs are rendered in white and tinted with the texture color mod when drawn, so one cached glyph serves every
+    color. The cache holds at most max_pages textures of page_size pixels square; when they are full, the least
+    recently used page is cleared and reused.
+    """
+
+    def __init__(self, renderer, page_size=512, max_pages=4):
+        """Create an empty GlyphCache.
+
+        Args:
+            renderer (Renderer): The renderer the glyph textures are created for.
+            page_size (int): The width and height of each page, clamped to the renderer's maximum texture size.
+            max_pages (int): The most pages to create before evicting glyphs.
+        """
+        self._renderer = renderer
+        max_w = renderer.max_texture_width
+        max_h = renderer.max_texture_height
+        self._page_w = min(page_size, max_w) if max_w else page_size
+        self._page_h = min(page_size, max_h) if max_h else page_size
+        self._max_pages = max_pages
+        self._pages = []
+        self._glyphs = {}
+        self._kerning = {}
+        self._tick = 0
+        self._evictions = 0
+
+    @property
+    def pages(self):
+        """List[Texture]: The textures the glyphs are packed into."""
+        return [page.texture for page in self._pages]
+
+    @property
+    def evictions(self):
+        """int: The number of times a page has been cleared to make room for new glyphs."""
+        return self._evictions
+
+    def __len__(self):
+        return sum(len(glyphs) for glyphs in self._glyphs.values())
+
+    def _new_page(self):
+        page = _GlyphPage()
+        page.texture = Texture(self._renderer, PixelFormat.argb8888, TextureAccess.static, self._page_w, self._page_h)
+        page.texture.blend_mode = BlendMode.blend
+        page.packer = SkylinePacker(self._page_w, self._page_h)
+        page.keys = []
+        page.generation = 0
+        page.last_used = self._tick
+        self._pages.append(page)
+        return page
+
+    def _evict(self):
+        # Pages used since the current layout started cannot be cleared, or the layout would be corrupted.
+        candidates = [page for page in self._pages if page.last_used < self._tick]
+        if not candidates:
+            raise ValueError('text needs more glyphs than fit in the glyph cache at once')
+        page = min(candidates, key=lambda page: page.last_used)
+        for glyphs, ch in page.keys:
+            del glyphs[ch]
+        page.keys = []
+        page.packer.reset()
+        page.generation += 1
+        self._evictions += 1
+        return page
+
+    def _allocate(self, w, h):
+        for page in self._pages:
+            position = page.packer.insert(w, h)
+            if position is not None:
+                return page, position
+        page = self._new_page() if len(self._pages) < self._max_pages else self._evict()
+        position = page.packer.insert(w, h)
+        if position is None:
+            raise ValueError('glyph does not fit in a {}x{} glyph cache page'.format(self._page_w, self._page_h))
+        return page, position
+
+    def _rasterize(self, font, ch, key):
+        glyph = _Glyph()
+        glyph.page = None
+        try:
+            glyph.advance = font.glyph_metrics(ch)[4]
+        except (OverflowError, SDLError):
+            # Glyph metrics are only available for characters in the basic multilingual plane.
+            glyph.advance = font.size(ch)[0]
+        if ch.isspace():
+            return glyph
+
+        # A single character is rendered at the full line height with its baseline at the font's ascent, so glyphs
+        # can be placed at the pen position on the line without further adjustment.
+        surface = font.render_blended(ch, _WHITE).convert(PixelFormat.argb8888)
+        glyph.w = surface.w
+        glyph.h = surface.h
+        page, (glyph.x, glyph.y) = self._allocate(glyph.w + 1, glyph.h + 1)
+        glyph.page = page
+        page.keys.append(key)
+        page.texture.update(surface.pixels, Rect(glyph.x, glyph.y, glyph.w, glyph.h), surface.pitch)
+        return glyph
+
+    def _font_glyphs(self, font, style):
+        glyphs = self._glyphs.get((font, style))
+        if glyphs is None:
+            glyphs = self._glyphs[(font, style)] = {}
+        return glyphs
+
+    def _glyph(self, font, glyphs, ch):
+        glyph = glyphs.get(ch)
+        if glyph is None:
+            glyph = glyphs[ch] = self._rasterize(font, ch, (glyphs, ch))
+        if glyph.page is not None:
+            glyph.page.last_used = self._tick
+        return glyph
+
+    def _measure(self, font, glyphs, kerning, word):
+        placed = []
+        pen = 0
+        previous_ch = None
+        tick = self._tick
+        for ch in word:
+            glyph = glyphs.get(ch)
+            if glyph is None:
+                glyph = self._glyph(font, glyphs, ch)
+            elif glyph.page is not None:
+                glyph.page.last_used = tick
+            if previous_ch is not None:
+                pair = previous_ch + ch
+                kern = kerning.get(pair)
+                if kern is None:
+                    kern = kerning[pair] = font.kerning(previous_ch, ch)
+                pen += kern
+            placed.append((glyph, pen))
+            pen += glyph.advance
+            previous_ch = ch
+        return placed, pen
+
+    def layout(self, font, text, width=None, align=TextAlign.left):
+        """Lay out text, rasterizing any glyphs not already in the cache.
+
+        Args:
+            font (Font): The font to render the text in.
+            text (str): The text to lay out. Newlines start a new line.
+            width (Optional[int]): The width in pixels to wrap lines at, or None to only break lines at newlines.
+            align (TextAlign): How to align each line within the width, or within the widest line if width is None.
+
+        Returns:
+            TextLayout: The laid out text.
+
+        Raises:
+            ValueError: If the text needs more glyphs than fit in the cache at once.
+            SDLError: If a glyph cannot be rendered or uploaded.
+        """
+        return TextLayout(self, font, text, width, align)
+
+    def draw_text(self, font, text, x, y, color=_WHITE, width=None, align=TextAlign.left):
+        """Lay out text and draw it.
+
+        Args:
+            font (Font): The font to render the text in.
+            text (str): The text to draw.
+            x (int): The x coordinate of the top left corner of the text.
+            y (int): The y coordinate of the top left corner of the text.
+            color (Tuple[int, int, int, int]): The color of the text in (red, green, blue, alpha) format.
+            width (Optional[int]): The width in pixels to wrap lines at, or None to only break lines at newlines.
+            align (TextAlign): How to align each line.
+
+        Returns:
+            TextLayout: The laid out text, which can be drawn again without laying it out.
+
+        Raises:
+            ValueError: If the text needs more glyphs than fit in the cache at once.
+            SDLError: If a glyph cannot be rendered or uploaded, or the text cannot be drawn.
+        """
+        text_layout = self.layout(font, text, width, align)
+        text_layout.draw(x, y, color)
+        return text_layout
+
+
+class TextLayout(object):
+    """Text laid out as runs of source and destination rects on the pages of a GlyphCache.
+
+    If the cache evicts a page the layout uses, the layout is redone the next time it is drawn.
+    """
+
+    def __init__(self, cache, font, text, width=None, align=TextAlign.left):
+        """Lay out text.
+
+        Args:
+            cache (GlyphCache): The cache to take glyphs from.
+            font (Font): The font to render the text in.
+            text (str): The text to lay out. Newlines start a new line.
+            width (Optional[int]): The width in pixels to wrap lines at, or None to only break lines at newlines.
+            align (TextAlign): How to align each line within the width, or within the widest line if width is None.
+        """
+        self._cache = cache
+        self._font = font
+        self._text = text
+        self._width = width
+        self._align = align
+        self._layout()
+
+    @property
+    def w(self):
+        """int: The width of the laid out text in pixels."""
+        return self._w
+
+    @property
+    def h(self):
+        """int: The height of the laid out text in pixels."""
+        return self._h
+
+    def _lines(self, style):
+        cache = self._cache
+        font = self._font
+        width = self._width
+        glyphs = cache._font_glyphs(font, style)
+        kerning = cache._kerning.get(font)
+        if kerning is None:
+            kerning = cache._kerning[font] = {}
+        space = cache._glyph(font, glyphs, ' ').advance
+        lines = []
+        for paragraph in self._text.split('\n'):
+            line = []
+            pen = 0
+            for index, word in enumerate(paragraph.split(' ')):
+                placed, word_width = cache._measure(font, glyphs, kerning, word)
+                if index:
+                    if width is not None and line and pen + space + word_width > width:
+                        lines.append((line, pen))
+                        line = []
+                        pen = 0
+                    else:
+                        pen += space
+                line.extend((glyph, pen + offset) for glyph, offset in placed)
+                pen += word_width
+            lines.append((line, pen))
+        return lines
+
+    def _layout(self):
+        cache = self._cache
+        font = self._font
+        cache._tick += 1
+        lines = self._lines(font.style)
+
+        self._w = max(line_width for _, line_width in lines)
+        line_skip = font.line_skip
+        self._h = (len(lines) - 1) * line_skip + font.height
+        box = self._w if self._width is None else self._width
+
+        runs = {}
+        for i, (line, line_width) in enumerate(lines):
+            if self._align == TextAlign.center:
+                x = (box - line_width) // 2
+            elif self._align == TextAlign.right:
+                x = box - line_width
+            else:
+                x = 0
+            y = i * line_skip
+            for glyph, offset in line:
+                page = glyph.page
+                if page is None:
+                    continue
+                run = runs.get(page)
+                if run is None:
+                    run = runs[page] = (array.array('i'), array.array('i'))
+                run[0].extend((glyph.x, glyph.y, glyph.w, glyph.h))
+                run[1].extend((x + offset, y, glyph.w, glyph.h))
+
+        self._runs = [(page, page.generation, source_rects, RectArray(dest_rects))
+                      for page, (source_rects, dest_rects) in runs.items()]
+        self._x = 0
+        self._y = 0
+
+    def draw(self, x, y, color=_WHITE):
+        """Draw the text.
+
+        Args:
+            x (int): The x coordinate of the top left corner of the text.
+            y (int): The y coordinate of the top left corner of the text.
+            color (Tuple[int, int, int, int]): The color of the text in (red, green, blue, alpha) format.
+
+        Raises:
+            ValueError: If the text needs more glyphs than fit in the cache at once.
+            SDLError: If the text cannot be drawn.
+        """
+        if any(page.generation != generation for page, generation, _, _ in self._runs):
+            self._layout()
+        dx = x - self._x
+        dy = y - self._y
+        if dx or dy:
+            for _, _, _, dest_rects in self._runs:
+                dest_rects.translate(dx, dy)
+            self._x = x
+            self._y = y
+
+        cache = self._cache
+        rgb = tuple(color[:3])
+        alpha = color[3] if len(color) > 3 else 255
+        copy_many = cache._renderer.copy_many
+        for page, _, source_rects, dest_rects in self._runs:
+            page.last_used = cache._tick
+            texture = page.texture
+            texture.color_mod = rgb
+            texture.alpha_mod = alpha
+            copy_many(texture, source_rects, dest_rects)
+
+
+class TextTextureCache(object):
+    """Keeps the textures of rendered strings, so strings that are drawn repeatedly are only rendered once.
+
+    Textures are evicted least recently used first when their total size exceeds the budget. The cache only holds a
+    weak reference to the renderer; when the renderer is destroyed, which also destroys its textures, every entry is
+    dropped.
+    """
+
+    def __init__(self, renderer, budget=16 * 1024 * 1024):
+        """Create an empty TextTextureCache.
+
+        Args:
+            renderer (Renderer): The renderer the textures are created for.
+            budget (int): The most bytes of texture pixels to keep.
+        """
+        cache_ref = weakref.ref(self)
+
+        def renderer_destroyed(_):
+            cache = cache_ref()
+            if cache is not None:
+                cache._renderer_destroyed()
+
+        self._renderer = weakref.ref(renderer, renderer_destroyed)
+        self._entries = collections.OrderedDict()
+        self._budget = budget
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def budget(self):
+        """int: The most bytes of texture pixels to keep."""
+        return self._budget
+
+    @property
+    def size(self):
+        """int: The number of bytes of texture pixels currently kept."""
+        return self._size
+
+    @property
+    def hits(self):
+        """int: The number of lookups which found a cached texture."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """int: The number of lookups which had to render a texture."""
+        return self._misses
+
+    @property
+    def evictions(self):
+        """int: The number of textures dropped to stay within the budget."""
+        return self._evictions
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _renderer_destroyed(self):
+        # SDL_DestroyRenderer destroys the renderer's textures, so they must not be destroyed again.
+        for texture, _, _, _ in self._entries.values():
+            texture._ptr = ffi.NULL
+        self.clear()
+
+    def _lookup(self, font, text, color, mode):
+        key = (font, text, tuple(color), mode)
+        entries = self._entries
+        entry = entries.pop(key, None)
+        if entry is not None:
+            self._hits += 1
+            entries[key] = entry
+            return entry
+
+        renderer = self._renderer()
+        if renderer is None:
+            raise ValueError('the renderer for this cache has been destroyed')
+        self._misses += 1
+        if mode == TextRenderMode.solid:
+            surface = font.render_solid(text, color)
+        else:
+            surface = font.render_blended(text, color)
+        texture = Texture.from_surface(renderer, surface)
+        # Textures created from rendered text use 32-bit pixel formats.
+        nbytes = surface.w * surface.h * 4
+        entry = (texture, surface.w, surface.h, nbytes)
+        if nbytes > self._budget:
+            return entry
+
+        entries[key] = entry
+        self._size += nbytes
+        while self._size > self._budget:
+            _, (_, _, _, evicted) = entries.popitem(last=False)
+            self._size -= evicted
+            self._evictions += 1
+        return entry
+
+    def get(self, font, text, color=_WHITE, mode=TextRenderMode.blended):
+        """Get the texture for a string, rendering it if it is not cached.
+
+        Args:
+            font (Font): The font to render the text in.
+            text (str): The text to render.
+            color (Tuple[int, int, int, int]): The color of the text in (red, green, blue, alpha) format.
+            mode (TextRenderMode): How to render the text.
+
+        Returns:
+            Texture: The texture containing the rendered text.
+
+        Raises:
+            ValueError: If the renderer has been destroyed.
+            SDLError: If the text cannot be rendered.
+        """
+        return self._lookup(font, text, color, mode)[0]
+
+    def draw(self, font, text, x, y, color=_WHITE, mode=TextRenderMode.blended):
+        """Draw a string, rendering it if it is not cached.
+
+        Args:
+            font (Font): The font to render the text in.
+            text (str): The text to draw.
+            x (int): The x coordinate of the top left corner of the text.
+            y (int): The y coordinate of the top left corner of the text.
+            color (Tuple[int, int, int, int]): The color of the text in (red, green, blue, alpha) format.
+            mode (TextRenderMode): How to render the text.
+
+        Returns:
+            Texture: The texture containing the rendered text.
+
+        Raises:
+            ValueError: If the renderer has been destroyed.
+            SDLError: If the text cannot be rendered or drawn.
+        """
+        texture, w, h, _ = self._lookup(font, text, color, mode)
+        self._renderer().copy(texture, dest_rect=Rect(x, y, w, h))
+        return texture
+
+    def clear(self):
+        """Drop every cached texture."""
+        self._entries.clear()
+        self._size = 0
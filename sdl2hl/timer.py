@@ -1,3 +1,5 @@
+import collections
+
 from sdl2._sdl2 import lib
 
 
@@ -32,3 +34,158 @@ def delay(ms):
         ms (int): The number of milliseconds to wait.
     """
     lib.SDL_Delay(ms)
+
+
+FrameStats = collections.namedtuple('FrameStats', ['frames', 'mean', 'p95', 'p99', 'max', 'missed_deadlines',
+                                                   'dropped_updates'])
+
+
+class Clock(object):
+    """Paces a game loop and runs its updates at a fixed timestep.
+
+    Call tick once per frame, then run one game update for each timestep yielded by updates, then render with alpha
+    to interpolate between the previous and current update. For example::
+
+        clock = Clock(update_rate=120, frame_rate=60)
+        while running:
+            clock.tick()
+            for dt in clock.updates():
+                world.update(dt)
+            world.render(clock.alpha)
+
+    When frame_rate is set, tick sleeps with delay until shortly before the frame deadline and then spins on the
+    performance counter, so frames end close to the deadline despite the coarse granularity of delay.
+    """
+
+    def __init__(self, update_rate=60, frame_rate=None, max_updates=5, spin_ms=2, smoothing=0.1, window=300):
+        """Create a Clock.
+
+        Args:
+            update_rate (float): The number of fixed updates per second.
+            frame_rate (Optional[float]): The number of frames per second to pace tick to, or None to not wait.
+            max_updates (int): The most updates to run in one frame. Time beyond that is dropped, so a slow frame
+                               cannot cause ever more updates to fall behind.
+            spin_ms (float): How many milliseconds before the frame deadline to stop sleeping and start spinning.
+            smoothing (float): The weight of the newest frame time in the smoothed frame time, between 0 and 1.
+            window (int): The number of recent frame times kept for stats.
+        """
+        self._frequency = float(lib.SDL_GetPerformanceFrequency())
+        self._dt = 1.0 / update_rate
+        self._period = None if frame_rate is None else int(round(self._frequency / frame_rate))
+        self._spin = int(self._frequency * spin_ms / 1000)
+        self._max_updates = max_updates
+        self._smoothing = smoothing
+        self._frame_times = collections.deque(maxlen=window)
+        self._last = None
+        self._deadline = None
+        self._accumulator = 0.0
+        self._frame_time = 0.0
+        self._smoothed = None
+        self._missed = 0
+        self._dropped = 0
+
+    @property
+    def dt(self):
+        """float: The length of each fixed update in seconds."""
+        return self._dt
+
+    @property
+    def frame_time(self):
+        """float: The length of the last frame in seconds."""
+        return self._frame_time
+
+    @property
+    def smoothed_frame_time(self):
+        """float: An exponential moving average of the frame time in seconds."""
+        return self._smoothed or 0.0
+
+    @property
+    def fps(self):
+        """float: The number of frames per second, based on the smoothed frame time."""
+        return 1.0 / self._smoothed if self._smoothed else 0.0
+
+    @property
+    def alpha(self):
+        """float: How far between the last update and the next one the current frame is, from 0 to 1."""
+        return self._accumulator / self._dt
+
+    def _wait(self, deadline):
+        counter = lib.SDL_GetPerformanceCounter
+        remaining = deadline - counter() - self._spin
+        if remaining > 0:
+            lib.SDL_Delay(int(remaining * 1000 / self._frequency))
+        while counter() < deadline:
+            pass
+
+    def tick(self):
+        """Wait for the end of the frame if a frame rate is set, then start timing the next frame.
+
+        Returns:
+            float: The length of the frame that ended, in seconds. The first call returns 0.
+        """
+        now = lib.SDL_GetPerformanceCounter()
+        if self._last is None:
+            self._last = now
+            if self._period is not None:
+                self._deadline = now + self._period
+            return 0.0
+
+        if self._period is not None:
+            if now > self._deadline:
+                # Start the next frame's deadline from now rather than rushing frames to catch up.
+                self._missed += 1
+                self._deadline = now + self._period
+            else:
+                self._wait(self._deadline)
+                now = lib.SDL_GetPerformanceCounter()
+                self._deadline += self._period
+
+        frame_time = (now - self._last) / self._frequency
+        self._last = now
+        self._frame_time = frame_time
+        self._frame_times.append(frame_time)
+        if self._smoothed is None:
+            self._smoothed = frame_time
+        else:
+            self._smoothed += self._smoothing * (frame_time - self._smoothed)
+
+        self._accumulator += frame_time
+        excess = int(self._accumulator / self._dt) - self._max_updates
+        if excess > 0:
+            self._dropped += excess
+            self._accumulator -= excess * self._dt
+        return frame_time
+
+    def updates(self):
+        """Consume the time elapsed in fixed timesteps.
+
+        Returns:
+            Iterable[float]: The fixed timestep, once for each update to run this frame.
+        """
+        dt = self._dt
+        while self._accumulator >= dt:
+            self._accumulator -= dt
+            yield dt
+
+    def stats(self):
+        """Get statistics about recent frame times.
+
+        Returns:
+            FrameStats: The number of frames in the window and the mean, 95th percentile, 99th percentile and maximum
+                        of their times in seconds, and the total number of missed frame deadlines and dropped updates.
+        """
+        times = sorted(self._frame_times)
+        if not times:
+            return FrameStats(0, 0.0, 0.0, 0.0, 0.0, self._missed, self._dropped)
+
+        def percentile(p):
+            return times[min(len(times) - 1, int(p * len(times)))]
+
+        return FrameStats(len(times), sum(times) / len(times), percentile(0.95), percentile(0.99), times[-1],
+                          self._missed, self._dropped)
+
+    def reset_stats(self):
+        """Forget recent frame times, missed deadlines and dropped updates."""
+        self._frame_times.clear()
+        self._missed = 0
+        self._dropped = 0
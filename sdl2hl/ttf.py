@@ -1,23 +1,136 @@
+from enum import IntEnum
+
 from sdl2._sdl2 import ffi, lib
 from error import check_int_err, check_ptr_err
 from surface import Surface
+import enumtools
+import rwops
+
+
+class FontStyle(IntEnum):
+    bold = lib.TTF_STYLE_BOLD
+    italic = lib.TTF_STYLE_ITALIC
+    underline = lib.TTF_STYLE_UNDERLINE
+    strikethrough = lib.TTF_STYLE_STRIKETHROUGH
+
+
+# Glyph pair kerning is only available from SDL_ttf 2.0.14.
+_get_kerning = getattr(lib, 'TTF_GetFontKerningSizeGlyphs', None)
 
 
 class Font(object):
 
     @staticmethod
     def from_path(path, size):
+        """Open a font from a file, or from an RWops.
+
+        A font reads glyphs from its stream as they are needed, so an RWops is kept open until the font is closed.
+
+        Args:
+            path (Union[str, RWops]): Path to the font file, or a stream to read it from.
+            size (int): The point size of the font.
+
+        Returns:
+            Font: The opened font.
+
+        Raises:
+            SDLError: If the font cannot be opened.
+        """
+        rwops_ptr, freesrc = rwops._open(path)
+        ptr = check_ptr_err(lib.TTF_OpenFontRW(rwops_ptr, freesrc, size))
         font = object.__new__(Font)
-        font._ptr = check_ptr_err(lib.TTF_OpenFont(path, size))
+        font._ptr = ptr
+        font._rwops = None if freesrc else path
         return font
     
     def __init__(self, font_bytes, size):
-        self._bytes = font_bytes # This is a workaround for some sort of weird lifetime issue.
-        rw = check_ptr_err(lib.SDL_RWFromConstMem(self._bytes, len(self._bytes)))
-        self._ptr = check_ptr_err(lib.TTF_OpenFontRW(rw, 1, size))
+        # The font reads from the bytes lazily, so the stream and the bytes it refers to must outlive it.
+        self._rwops = rwops.RWops.from_buffer(font_bytes)
+        self._ptr = check_ptr_err(lib.TTF_OpenFontRW(self._rwops._ptr, 0, size))
         
     def __del__(self):
         lib.TTF_CloseFont(self._ptr)
+
+    @property
+    def height(self):
+        """int: The maximum height of a glyph in pixels."""
+        return lib.TTF_FontHeight(self._ptr)
+
+    @property
+    def ascent(self):
+        """int: The maximum distance in pixels from the baseline to the top of a glyph."""
+        return lib.TTF_FontAscent(self._ptr)
+
+    @property
+    def descent(self):
+        """int: The maximum distance in pixels from the baseline to the bottom of a glyph, as a negative number."""
+        return lib.TTF_FontDescent(self._ptr)
+
+    @property
+    def line_skip(self):
+        """int: The recommended distance in pixels between the baselines of consecutive lines of text."""
+        return lib.TTF_FontLineSkip(self._ptr)
+
+    @property
+    def style(self):
+        """FrozenSet[FontStyle]: The styles applied when rendering text."""
+        return enumtools.get_items(FontStyle, lib.TTF_GetFontStyle(self._ptr))
+
+    @style.setter
+    def style(self, styles):
+        mask = 0
+        for style in styles:
+            mask |= style
+        lib.TTF_SetFontStyle(self._ptr, mask)
+
+    def glyph_metrics(self, ch):
+        """Get the metrics of a glyph.
+
+        Args:
+            ch (str): The character of the glyph.
+
+        Returns:
+            Tuple[int, int, int, int, int]: The glyph's minimum x, maximum x, minimum y and maximum y relative to the
+                                            pen position on the baseline, and its advance, in pixels.
+
+        Raises:
+            SDLError: If the font does not contain the glyph.
+        """
+        metrics = ffi.new('int[]', 5)
+        check_int_err(lib.TTF_GlyphMetrics(self._ptr, ord(ch), metrics + 0, metrics + 1, metrics + 2, metrics + 3,
+                                           metrics + 4))
+        return tuple(metrics)
+
+    def kerning(self, previous_ch, ch):
+        """Get the kerning adjustment between two glyphs.
+
+        Args:
+            previous_ch (str): The character of the first glyph.
+            ch (str): The character of the glyph following it.
+
+        Returns:
+            int: The number of pixels to add to the advance of the first glyph, or 0 if the SDL_ttf library does not
+                 support kerning by glyph.
+        """
+        if _get_kerning is None:
+            return 0
+        return _get_kerning(self._ptr, ord(previous_ch), ord(ch))
+
+    def size(self, text):
+        """Get the size of the surface text would be rendered to.
+
+        Args:
+            text (str): The text to measure.
+
+        Returns:
+            Tuple[int, int]: The width and height of the rendered text in pixels.
+
+        Raises:
+            SDLError: If the text cannot be measured.
+        """
+        size = ffi.new('int[]', 2)
+        check_int_err(lib.TTF_SizeUTF8(self._ptr, text.encode('utf-8'), size + 0, size + 1))
+        return size[0], size[1]
         
     def render_solid(self, text, color):
         return Surface._from_ptr(check_ptr_err(lib.TTF_RenderUTF8_Solid(self._ptr, text.encode('utf-8'), color)))
@@ -3,6 +3,11 @@ from enum import IntEnum
 from sdl2._sdl2 import ffi, lib
 from error import check_int_err, check_ptr_err
 import enumtools
+import rect
+from surface import Surface
+
+
+_rect_arena = rect._Arena('SDL_Rect')
 
 
 class WindowFlags(IntEnum):
@@ -46,7 +51,7 @@ class Window(object):
 
     @property
     def flags(self):
-        """set[WindowFlags]: The flags for the window."""
+        """FrozenSet[WindowFlags]: The flags for the window."""
         return enumtools.get_items(WindowFlags, lib.SDL_GetWindowFlags(self._ptr))
 
     @property
@@ -82,6 +87,37 @@ class Window(object):
         w, h = size
         lib.SDL_SetWindowSize(self._ptr, w, h)
 
+    @property
+    def surface(self):
+        """Surface: The surface of the window, for drawing to it in software without a renderer.
+
+        The surface is owned by the window and is invalidated when the window is resized. Changes to it are shown by
+        update_surface.
+
+        Raises:
+            SDLError: If the window has a renderer or an OpenGL context, or the surface cannot be created.
+        """
+        surface = Surface._from_ptr(check_ptr_err(lib.SDL_GetWindowSurface(self._ptr)))
+        # The window surface is never freed by SDL_FreeSurface, but must not be used after the window is destroyed.
+        surface._window = self
+        return surface
+
+    def update_surface(self, rects=None):
+        """Copy the window surface to the screen.
+
+        Args:
+            rects (Iterable[Rect]): The areas to copy, as Rect objects or a buffer of packed (x, y, w, h) values, or None
+                                    to copy the entire surface.
+
+        Raises:
+            SDLError: If the surface cannot be copied.
+        """
+        if rects is None:
+            check_int_err(lib.SDL_UpdateWindowSurface(self._ptr))
+        else:
+            rect_ptr, count = rect._pack('SDL_Rect', rects, _rect_arena)
+            check_int_err(lib.SDL_UpdateWindowSurfaceRects(self._ptr, rect_ptr, count))
+
     def show(self):
         """Show the window."""
         lib.SDL_ShowWindow(self._ptr)
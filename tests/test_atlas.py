@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from sdl2hl.atlas import SkylinePacker
+
+
+def _overlap(a, b):
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+class TestSkylinePacker(unittest.TestCase):
+
+    def test_first_insert_at_origin(self):
+        packer = SkylinePacker(64, 64)
+        self.assertEqual(packer.insert(10, 20), (0, 0))
+        self.assertEqual(packer.insert(10, 10), (10, 0))
+
+    def test_places_lowest_first(self):
+        packer = SkylinePacker(64, 64)
+        packer.insert(32, 30)
+        packer.insert(32, 10)
+        # The right half is lower, so the next rectangle goes on top of it.
+        self.assertEqual(packer.insert(32, 10), (32, 10))
+
+    def test_random_inserts_do_not_overlap(self):
+        rng = random.Random(42)
+        packer = SkylinePacker(256, 256)
+        placed = []
+        for _ in range(500):
+            w, h = rng.randint(1, 40), rng.randint(1, 40)
+            position = packer.insert(w, h)
+            if position is None:
+                continue
+            x, y = position
+            self.assertTrue(0 <= x and x + w <= 256 and 0 <= y and y + h <= 256)
+            for other in placed:
+                self.assertFalse(_overlap((x, y, w, h), other))
+            placed.append((x, y, w, h))
+        self.assertAlmostEqual(packer.occupancy, sum(w * h for _, _, w, h in placed) / float(256 * 256))
+
+    def test_does_not_fit(self):
+        packer = SkylinePacker(32, 32)
+        self.assertIsNone(packer.insert(33, 1))
+        self.assertIsNone(packer.insert(1, 33))
+        self.assertEqual(packer.insert(32, 32), (0, 0))
+        self.assertEqual(packer.occupancy, 1.0)
+        self.assertIsNone(packer.insert(1, 1))
+
+    def test_reset(self):
+        packer = SkylinePacker(32, 32)
+        packer.insert(32, 32)
+        packer.reset()
+        self.assertEqual(packer.occupancy, 0.0)
+        self.assertEqual(packer.insert(16, 16), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
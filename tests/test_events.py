@@ -0,0 +1,76 @@
+import unittest
+
+from sdl2._sdl2 import ffi, lib
+import sdl2hl
+from sdl2hl.events import Dispatcher, Event, EventType, WindowEventType, get
+from sdl2hl.keycode import KeyCode
+
+
+def _key_event(keycode):
+    ptr = ffi.new('SDL_Event *')
+    ptr.type = lib.SDL_KEYDOWN
+    ptr.key.keysym.sym = keycode
+    return ptr
+
+
+class TestDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.dispatcher = Dispatcher()
+        self.calls = []
+        self.dispatcher.register(EventType.keydown, lambda event: self.calls.append('any'))
+        self.dispatcher.register(EventType.keydown, lambda event: self.calls.append('space'), KeyCode.space)
+
+    def test_dispatch_view(self):
+        event = Event._from_ptr(_key_event(KeyCode.space))
+        self.assertEqual(self.dispatcher.dispatch(event), 2)
+        self.assertEqual(self.calls, ['any', 'space'])
+
+    def test_dispatch_record(self):
+        record = Event._from_ptr(_key_event(KeyCode.space), materialize=True)
+        self.assertFalse(hasattr(record, '_ptr'))
+        self.assertEqual(self.dispatcher.dispatch(record), 2)
+        self.assertEqual(self.calls, ['any', 'space'])
+
+    def test_dispatch_record_other_subtype(self):
+        record = Event._from_ptr(_key_event(KeyCode.a), materialize=True)
+        self.assertEqual(self.dispatcher.dispatch(record), 1)
+        self.assertEqual(self.calls, ['any'])
+
+    def test_dispatch_record_without_handlers(self):
+        ptr = ffi.new('SDL_Event *')
+        ptr.type = lib.SDL_QUIT
+        self.assertEqual(self.dispatcher.dispatch(Event._from_ptr(ptr, materialize=True)), 0)
+        self.assertEqual(self.calls, [])
+
+
+class TestMaterializedEvents(unittest.TestCase):
+
+    def setUp(self):
+        sdl2hl.init(sdl2hl.InitFlag.video)
+
+    def tearDown(self):
+        sdl2hl.quit()
+
+    def test_get_materialized_window_event_with_unknown_subtype(self):
+        get(1024)
+        ptr = ffi.new('SDL_Event *')
+        ptr.type = lib.SDL_WINDOWEVENT
+        ptr.window.event = 15
+        lib.SDL_PushEvent(ptr)
+        ptr.window.event = WindowEventType.resized
+        lib.SDL_PushEvent(ptr)
+
+        events = get(2, EventType.windowevent, EventType.windowevent, materialize=True)
+        self.assertEqual([event.event for event in events], [15, WindowEventType.resized])
+
+        dispatcher = Dispatcher()
+        calls = []
+        dispatcher.register(EventType.windowevent, lambda event: calls.append(event), WindowEventType.resized)
+        for event in events:
+            dispatcher.dispatch(event)
+        self.assertEqual(calls, [events[1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
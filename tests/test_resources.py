@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from sdl2hl.pixels import PixelFormat
+from sdl2hl.resources import ResourceManager
+from sdl2hl.surface import Surface
+
+
+class TestResourceManager(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.paths = []
+        for i in range(4):
+            path = os.path.join(self.directory, '%d.bmp' % i)
+            Surface(16, 16, 32, PixelFormat.argb8888).save_bmp(path)
+            self.paths.append(path)
+        # Every surface is 16 rows of 64 bytes.
+        self.size = 16 * 64
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_shared(self):
+        manager = ResourceManager()
+        a = manager.acquire_bmp(self.paths[0])
+        self.assertIs(manager.acquire_bmp(self.paths[0]), a)
+        self.assertEqual((manager.hits, manager.misses), (1, 1))
+        self.assertEqual(manager.bytes, self.size)
+        self.assertEqual(manager.bytes_by_kind, {'surface': self.size})
+
+    def test_referenced_assets_not_evicted(self):
+        manager = ResourceManager(budget=self.size)
+        surfaces = [manager.acquire_bmp(path) for path in self.paths]
+        self.assertEqual(len(manager), 4)
+        self.assertEqual(manager.evictions, 0)
+        self.assertEqual(manager.bytes, 4 * self.size)
+        for surface in surfaces:
+            manager.release(surface)
+        self.assertEqual(len(manager), 1)
+        self.assertEqual(manager.evictions, 3)
+
+    def test_least_recently_released_evicted_first(self):
+        manager = ResourceManager(budget=4 * self.size)
+        surfaces = [manager.acquire_bmp(path) for path in self.paths]
+        for i in (2, 0, 3, 1):
+            manager.release(surfaces[i])
+
+        # Path 2 was released first, so it is dropped first.
+        manager.budget = 3 * self.size
+        self.assertEqual(manager.evictions, 1)
+        self.assertIs(manager.acquire_bmp(self.paths[0]), surfaces[0])
+        self.assertEqual(manager.misses, 4)
+        manager.release(surfaces[0])
+
+        # Reloading path 2 drops path 3, which is now the least recently released.
+        manager.acquire_bmp(self.paths[2])
+        self.assertEqual(manager.misses, 5)
+        self.assertIs(manager.acquire_bmp(self.paths[1]), surfaces[1])
+        self.assertIs(manager.acquire_bmp(self.paths[0]), surfaces[0])
+        self.assertEqual(manager.misses, 5)
+        manager.acquire_bmp(self.paths[3])
+        self.assertEqual(manager.misses, 6)
+
+    def test_reacquire_protects_from_eviction(self):
+        manager = ResourceManager(budget=2 * self.size)
+        a = manager.acquire_bmp(self.paths[0])
+        b = manager.acquire_bmp(self.paths[1])
+        manager.release(a)
+        manager.release(b)
+        self.assertIs(manager.acquire_bmp(self.paths[0]), a)
+        manager.acquire_bmp(self.paths[2])
+        # b was the only unreferenced asset, so it was dropped to make room.
+        self.assertEqual(len(manager), 2)
+        self.assertEqual(manager.evictions, 1)
+        self.assertIs(manager.acquire_bmp(self.paths[0]), a)
+
+    def test_release_errors(self):
+        manager = ResourceManager()
+        a = manager.acquire_bmp(self.paths[0])
+        manager.release(a)
+        self.assertRaises(ValueError, manager.release, a)
+        self.assertRaises(ValueError, manager.release, Surface(1, 1, 32, PixelFormat.argb8888))
+
+    def test_clear(self):
+        manager = ResourceManager()
+        a = manager.acquire_bmp(self.paths[0])
+        b = manager.acquire_bmp(self.paths[1])
+        manager.release(b)
+        manager.clear()
+        self.assertEqual(len(manager), 1)
+        self.assertEqual(manager.bytes, self.size)
+        self.assertIs(manager.acquire_bmp(self.paths[0]), a)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import random
+import unittest
+
+from sdl2hl.rect import Rect, RectArray
+from sdl2hl.spatial import AABBTree, SpatialHash
+
+
+def _random_bounds(rng, count):
+    # Include negative coordinates and empty rectangles, which never intersect anything.
+    return [(rng.randint(-100, 100), rng.randint(-100, 100), rng.randint(-2, 40), rng.randint(-2, 40))
+            for _ in range(count)]
+
+
+def _brute_pairs(bounds):
+    pairs = set()
+    for i in range(len(bounds)):
+        for j in range(i + 1, len(bounds)):
+            if Rect(*bounds[i]).has_intersection(Rect(*bounds[j])):
+                pairs.add(frozenset((i, j)))
+    return pairs
+
+
+def _brute_query(bounds, query):
+    return set(i for i, b in enumerate(bounds) if Rect(*b).has_intersection(Rect(*query)))
+
+
+class _SpatialIndexTests(object):
+
+    index_class = None
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+
+    def make(self, bounds):
+        index = self.index_class()
+        for key, b in enumerate(bounds):
+            index.insert(key, b)
+        return index
+
+    def assert_pairs(self, index, bounds):
+        pairs = index.pairs()
+        self.assertEqual(len(pairs), len(set(frozenset(pair) for pair in pairs)), 'a pair was reported twice')
+        self.assertEqual(set(frozenset(pair) for pair in pairs), _brute_pairs(bounds))
+
+    def test_pairs(self):
+        bounds = _random_bounds(self.rng, 200)
+        self.assert_pairs(self.make(bounds), bounds)
+
+    def test_query(self):
+        bounds = _random_bounds(self.rng, 200)
+        index = self.make(bounds)
+        for query in _random_bounds(self.rng, 50):
+            self.assertEqual(index.query(query), _brute_query(bounds, query))
+
+    def test_query_rect(self):
+        index = self.make([(0, 0, 10, 10), (20, 20, 10, 10)])
+        self.assertEqual(index.query(Rect(5, 5, 20, 20)), set([0, 1]))
+        self.assertEqual(index.query(Rect(10, 10, 10, 10)), set())
+
+    def test_query_point(self):
+        index = self.make([(0, 0, 10, 10), (5, 5, 10, 10)])
+        self.assertEqual(index.query_point(7, 7), set([0, 1]))
+        self.assertEqual(index.query_point(10, 10), set([1]))
+        self.assertEqual(index.query_point(-1, 0), set())
+
+    def test_move_and_remove(self):
+        bounds = _random_bounds(self.rng, 100)
+        index = self.make(bounds)
+        for key in range(0, 100, 3):
+            x, y, w, h = bounds[key]
+            bounds[key] = (x + self.rng.randint(-50, 50), y + self.rng.randint(-50, 50), w, h)
+            index.move(key, bounds[key])
+        self.assert_pairs(index, bounds)
+
+        for key in range(0, 100, 2):
+            index.remove(key)
+        self.assertEqual(len(index), 50)
+        self.assertNotIn(0, index)
+        remaining = dict((key, bounds[key]) for key in range(1, 100, 2))
+        for a, b in index.pairs():
+            self.assertTrue(Rect(*remaining[a]).has_intersection(Rect(*remaining[b])))
+        self.assertEqual(len(index.pairs()),
+                         len([pair for pair in _brute_pairs(bounds) if all(key % 2 for key in pair)]))
+
+    def test_duplicate_key(self):
+        index = self.make([(0, 0, 1, 1)])
+        self.assertRaises(KeyError, index.insert, 0, (0, 0, 1, 1))
+
+    def test_from_rect_array(self):
+        bounds = _random_bounds(self.rng, 50)
+        index = self.index_class.from_rect_array(RectArray(bounds))
+        self.assertEqual(len(index), 50)
+        self.assertEqual(index.bounds(7), bounds[7])
+        self.assert_pairs(index, bounds)
+
+
+class TestSpatialHash(_SpatialIndexTests, unittest.TestCase):
+
+    index_class = SpatialHash
+
+    def test_pair_spanning_cells_reported_once(self):
+        index = SpatialHash(cell_size=8)
+        index.insert('a', (0, 0, 40, 40))
+        index.insert('b', (4, 4, 40, 40))
+        self.assertEqual(len(index.pairs()), 1)
+
+
+class TestAABBTree(_SpatialIndexTests, unittest.TestCase):
+
+    index_class = AABBTree
+
+    def test_small_move_within_margin(self):
+        index = AABBTree(margin=4)
+        index.insert('a', (0, 0, 10, 10))
+        index.move('a', (2, 2, 10, 10))
+        self.assertEqual(index.bounds('a'), (2, 2, 10, 10))
+        self.assertEqual(index.query((11, 11, 1, 1)), set(['a']))
+        self.assertEqual(index.query((0, 0, 2, 2)), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
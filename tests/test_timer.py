@@ -0,0 +1,52 @@
+import unittest
+
+from sdl2hl.timer import Clock
+
+
+def _advance(clock, seconds):
+    # Pretend the last tick happened the given number of seconds ago.
+    clock._last -= int(seconds * clock._frequency)
+    return clock.tick()
+
+
+class TestClock(unittest.TestCase):
+
+    def test_first_tick(self):
+        clock = Clock(update_rate=60)
+        self.assertEqual(clock.tick(), 0.0)
+        self.assertEqual(list(clock.updates()), [])
+
+    def test_fixed_updates(self):
+        clock = Clock(update_rate=100)
+        clock.tick()
+        _advance(clock, 0.035)
+        self.assertEqual(list(clock.updates()), [0.01] * 3)
+        self.assertTrue(0.0 <= clock.alpha < 1.0)
+
+    def test_updates_capped(self):
+        clock = Clock(update_rate=60, max_updates=5)
+        clock.tick()
+        _advance(clock, 1.0)
+        self.assertEqual(len(list(clock.updates())), 5)
+        self.assertGreaterEqual(clock.stats().dropped_updates, 54)
+        self.assertTrue(0.0 <= clock.alpha < 1.0)
+
+        # The dropped time is not carried into the next frame.
+        _advance(clock, 0.0)
+        self.assertEqual(list(clock.updates()), [])
+
+    def test_stats(self):
+        clock = Clock(update_rate=60, window=3)
+        clock.tick()
+        for seconds in (0.01, 0.02, 0.03, 0.04):
+            _advance(clock, seconds)
+        stats = clock.stats()
+        self.assertEqual(stats.frames, 3)
+        self.assertGreaterEqual(stats.max, 0.04)
+        self.assertGreaterEqual(stats.mean, 0.03)
+        clock.reset_stats()
+        self.assertEqual(clock.stats().frames, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()